@@ -0,0 +1,63 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks of PyImgur's hot paths.
+
+Run with pytest-benchmark, see benchmarks/README.md.
+"""
+
+import json
+import tracemalloc
+
+from pyimgur.transport import RecordedResponse
+
+
+def record_rate(benchmark, name, amount):
+    """Store amount per second of the mean round as extra info on benchmark."""
+    if benchmark.stats is None:  # Benchmarks are disabled
+        return
+    benchmark.extra_info[name] = amount / benchmark.stats.stats.mean
+
+
+def record_peak_memory(benchmark, func):
+    """
+    Run func once and store its peak memory use as extra info.
+
+    Only allocations traced while func runs count. The peak RSS can't be
+    used, as it's the highest of the whole process, not of this call.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_traced_mb"] = peak / 2**20
+
+
+class StaticTransport:  # pylint: disable=too-few-public-methods
+    """A transport answering every request with the same json, in memory."""
+
+    def __init__(self, data, headers=None):
+        self.response = RecordedResponse(
+            "",
+            200,
+            headers or {"x-ratelimit-clientremaining": "12500"},
+            json.dumps({"data": data, "success": True, "status": 200}).encode(),
+        )
+
+    def request(self, method, url, **kwargs):  # pylint: disable=unused-argument
+        """Return the static response."""
+        return self.response
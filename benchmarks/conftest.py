@@ -0,0 +1,44 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pyimgur import Imgur
+from pyimgur.fake_server import FakeImgurServer
+
+pytest.importorskip("pytest_benchmark")
+
+PAGE_SIZE = 60
+TOTAL_ITEMS = 600
+IMAGE_BYTES = 5 * 2**20
+
+
+@pytest.fixture(name="server", scope="session")
+def fixture_server():
+    with FakeImgurServer(
+        page_size=PAGE_SIZE,
+        total_items=TOTAL_ITEMS,
+        image_bytes=IMAGE_BYTES,
+        ratelimit=10**9,
+    ) as server:
+        yield server
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur(server):
+    im = Imgur("benchmark_client_id")
+    im.base_url = server.base_url
+    im.download_url = server.base_url + "/download/{}/undefined"
+    return im
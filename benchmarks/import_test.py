@@ -0,0 +1,52 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks of how long import pyimgur takes in a fresh interpreter."""
+
+import re
+import subprocess
+import sys
+
+
+def run_python(code, *options):
+    """Run code in a new interpreter and return what it wrote to stderr."""
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+
+def import_time_ms(module):
+    """Return the cumulative import time of module, as reported by Python."""
+    report = run_python(f"import {module}", "-X", "importtime")
+    match = re.search(rf"\|\s*(\d+) \| {re.escape(module)}$", report, re.MULTILINE)
+    return int(match.group(1)) / 1000
+
+
+def test_interpreter_startup(benchmark):
+    # The baseline the import benchmarks include
+    benchmark.pedantic(run_python, ("pass",), rounds=10, warmup_rounds=1)
+
+
+def test_import_pyimgur(benchmark):
+    benchmark.pedantic(run_python, ("import pyimgur",), rounds=10, warmup_rounds=1)
+    benchmark.extra_info["import_ms"] = import_time_ms("pyimgur")
+
+
+def test_import_pyimgur_and_objects(benchmark):
+    # What a program pays once it parses its first response
+    code = "import pyimgur; pyimgur.Gallery_item; import pyimgur.transport, requests"
+    benchmark.pedantic(run_python, (code,), rounds=10, warmup_rounds=1)
@@ -0,0 +1,36 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks of the time PyImgur itself adds to every request."""
+
+from pyimgur import Imgur
+from pyimgur.fake_server import make_image
+
+from . import StaticTransport, record_rate
+
+
+def test_request_overhead_in_memory(benchmark):
+    # No network at all, so this is purely PyImgur's own overhead.
+    im = Imgur(
+        "benchmark_client_id",
+        transport=StaticTransport(make_image("abc", "https://i.imgur.com")),
+    )
+    benchmark(im.get_image, "abc")
+    record_rate(benchmark, "requests_per_second", 1)
+
+
+def test_request_overhead_local_server(benchmark, imgur):
+    benchmark(imgur.get_image, "abc")
+    record_rate(benchmark, "requests_per_second", 1)
@@ -0,0 +1,33 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks of the pagination loop in Imgur.send_request."""
+
+from .conftest import PAGE_SIZE, TOTAL_ITEMS
+from . import record_rate
+
+
+def test_paginate_gallery(benchmark, imgur):
+    result = benchmark(imgur.get_gallery, limit=TOTAL_ITEMS)
+    # The last request returns an empty page, which ends the pagination
+    record_rate(benchmark, "pages_per_second", TOTAL_ITEMS // PAGE_SIZE + 1)
+    assert len(result) == TOTAL_ITEMS
+
+
+def test_paginate_user_images(benchmark, imgur):
+    user = imgur.get_user("benchmark")
+    result = benchmark(user.get_images, limit=TOTAL_ITEMS)
+    record_rate(benchmark, "pages_per_second", TOTAL_ITEMS // PAGE_SIZE + 1)
+    assert len(result) == TOTAL_ITEMS
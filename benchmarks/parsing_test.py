@@ -0,0 +1,64 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks of turning Imgur's json into PyImgur objects, and back."""
+
+from pyimgur import Gallery_item, Imgur
+from pyimgur.conversion import convert_general, get_content_to_send
+from pyimgur.fake_server import make_comment, make_gallery_item
+from pyimgur.objects import Comment
+from pyimgur.serialization import dumps, loads
+
+from . import record_rate
+
+LISTING_SIZE = 1000
+IMGUR = Imgur("benchmark_client_id")
+LISTING = [make_gallery_item(number, IMGUR.base_url) for number in range(LISTING_SIZE)]
+
+
+def test_parse_gallery_listing(benchmark):
+    benchmark(lambda: [Gallery_item.get_album_or_image(i, IMGUR) for i in LISTING])
+    record_rate(benchmark, "objects_per_second", LISTING_SIZE)
+
+
+def test_parse_comment_tree(benchmark):
+    # 1 + 4 + 16 + 64 + 256 = 341 comments
+    tree = make_comment(0, "abc", depth=4, breadth=4)
+    benchmark(Comment, tree, IMGUR)
+    record_rate(benchmark, "objects_per_second", 341)
+
+
+def test_convert_general_id_list(benchmark):
+    ids = [item["id"] for item in LISTING]
+    benchmark(convert_general, ids)
+    record_rate(benchmark, "values_per_second", len(ids))
+
+
+def test_get_content_to_send(benchmark):
+    params = {"title": "Title", "description": "Text", "ids": LISTING[0]["id"]}
+    benchmark(get_content_to_send, params, "POST", True)
+
+
+def test_dumps_gallery_listing(benchmark):
+    items = [Gallery_item.get_album_or_image(i, IMGUR) for i in LISTING]
+    data = benchmark(dumps, items, False)
+    record_rate(benchmark, "objects_per_second", LISTING_SIZE)
+    benchmark.extra_info["bytes_per_object"] = len(data) / LISTING_SIZE
+
+
+def test_loads_gallery_listing(benchmark):
+    items = [Gallery_item.get_album_or_image(i, IMGUR) for i in LISTING]
+    benchmark(loads, dumps(items, False), IMGUR)
+    record_rate(benchmark, "objects_per_second", LISTING_SIZE)
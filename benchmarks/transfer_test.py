@@ -0,0 +1,59 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks of uploading and downloading image data."""
+
+import pytest
+
+from pyimgur.bulk import download_images
+
+from .conftest import IMAGE_BYTES
+from . import record_peak_memory, record_rate
+
+
+@pytest.fixture(name="image_file")
+def fixture_image_file(tmp_path):
+    path = tmp_path / "upload.jpg"
+    path.write_bytes(bytes(i % 251 for i in range(IMAGE_BYTES)))
+    return path
+
+
+def test_upload(benchmark, imgur, image_file):
+    benchmark(imgur.upload_image, path=image_file)
+    record_rate(benchmark, "mb_per_second", IMAGE_BYTES / 2**20)
+    record_peak_memory(benchmark, lambda: imgur.upload_image(path=image_file))
+
+
+def test_download(benchmark, imgur, tmp_path):
+    image = imgur.get_image("abcdefg")
+    benchmark(image.download, path=tmp_path, overwrite=True)
+    record_rate(benchmark, "mb_per_second", IMAGE_BYTES / 2**20)
+    record_peak_memory(benchmark, lambda: image.download(path=tmp_path, overwrite=True))
+
+
+@pytest.mark.parametrize("size", [None, "small_square"])
+def test_bulk_download(benchmark, imgur, server, tmp_path, size):
+    images = imgur.get_album("abcdefg").images
+    sent_before = server.bytes_sent
+    results = benchmark.pedantic(
+        download_images,
+        args=(images,),
+        kwargs={"path": tmp_path, "size": size, "overwrite": True},
+        rounds=3,
+    )
+    benchmark.extra_info["mb_transferred_per_round"] = (
+        (server.bytes_sent - sent_before) / 3 / 2**20
+    )
+    assert all(result.ok for result in results)
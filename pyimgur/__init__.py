@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
 
+# pylint: disable=too-many-lines,import-outside-toplevel
+
 """
 PyImgur - The Simple Way of Using Imgur
 
@@ -30,28 +32,29 @@ For more information on usage visit https://github.com/Damgaard/PyImgur
 """
 
 
-import re
-from urllib.parse import urlparse
+import time
 
-from pyimgur import request
-from pyimgur.conversion import clean_imgur_params, get_content_to_send
+from pyimgur.bulk import (
+    DEFAULT_RESOLVE_WORKERS,
+    DEFAULT_UPLOAD_RETRIES,
+    DEFAULT_UPLOAD_WORKERS,
+)
 from pyimgur.exceptions import (
     AuthenticationError,
     InvalidParameterError,
+    RateLimitError,
     ResourceNotFoundError,
     UnexpectedImgurException,
 )
-from pyimgur.image import Image
-from pyimgur.objects import (
-    Album,
-    Notification,
-    Comment,
-    Message,
-    Gallery_item,
-    Gallery_album,
-    Gallery_image,
-    User,
+from pyimgur.hooks import (
+    Hooks,
+    ON_CACHE_HIT,
+    ON_PAGE,
+    ON_RATELIMIT_UPDATE,
+    ON_TOKEN_REFRESH,
 )
+from pyimgur.streaming import DEFAULT_PROGRESS_INTERVAL, MultipartStream
+from pyimgur.tracing import traced
 
 __version__ = "0.8.1"
 
@@ -61,8 +64,99 @@ IMGUR_BASE = "https://api.imgur.com"
 AUTHORIZE_URL = "{}/oauth2/authorize?client_id={}&response_type={}&state={}"
 EXCHANGE_URL = "{}/oauth2/token"
 REFRESH_URL = "{}/oauth2/token"
-
-
+DOWNLOAD_URL = "https://imgur.com/download/{}/undefined"
+
+# Key of the object type of an id in Imgur.object_type_cache
+OBJECT_TYPE_KEY = "type:{}:{}"
+
+DEFAULT_LARGE_UPLOAD_RETRIES = 3
+LARGE_UPLOAD_BACKOFF_SECONDS = 2
+
+# The object classes, and the modules they're in. They're imported when first
+# used, so import pyimgur stays fast, see __getattr__.
+LAZY_ATTRIBUTES = {
+    "Image": "pyimgur.image",
+    "Album": "pyimgur.objects",
+    "Comment": "pyimgur.objects",
+    "Gallery_album": "pyimgur.objects",
+    "Gallery_image": "pyimgur.objects",
+    "Gallery_item": "pyimgur.objects",
+    "Message": "pyimgur.objects",
+    "Notification": "pyimgur.objects",
+    "User": "pyimgur.objects",
+}
+
+# Makes the lazy classes visible to linters and type checkers. typing isn't
+# imported for its TYPE_CHECKING, as it's slower to import than PyImgur.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pyimgur.image import Image
+    from pyimgur.objects import (
+        Album,
+        Comment,
+        Gallery_album,
+        Gallery_image,
+        Gallery_item,
+        Message,
+        Notification,
+        User,
+    )
+
+__all__ = [
+    "Album",
+    "AuthenticationError",
+    "Comment",
+    "Gallery_album",
+    "Gallery_image",
+    "Gallery_item",
+    "Image",
+    "Imgur",
+    "InvalidParameterError",
+    "Message",
+    "Notification",
+    "RateLimitError",
+    "ResourceNotFoundError",
+    "UnexpectedImgurException",
+    "User",
+]
+
+
+def __getattr__(name):
+    """Import the object classes on first use, such as pyimgur.Image."""
+    import importlib
+
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
+
+
+def _search_params(
+    q, q_all, q_any, q_exactly, q_not, q_type, q_size_px
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Return the params of a gallery search, checking that one is set."""
+    if all(x is None for x in [q, q_all, q_any, q_exactly, q_not, q_type, q_size_px]):
+        raise InvalidParameterError(
+            "At least one of q, q_all, q_any, q_exactly, q_not, q_type,"
+            "q_size_px must be provided"
+        )
+    return {
+        "q": q,
+        "q_all": q_all,
+        "q_any": q_any,
+        "q_exactly": q_exactly,
+        "q_not": q_not,
+        "q_type": q_type,
+        "q_size_px": q_size_px,
+    }
+
+
+@traced(exclude=("authorization_url", "is_imgur_url", "send_request"))
 class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     The base class containing general functionality for Imgur.
@@ -83,6 +177,12 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         # breaking changes.
         mashape_key=None,
         rapidapi_key=None,
+        credentials=None,
+        transport=None,
+        upload_index=None,
+        bandwidth_limiter=None,
+        object_type_cache=None,
+        metadata_store=None,
     ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
         Initialize the Imgur object.
@@ -102,7 +202,34 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
             access_tokens expire after 1 hour, we need a way to request new
             ones without going through the entire authorization step again. It
             does not expire.
+        :param rapidapi_key: Your RapidAPI key. If set, requests will be sent
+            through RapidAPI instead of directly to Imgur.
+        :param credentials: Additional application credentials to spread
+            requests over. Each can be either a client_id or a tuple of
+            (client_id, rapidapi_key). When set, GET requests that aren't
+            authenticated as a user are sent with the credential that has the
+            most requests left, and fail over to the next credential once one
+            is used up.
+        :param transport: The transport used to perform HTTP requests. See
+            pyimgur.transport. Defaults to a shared transport using requests.
+        :param upload_index: A pyimgur.upload_index.UploadIndex. When set,
+            upload_image returns the already uploaded image instead of
+            uploading the same content again.
+        :param bandwidth_limiter: A pyimgur.bandwidth.BandwidthLimiter capping
+            the bandwidth of uploads and downloads made with this object. It
+            can be shared with other Imgur objects, to cap them together.
+        :param object_type_cache: A store from pyimgur.stores, where
+            get_at_url remembers which type of object the ids in ambiguous
+            urls belong to. Defaults to a store in memory. Use a persistent store to
+            remember them between runs.
+        :param metadata_store: A pyimgur.metadata.MetadataStore. When set, the
+            JSON of every image, album, gallery item, comment and user parsed
+            is saved in it, to be queried offline. Objects are written in one
+            transaction per response.
         """
+        from pyimgur.sharding import CredentialPool
+        from pyimgur.stores import MemoryStore
+
         self.is_authenticated = False
         self.access_token = access_token
         self.client_id = client_id
@@ -113,10 +240,27 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         self.ratelimit_userlimit = None
         self.ratelimit_userremaining = None
         self.ratelimit_userreset = None
+        self.duplicates_dropped = 0
         self.refresh_token = refresh_token
         self.mashape_key = mashape_key
         self.rapidapi_key = rapidapi_key
         self.base_url = RAPIDAPI_BASE if self.rapidapi_key else IMGUR_BASE
+        self.download_url = DOWNLOAD_URL
+        self.hooks = Hooks()
+        self.tracer = None
+        self.transport = transport
+        self.upload_index = upload_index
+        self.bandwidth_limiter = bandwidth_limiter
+        self.object_type_cache = (
+            MemoryStore() if object_type_cache is None else object_type_cache
+        )
+        self.metadata_store = metadata_store
+        self.credential_pool = None
+        if credentials:
+            self.credential_pool = CredentialPool(
+                _make_credential(cred)
+                for cred in [(client_id, rapidapi_key)] + list(credentials)
+            )
 
     def authorization_url(self, response, state=""):
         """
@@ -174,6 +318,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
         :returns: The newly created album.
         """
+        from pyimgur.objects import Album
+
         url = self.base_url + "/3/album/"
         payload = {
             "ids": images,
@@ -223,6 +369,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
     def get_album(self, album_id):
         """Return information about this album."""
+        from pyimgur.objects import Album
+
         url = self.base_url + f"/3/album/{album_id}"
         json = self.send_request(url)
         return Album(json, self)
@@ -246,74 +394,166 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
         :param url: The url where the content is located at
         """
+        from pyimgur.router import route
 
-        def get_gallery_item(gallery_item_id):
-            """
-            Special helper method to get gallery items.
-
-            The problem is that it's impossible to distinguish albums and
-            images from each other based on the url. And there isn't a common
-            url endpoints that return either a Gallery_album or a Gallery_image
-            depending on what the id represents. So the only option is to
-            assume it's a Gallery_image and if we get an exception then try
-            Gallery_album. Gallery_image is attempted first because there is
-            the most of them.
-            """
-            try:
-                return self.get_gallery_image(gallery_item_id)
-            except ResourceNotFoundError:
-                return self.get_gallery_album(gallery_item_id)
-
-        if not self.is_imgur_url(url):
+        routed = route(url)
+        if routed is None:
             return None
+        kind, obj_id = routed
+        getters = {
+            "album": self.get_album,
+            "comment": self.get_comment,
+            "user": self.get_user,
+        }
+        if kind in getters:
+            return getters[kind](obj_id)
+
+        # Gallery and image urls can point to several types of object. The
+        # type found is remembered, so the wrong guesses are only made once.
+        cache_key = OBJECT_TYPE_KEY.format(kind, obj_id)
+        object_type = self.object_type_cache.get(cache_key)
+        if object_type is not None:
+            self.hooks.emit(ON_CACHE_HIT, {"cache": "object_type", "key": cache_key})
+            return self._get_typed_object(object_type, obj_id)
+
+        if kind == "gallery":
+            obj, object_type = self._get_gallery_item(obj_id)
+        else:
+            obj, object_type = self._get_image_or_gallery_image(obj_id)
+        self.object_type_cache.set(cache_key, object_type)
+        return obj
 
-        objects = {
-            "album": {"regex": r"a/(?P<id>[\w.]*?)$", "method": self.get_album},
-            "comment": {
-                "regex": r"gallery/\w*/comment/(?P<id>[\w.]*?)$",
-                "method": self.get_comment,
-            },
-            "gallery": {
-                "regex": r"(gallery|r/\w*?)/(?P<id>[\w.]*?)$",
-                "method": get_gallery_item,
-            },
-            # Valid image extensions: http://imgur.com/faq#types
-            # All are between 3 and 4 chars long.
-            "image": {
-                "regex": r"(?P<id>[\w.]*?)(\\.\w{3,4})?$",
-                "method": self.get_image,
-            },
-            "user": {"regex": r"user/(?P<id>[\w.]*?)$", "method": self.get_user},
+    def _get_gallery_item(self, gallery_item_id):
+        """
+        Return the gallery item with gallery_item_id and its object type.
+
+        The problem is that it's impossible to distinguish albums and images
+        from each other based on the url. And there isn't a common url
+        endpoints that return either a Gallery_album or a Gallery_image
+        depending on what the id represents. So the only option is to assume
+        it's a Gallery_image and if we get an exception then try
+        Gallery_album. Gallery_image is attempted first because there is the
+        most of them.
+        """
+        try:
+            return self.get_gallery_image(gallery_item_id), {"type": "gallery_image"}
+        except ResourceNotFoundError:
+            return self.get_gallery_album(gallery_item_id), {"type": "gallery_album"}
+
+    def _get_image_or_gallery_image(self, image_id):
+        """Return the image or gallery image with image_id and its object type."""
+        # We cannot diffrentiate image from GalleryImage based on the url,
+        # so first we assume it's an image. Then we try to fetch it as a
+        # gallery image / subreddit image. If that fails, then we know it's
+        # an image.
+        image = self.get_image(image_id)
+        try:
+            if getattr(image, "section", None):
+                object_type = {"type": "subreddit_image", "section": image.section}
+                return self.get_subreddit_image(image.section, image_id), object_type
+            return self.get_gallery_image(image_id), {"type": "gallery_image"}
+        except ResourceNotFoundError:
+            return image, {"type": "image"}
+
+    def _get_typed_object(self, object_type, obj_id):
+        """Return the object with obj_id, of an object type found earlier."""
+        if object_type["type"] == "subreddit_image":
+            return self.get_subreddit_image(object_type["section"], obj_id)
+        getters = {
+            "gallery_album": self.get_gallery_album,
+            "gallery_image": self.get_gallery_image,
+            "image": self.get_image,
         }
-        parsed_url = urlparse(url)
-        for obj_type, values in objects.items():
-            regex_result = re.match("/" + values["regex"], parsed_url.path)
-            if regex_result is not None:
-                obj_id = regex_result.group("id")
-                initial_object = values["method"](obj_id)
-
-                # We cannot diffrentiate image from GalleryImage based on the url,
-                # so first we assume it's an image. Then we try to fetch it as a
-                # gallery image / subreddit image. If that fails, then we know it's
-                # an image.
-                if obj_type == "image":
-                    try:
-                        if getattr(initial_object, "section", None):
-                            sub = initial_object.section
-                            return self.get_subreddit_image(sub, obj_id)
-                        return self.get_gallery_image(obj_id)
-                    except ResourceNotFoundError:
-                        pass
-                return initial_object
+        return getters[object_type["type"]](obj_id)
+
+    def crawl_gallery(
+        self,
+        checkpoint,
+        section="hot",
+        sort="viral",
+        window="day",
+        show_viral=True,
+        limit=None,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Return a resumable crawl of the gallery.
+
+        Like get_gallery, but iterating the returned CheckpointedCrawl saves
+        its progress to checkpoint after each page. Calling this again with
+        the same arguments resumes the crawl. See get_gallery for the other
+        arguments.
+
+        :param checkpoint: The path of the checkpoint file.
+        """
+        from pyimgur.checkpoint import CheckpointedCrawl
+
+        url = self._gallery_url(section, sort, window, show_viral)
+        return CheckpointedCrawl(self, checkpoint, url, limit=limit)
+
+    def crawl_search_gallery(
+        self,
+        checkpoint,
+        q=None,
+        q_all=None,
+        q_any=None,
+        q_exactly=None,
+        q_not=None,
+        q_type=None,
+        q_size_px=None,
+        sort="time",
+        window="all",
+        limit=None,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Return a resumable crawl of a gallery search.
+
+        Like search_gallery, but iterating the returned CheckpointedCrawl
+        saves its progress to checkpoint after each page. Calling this again
+        with the same arguments resumes the crawl. See search_gallery for the
+        other arguments.
+
+        :param checkpoint: The path of the checkpoint file.
+        """
+        from pyimgur.checkpoint import CheckpointedCrawl
+
+        url = self.base_url + f"/3/gallery/search/{sort}/{window}/{{}}"
+        payload = _search_params(q, q_all, q_any, q_exactly, q_not, q_type, q_size_px)
+        return CheckpointedCrawl(self, checkpoint, url, params=payload, limit=limit)
+
+    def crawl_subreddit_gallery(
+        self, checkpoint, subreddit, sort="time", window="top", limit=None
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Return a resumable crawl of a subreddit gallery.
+
+        Like get_subreddit_gallery, but iterating the returned
+        CheckpointedCrawl saves its progress to checkpoint after each page.
+        Calling this again with the same arguments resumes the crawl. See
+        get_subreddit_gallery for the other arguments.
+
+        :param checkpoint: The path of the checkpoint file.
+        """
+        from pyimgur.checkpoint import CheckpointedCrawl
+
+        url = self._subreddit_gallery_url(subreddit, sort, window)
+        return CheckpointedCrawl(self, checkpoint, url, limit=limit)
 
     def get_comment(self, comment_id):
         """Return information about this comment."""
+        from pyimgur.objects import Comment
+
         url = self.base_url + f"/3/comment/{comment_id}"
         json = self.send_request(url)
         return Comment(json, self)
 
     def get_gallery(
-        self, section="hot", sort="viral", window="day", show_viral=True, limit=None
+        self,
+        section="hot",
+        sort="viral",
+        window="day",
+        show_viral=True,
+        limit=None,
+        dedupe=False,
     ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
         Return a list of gallery albums and gallery images.
@@ -325,12 +565,14 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         :param show_viral: true | false - Show or hide viral images from the
             'user' section. Defaults to true.
         :param limit: The number of items to return.
+        :param dedupe: Drop items repeated across pages, as the listing shifts
+            while it's paginated. True, or a seen-set from pyimgur.dedupe. The
+            number dropped is stored in duplicates_dropped.
         """
-        url = (
-            self.base_url
-            + f"/3/gallery/{section}/{sort}/{window}/{{}}?showViral={show_viral}"
-        )
-        resp = self.send_request(url, limit=limit)
+        from pyimgur.objects import Gallery_item
+
+        url = self._gallery_url(section, sort, window, show_viral)
+        resp = self.send_request(url, limit=limit, dedupe=dedupe)
         return [Gallery_item.get_album_or_image(thing, self) for thing in resp]
 
     def get_gallery_album(self, gallery_album_id):
@@ -341,6 +583,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         This makes it possible to remove an album from the gallery and setting
         it's privacy setting as secret, without compromising it's secrecy.
         """
+        from pyimgur.objects import Gallery_album
+
         url = self.base_url + f"/3/gallery/album/{gallery_album_id}"
         resp = self.send_request(url)
         return Gallery_album(resp, self)
@@ -353,12 +597,16 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         This makes it possible to remove an image from the gallery and setting
         it's privacy setting as secret, without compromising it's secrecy.
         """
+        from pyimgur.objects import Gallery_image
+
         url = self.base_url + f"/3/gallery/image/{gallery_item_id}"
         resp = self.send_request(url)
         return Gallery_image(resp, self)
 
     def get_image(self, image_id):
         """Return a Image object representing the image with the given id."""
+        from pyimgur.image import Image
+
         url = self.base_url + f"/3/image/{image_id}"
         resp = self.send_request(url)
         return Image(resp, self)
@@ -369,6 +617,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
         :param id: The id of the message object to return.
         """
+        from pyimgur.objects import Message
+
         url = self.base_url + f"/3/message/{message_id}"
         resp = self.send_request(url)
         return Message(resp, self)
@@ -384,6 +634,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
             "top", day | week | month | year | all, defaults to week.
         :param limit: The number of items to return.
         """
+        from pyimgur.objects import Gallery_item
+
         url = self.base_url + f"/3/gallery/g/memes/{sort}/{window}/{'{}'}"
         resp = self.send_request(url, limit=limit)
         return [Gallery_item.get_album_or_image(thing, self) for thing in resp]
@@ -394,11 +646,15 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
         :param id: The id of the notification object to return.
         """
+        from pyimgur.objects import Notification
+
         url = self.base_url + f"/3/notification/{notification_id}"
         resp = self.send_request(url)
         return Notification(resp, self)
 
-    def get_subreddit_gallery(self, subreddit, sort="time", window="top", limit=None):
+    def get_subreddit_gallery(
+        self, subreddit, sort="time", window="top", limit=None, dedupe=False
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
         Return a list of gallery albums/images submitted to a subreddit.
 
@@ -410,11 +666,14 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         :param window: Change the date range of the request if the section is
             "top", day | week | month | year | all, defaults to day.
         :param limit: The number of items to return.
+        :param dedupe: Drop items repeated across pages, as the listing shifts
+            while it's paginated. True, or a seen-set from pyimgur.dedupe. The
+            number dropped is stored in duplicates_dropped.
         """
-        if sort not in ["time", "top"]:
-            raise InvalidParameterError("sort parameter must be either 'time' or 'top'")
-        url = f"{self.base_url}/3/gallery/r/{subreddit}/{sort}/{window}/{'{}'}"
-        resp = self.send_request(url, limit=limit)
+        from pyimgur.objects import Gallery_item
+
+        url = self._subreddit_gallery_url(subreddit, sort, window)
+        resp = self.send_request(url, limit=limit, dedupe=dedupe)
         return [Gallery_item.get_album_or_image(thing, self) for thing in resp]
 
     def get_subreddit_image(self, subreddit, image_id):
@@ -424,6 +683,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         :param subreddit: The subreddit the image has been submitted to.
         :param image_id: The id of the image we want.
         """
+        from pyimgur.objects import Gallery_image
+
         url = self.base_url + f"/3/gallery/r/{subreddit}/{image_id}"
         resp = self.send_request(url)
         return Gallery_image(resp, self)
@@ -434,13 +695,17 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
         :param username: The name of the user we want more information about.
         """
+        from pyimgur.objects import User
+
         url = self.base_url + f"/3/account/{username}"
         json = self.send_request(url)
         return User(json, self)
 
     def is_imgur_url(self, url):
         """Is the given url a valid Imgur url?"""
-        return re.match(r"(http://)?(www\.)?imgur\.com", url, re.I) is not None
+        from pyimgur.router import is_imgur_url
+
+        return is_imgur_url(url)
 
     def refresh_access_token(self):
         """
@@ -463,6 +728,7 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
             "grant_type": "refresh_token",
             "refresh_token": self.refresh_token,
         }
+        start = time.perf_counter()
         result = self.send_request(
             REFRESH_URL.format(self.base_url),
             params=params,
@@ -470,8 +736,47 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
             force_client_auth=True,
         )
         self.access_token = result["access_token"]
+        self.hooks.emit(ON_TOKEN_REFRESH, {"elapsed": time.perf_counter() - start})
         return self.access_token
 
+    def remaining_requests(self):
+        """
+        Return how many requests can be made before being ratelimited.
+
+        This is the lowest of the client and user budgets Imgur reported in
+        the latest response. None if no ratelimit info has been received yet.
+        When anonymous requests are spread over a credential pool, it's the
+        budget left across the pool instead, see CredentialPool.remaining.
+        """
+        if self.credential_pool is not None and self.access_token is None:
+            return self.credential_pool.remaining()
+        known = [
+            remaining
+            for remaining in (
+                self.ratelimit_clientremaining,
+                self.ratelimit_userremaining,
+            )
+            if remaining is not None
+        ]
+        return min(known) if known else None
+
+    def resolve_urls(self, urls, max_workers=DEFAULT_RESOLVE_WORKERS):
+        """
+        Return the objects at several urls, resolved concurrently.
+
+        Each distinct url is only resolved once. See get_at_url.
+
+        :param urls: The urls to resolve.
+        :param max_workers: The number of urls resolved at the same time.
+
+        :returns: A pyimgur.bulk.TransferResult per url, in the same order as
+            urls, with the object at the url as value. The value is None if
+            the url isn't an Imgur url of a known format.
+        """
+        from pyimgur import bulk
+
+        return bulk.resolve_urls(self, urls, max_workers=max_workers)
+
     def search_gallery(
         self,
         q=None,
@@ -484,7 +789,8 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         sort="time",
         window="all",
         limit=None,
-    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        dedupe=False,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
         """Search the gallery.
 
         :param q: Query string (note: if advanced search parameters are set,
@@ -504,32 +810,21 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         :param sort: time | viral | top - defaults to time
         :param window: all | day | week | month | year - defaults to all
         :param limit: The number of items to return.
+        :param dedupe: Drop items repeated across pages, as the listing shifts
+            while it's paginated. True, or a seen-set from pyimgur.dedupe. The
+            number dropped is stored in duplicates_dropped.
 
         """
-        if all(
-            x is None for x in [q, q_all, q_any, q_exactly, q_not, q_type, q_size_px]
-        ):
-            raise InvalidParameterError(
-                "At least one of q, q_all, q_any, q_exactly, q_not, q_type,"
-                "q_size_px must be provided"
-            )
+        from pyimgur.objects import Gallery_item
 
         url = self.base_url + f"/3/gallery/search/{sort}/{window}/{{}}"
-        payload = {
-            "q": q,
-            "q_all": q_all,
-            "q_any": q_any,
-            "q_exactly": q_exactly,
-            "q_not": q_not,
-            "q_type": q_type,
-            "q_size_px": q_size_px,
-        }
-        resp = self.send_request(url, params=payload, limit=limit)
+        payload = _search_params(q, q_all, q_any, q_exactly, q_not, q_type, q_size_px)
+        resp = self.send_request(url, params=payload, limit=limit, dedupe=dedupe)
         return [Gallery_item.get_album_or_image(thing, self) for thing in resp]
 
     def send_request(
         self, url, needs_auth=False, force_client_auth=False, **kwargs
-    ):  # pylint: disable=too-many-branches,too-many-locals
+    ):  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
         """
         Handles top level functionality for sending requests to Imgur.
 
@@ -543,7 +838,19 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
 
         :param needs_auth: Is authentication as a user needed for the execution
             of this method?
+        :param dedupe: For paginated requests, drop items whose id was already
+            received. True for an exact seen-set, or a seen-set from
+            pyimgur.dedupe such as a BloomFilter. The number of items dropped
+            is stored in duplicates_dropped.
         """
+        from pyimgur import request
+        from pyimgur.conversion import clean_imgur_params, get_content_to_send
+        from pyimgur.dedupe import make_seen_set
+
+        if self.metadata_store is not None:
+            # Write the objects parsed from the previous response at once
+            self.metadata_store.flush()
+
         if (
             self.refresh_token
             and not self.access_token
@@ -552,25 +859,13 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         ):
             self.refresh_access_token()
 
-        if self.access_token is None and needs_auth:
-            raise AuthenticationError(
-                "Authentication as a user is required to use this method."
-            )
-
-        if self.access_token is None or force_client_auth:
-            # Use non-authed request.
-            authentication = {"Authorization": f"Client-ID {self.client_id}"}
-        else:
-            authentication = {"Authorization": f"Bearer {self.access_token}"}
-
-        if self.mashape_key:
-            authentication.update({"X-Mashape-Key": self.mashape_key})
-        if self.rapidapi_key:
-            authentication.update({"X-Mashape-Key": self.rapidapi_key})
+        authentication = self._authentication(needs_auth, force_client_auth)
 
         content = []
         is_paginated = False
         base_url = url
+        seen = make_seen_set(kwargs.pop("dedupe", False))
+        duplicates = 0
 
         if "limit" in kwargs:
             is_paginated = True
@@ -586,14 +881,27 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         kwargs["params"] = clean_imgur_params(kwargs.get("params", {}))
         content_to_send = get_content_to_send(**kwargs)
 
+        use_credential_pool = (
+            self.credential_pool is not None
+            and kwargs.get("method", "GET") == "GET"
+            and (self.access_token is None or force_client_auth)
+        )
+
         while True:
             try:
-                new_content, ratelimit_info = request.send_request(
-                    url,
-                    method=kwargs.get("method", "GET"),
-                    content_to_send=content_to_send,
-                    headers=authentication,
-                )
+                if use_credential_pool:
+                    new_content, ratelimit_info = self._send_pooled_request(
+                        url, content_to_send
+                    )
+                else:
+                    new_content, ratelimit_info = request.send_request(
+                        url,
+                        method=kwargs.get("method", "GET"),
+                        content_to_send=content_to_send,
+                        headers=authentication,
+                        transport=self.transport,
+                        hooks=self.hooks,
+                    )
 
             except UnexpectedImgurException as e:
                 # If Imgur raises an exception due to the access token being
@@ -619,15 +927,30 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
                     method=kwargs.get("method", "GET"),
                     content_to_send=content_to_send,
                     headers=authentication,
+                    transport=self.transport,
+                    hooks=self.hooks,
                 )
 
+            # An empty page marks the end, even if duplicates are dropped below
+            received = new_content
+            page_duplicates = 0
+            if is_paginated and seen is not None:
+                new_content = [item for item in received if seen.add(item["id"])]
+                page_duplicates = len(received) - len(new_content)
+                duplicates += page_duplicates
+
             # Move this logic into the request sending or helper func
-            if (
-                is_paginated
-                and new_content
-                and limit > (len(new_content) + len(content))
-            ):
+            if is_paginated and received and limit > (len(new_content) + len(content)):
                 content += new_content
+                self.hooks.emit(
+                    ON_PAGE,
+                    {
+                        "url": url,
+                        "page": page,
+                        "items": len(new_content),
+                        "duplicates": page_duplicates,
+                    },
+                )
                 page += 1
                 url = base_url.format(page)
             else:
@@ -640,16 +963,271 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
         # Note: When the cache is implemented, it's important that the
         # ratelimit info doesn't get updated with the ratelimit info in the
         # cache since that's likely incorrect.
+        self._update_ratelimit(ratelimit_info)
+        if seen is not None:
+            self.duplicates_dropped = duplicates
+        return content
+
+    def _gallery_url(self, section, sort, window, show_viral):
+        """Return the url of a gallery listing, with {} where the page goes."""
+        return (
+            self.base_url
+            + f"/3/gallery/{section}/{sort}/{window}/{{}}?showViral={show_viral}"
+        )
+
+    def _subreddit_gallery_url(self, subreddit, sort, window):
+        """Return the url of a subreddit gallery, with {} where the page goes."""
+        if sort not in ["time", "top"]:
+            raise InvalidParameterError("sort parameter must be either 'time' or 'top'")
+        return f"{self.base_url}/3/gallery/r/{subreddit}/{sort}/{window}/{'{}'}"
+
+    def _authentication(self, needs_auth=False, force_client_auth=False):
+        """Return the authentication headers to send a request with."""
+        if self.access_token is None and needs_auth:
+            raise AuthenticationError(
+                "Authentication as a user is required to use this method."
+            )
+
+        if self.access_token is None or force_client_auth:
+            # Use non-authed request.
+            authentication = {"Authorization": f"Client-ID {self.client_id}"}
+        else:
+            authentication = {"Authorization": f"Bearer {self.access_token}"}
+
+        if self.mashape_key:
+            authentication.update({"X-Mashape-Key": self.mashape_key})
+        if self.rapidapi_key:
+            authentication.update({"X-Mashape-Key": self.rapidapi_key})
+        return authentication
+
+    def _update_ratelimit(self, ratelimit_info):
+        """Store the ratelimit info from a response."""
         for key, value in ratelimit_info.items():
             setattr(self, key[2:].replace("-", "_"), value)
+        if ratelimit_info:
+            self.hooks.emit(
+                ON_RATELIMIT_UPDATE,
+                {key[2:].replace("-", "_"): val for key, val in ratelimit_info.items()},
+            )
 
-        return content
+    def iter_gallery(
+        self,
+        section="hot",
+        sort="viral",
+        window="day",
+        show_viral=True,
+        limit=None,
+        dedupe=False,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Yield gallery albums and gallery images as they're received.
 
-    def upload_image(
-        self, path=None, url=None, title=None, description=None, album=None
+        Like get_gallery, but items are decoded and yielded one at a time
+        while each page is still arriving. See get_gallery for the arguments.
+        """
+        from pyimgur.objects import Gallery_item
+
+        url = self._gallery_url(section, sort, window, show_viral)
+        for thing in self.iter_request(url, limit=limit, dedupe=dedupe):
+            yield Gallery_item.get_album_or_image(thing, self)
+
+    def iter_request(
+        self, url, needs_auth=False, limit=None, dedupe=False
+    ):  # pylint: disable=too-many-locals
+        """
+        Yield the items of a paginated listing as they're received.
+
+        The streaming counterpart of send_request for listings. Items are
+        decoded one at a time while each page is still arriving, so they can
+        be processed and dropped without holding whole pages in memory.
+
+        :param url: The url of the listing, with {} where the page goes.
+        :param needs_auth: Is authentication as a user needed?
+        :param limit: The maximum number of items. Like send_request,
+            defaults to DEFAULT_LIMIT.
+        :param dedupe: Drop items whose id was already received. See
+            send_request. duplicates_dropped is kept up to date as pages are
+            received.
+        """
+        from pyimgur import request
+        from pyimgur.dedupe import make_seen_set
+
+        if self.refresh_token and not self.access_token:
+            self.refresh_access_token()
+
+        # Raise right away if authentication as a user is missing
+        self._authentication(needs_auth)
+        # Spread over the credentials like send_request does
+        use_credential_pool = self.credential_pool is not None and not self.access_token
+
+        if not limit or limit < 0:
+            limit = self.DEFAULT_LIMIT
+        seen = make_seen_set(dedupe)
+        if seen is not None:
+            self.duplicates_dropped = 0
+        count = 0
+        page = 0
+        while True:
+            page_url = url.format(page)
+            if self.metadata_store is not None:
+                self.metadata_store.flush()
+            try:
+                if use_credential_pool:
+                    items, ratelimit_info = self._send_pooled_request(
+                        page_url, stream=True
+                    )
+                else:
+                    items, ratelimit_info = request.stream_request(
+                        page_url,
+                        headers=self._authentication(needs_auth),
+                        transport=self.transport,
+                        hooks=self.hooks,
+                    )
+            except UnexpectedImgurException as e:
+                # See send_request
+                if e.response.status_code not in (401, 429) or not self.access_token:
+                    raise
+                self.refresh_access_token()
+                items, ratelimit_info = request.stream_request(
+                    page_url,
+                    headers=self._authentication(needs_auth),
+                    transport=self.transport,
+                    hooks=self.hooks,
+                )
+            page_items = 0
+            page_duplicates = 0
+            # Release the connection when the caller stops iterating early
+            try:
+                self._update_ratelimit(ratelimit_info)
+                for item in items:
+                    page_items += 1
+                    if seen is not None and not seen.add(item["id"]):
+                        page_duplicates += 1
+                        self.duplicates_dropped += 1
+                        continue
+                    yield item
+                    count += 1
+                    if count >= limit:
+                        return
+            finally:
+                items.close()
+            if not page_items:
+                return
+            self.hooks.emit(
+                ON_PAGE,
+                {
+                    "url": page_url,
+                    "page": page,
+                    "items": page_items - page_duplicates,
+                    "duplicates": page_duplicates,
+                },
+            )
+            page += 1
+
+    def _send_pooled_request(self, url, content_to_send=None, stream=False):
+        """
+        Send a GET request with the credential that has the most budget left.
+
+        If Imgur reports that a credential is ratelimited, it's put aside and
+        the request is retried with the next credential.
+
+        :param stream: Send it with request.stream_request, so the content is
+            an iterator over the items of the data array.
+        """
+        from pyimgur import request
+
+        while True:
+            credential = self.credential_pool.acquire()
+            # Only move between Imgur and RapidAPI. A custom base_url, such as
+            # a proxy or local test server, is kept for all credentials.
+            if self.base_url in (IMGUR_BASE, RAPIDAPI_BASE):
+                credential_url = credential.rebase(url, self.base_url)
+            else:
+                credential_url = url
+            try:
+                if stream:
+                    content, ratelimit_info = request.stream_request(
+                        credential_url,
+                        headers=credential.headers,
+                        transport=self.transport,
+                        hooks=self.hooks,
+                    )
+                else:
+                    content, ratelimit_info = request.send_request(
+                        credential_url,
+                        method="GET",
+                        content_to_send=content_to_send,
+                        headers=credential.headers,
+                        transport=self.transport,
+                        hooks=self.hooks,
+                    )
+            except UnexpectedImgurException as e:
+                if e.response.status_code != 429:
+                    raise
+                self.credential_pool.mark_exhausted(credential)
+                continue
+
+            self.credential_pool.update(credential, ratelimit_info)
+            return content, ratelimit_info
+
+    def upload_images(
+        self,
+        sources,
+        album=None,
+        create_album=False,
+        album_title=None,
+        max_workers=DEFAULT_UPLOAD_WORKERS,
+        retries=DEFAULT_UPLOAD_RETRIES,
+        preprocessor=None,
     ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
-        Upload the image at either path or url.
+        Upload several images concurrently.
+
+        See pyimgur.bulk.upload_images for details.
+
+        :param sources: The images to upload. Each can be a path, a url, bytes
+            or a file object opened in binary mode.
+        :param album: An Album object or album id. The uploaded images are
+            added to it in a single request once all uploads are done.
+        :param create_album: If True, create a new album containing the
+            uploaded images once all uploads are done.
+        :param album_title: The title of the album created with create_album.
+        :param max_workers: The number of uploads running at the same time.
+        :param retries: How many times a failed upload is retried.
+        :param preprocessor: A pyimgur.preprocess.Preprocessor to run on each
+            image before upload. It runs in a pool of worker processes.
+
+        :returns: An UploadResults list with a TransferResult per source, in
+            the same order as sources. Its album attribute is the album the
+            images were added to, if any.
+        """
+        from pyimgur import bulk
+
+        return bulk.upload_images(
+            self,
+            sources,
+            album=album,
+            create_album=create_album,
+            album_title=album_title,
+            max_workers=max_workers,
+            retries=retries,
+            preprocessor=preprocessor,
+        )
+
+    def upload_image(
+        self,
+        path=None,
+        url=None,
+        title=None,
+        description=None,
+        album=None,
+        file=None,
+        preprocessor=None,
+        progress=None,
+        progress_interval=DEFAULT_PROGRESS_INTERVAL,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        """
+        Upload the image at either path, url or in file.
 
         :param path: The path to the image you want to upload.
         :param url: The url to the image you want to upload.
@@ -660,23 +1238,171 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
             without adding to an Album, adding it later is possible.
             Authentication as album owner is necessary to upload to an album
             with this function.
+        :param file: The image you want to upload, as bytes or a file object
+            opened in binary mode.
+        :param preprocessor: A pyimgur.preprocess.Preprocessor, or any callable
+            taking a path, bytes or file object and returning the image to
+            upload instead. Not used for url uploads.
+        :param progress: Called with bytes sent, total bytes and the current
+            rate in bytes per second, as the upload progresses. Not used for
+            url uploads.
+        :param progress_interval: The minimum number of seconds between calls
+            to progress.
+
+        :returns: An Image object representing the uploaded image. If an
+            upload_index is set and the same content has been uploaded before,
+            the earlier image is returned without uploading again. It's added
+            to album, but keeps its original title and description.
+        """
+        from pyimgur.bandwidth import limiters_for
+        from pyimgur.image import Image
+        from pyimgur.objects import Album
 
-        :returns: An Image object representing the uploaded image.
+        if sum(1 for source in (path, url, file) if source) != 1:
+            raise InvalidParameterError(
+                "Exactly one of path, url or file must be given."
+            )
+
+        if preprocessor is not None and url is None:
+            file = preprocessor(file if path is None else path)
+            path = None
+
+        digest = None
+        if self.upload_index is not None and url is None:
+            digest = self.upload_index.hash_content(path=path, file=file)
+            existing = self.upload_index.lookup(digest)
+            if existing is not None:
+                self.hooks.emit(ON_CACHE_HIT, {"cache": "upload_index", "key": digest})
+                image = Image(existing, self, has_fetched=False)
+                if album is not None:
+                    if not isinstance(album, Album):
+                        album = Album({"id": album}, self, False)
+                    album.add_images([image])
+                return image
+
+        limiters = limiters_for(self)
+        if url is None and (progress is not None or limiters):
+            # Stream the image, so progress and bandwidth are tracked as
+            # it's sent.
+            fields = {
+                "album_id": getattr(album, "id", album),
+                "title": title,
+                "description": description,
+            }
+            with MultipartStream(
+                fields,
+                "image",
+                path=path,
+                file=file,
+                progress=progress,
+                limiters=limiters,
+                progress_interval=progress_interval,
+            ) as body:
+                resp = self.send_request(
+                    self.base_url + "/3/image", body=body, method="POST"
+                )
+        else:
+            payload = {
+                "album_id": album,
+                "image_path": path,
+                "image_file": file,
+                "image": url,
+                "title": title,
+                "description": description,
+            }
+
+            resp = self.send_request(
+                self.base_url + "/3/image", params=payload, method="POST"
+            )
+
+        image = self._uploaded_image(resp, title, description, album)
+        if digest is not None:
+            self.upload_index.add(digest, image)
+        return image
+
+    def upload_large_file(
+        self,
+        path=None,
+        file=None,
+        title=None,
+        description=None,
+        album=None,
+        progress=None,
+        max_bytes_per_second=None,
+        retries=DEFAULT_LARGE_UPLOAD_RETRIES,
+        progress_interval=DEFAULT_PROGRESS_INTERVAL,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
         """
-        if bool(path) == bool(url):
-            raise InvalidParameterError("Either path or url must be given.")
+        Upload a large image or video, such as an mp4, streamed from disk.
 
-        payload = {
-            "album_id": album,
-            "image_path": path,
-            "image": url,
+        Unlike upload_image, the file is read in chunks as it's sent, so it's
+        never held in memory. If the upload fails on a network error or a
+        server error, the whole transfer is retried, reading the file again
+        from the start. Imgur has no way to resume a partial upload.
+
+        :param path: The path to the file you want to upload.
+        :param file: The file you want to upload, as a file object opened in
+            binary mode. Used if path isn't given.
+        :param title: The title the image will have when uploaded.
+        :param description: The description the image will have when uploaded.
+        :param album: The album the image will be added to when uploaded. Can
+            be either a Album object or it's id.
+        :param progress: Called with bytes sent, total bytes and the current
+            rate in bytes per second, as the upload progresses. Starts again
+            from 0 if the upload is retried.
+        :param max_bytes_per_second: Limit the upload speed to this, on top of
+            the bandwidth_limiter and the global limit.
+        :param retries: How many times the upload is retried.
+        :param progress_interval: The minimum number of seconds between calls
+            to progress.
+
+        :returns: An Image object representing the uploaded image or video.
+        """
+        import mimetypes
+
+        from pyimgur import request
+        from pyimgur.bandwidth import BandwidthLimiter, limiters_for
+
+        if (path is None) == (file is None):
+            raise InvalidParameterError("Exactly one of path or file must be given.")
+
+        limiters = limiters_for(self)
+        if max_bytes_per_second:
+            limiters += (BandwidthLimiter(max_bytes_per_second),)
+        filename = path if path is not None else getattr(file, "name", "")
+        is_video = (mimetypes.guess_type(str(filename))[0] or "").startswith("video/")
+        fields = {
+            "album_id": getattr(album, "id", album),
             "title": title,
             "description": description,
+            "type": "file",
         }
-
-        resp = self.send_request(
-            self.base_url + "/3/image", params=payload, method="POST"
-        )
+        with MultipartStream(
+            fields,
+            "video" if is_video else "image",
+            path=path,
+            file=file,
+            progress=progress,
+            limiters=limiters,
+            progress_interval=progress_interval,
+        ) as body:
+            for attempt in range(retries + 1):
+                try:
+                    resp = self.send_request(
+                        self.base_url + "/3/image", body=body, method="POST"
+                    )
+                    break
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    if attempt == retries or not request.is_transient_error(e):
+                        raise
+                time.sleep(LARGE_UPLOAD_BACKOFF_SECONDS * 2**attempt)
+
+        return self._uploaded_image(resp, title, description, album)
+
+    def _uploaded_image(self, resp, title, description, album):
+        """Return the Image for the response to an upload."""
+        from pyimgur.image import Image
+        from pyimgur.objects import Album
 
         resp["title"] = title
         resp["description"] = description
@@ -687,3 +1413,16 @@ class Imgur:  # pylint: disable=too-many-instance-attributes,too-many-public-met
                 else album
             )
         return Image(resp, self)
+
+
+def _make_credential(credential):
+    """Turn a client_id or (client_id, rapidapi_key) tuple into a Credential."""
+    from pyimgur.sharding import Credential
+
+    if isinstance(credential, Credential):
+        return credential
+    if isinstance(credential, str):
+        credential = (credential, None)
+    client_id, rapidapi_key = credential
+    base_url = RAPIDAPI_BASE if rapidapi_key else IMGUR_BASE
+    return Credential(client_id, base_url, rapidapi_key=rapidapi_key)
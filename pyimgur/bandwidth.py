@@ -0,0 +1,91 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Cap the bandwidth used by uploads and downloads.
+
+A BandwidthLimiter is a token bucket over bytes. Transfers take tokens for
+every chunk they send or receive, and wait when the bucket is empty. The
+limiter is thread safe, so one limiter caps all threads sharing it.
+
+Transfers draw from the limiter of their Imgur object, set with the
+bandwidth_limiter argument, and from the global limiter, set with
+set_global_limit, which caps all Imgur objects in the process together.
+"""
+
+import threading
+import time
+
+_GLOBAL_LIMITER = None
+
+
+class BandwidthLimiter:
+    """
+    A thread safe token bucket over bytes.
+
+    :ivar bytes_per_second: The rate tokens are added to the bucket at.
+    :ivar burst: The size of the bucket. Up to this many bytes can be
+        transferred at once, after a pause.
+    """
+
+    def __init__(self, bytes_per_second, burst=None):
+        self.bytes_per_second = bytes_per_second
+        self.burst = bytes_per_second if burst is None else burst
+        self._tokens = self.burst
+        self._updated = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.bytes_per_second} bytes/s>"
+
+    def acquire(self, nbytes):
+        """
+        Take nbytes tokens, waiting until the bucket has them.
+
+        Callers reserve their tokens in turn, so concurrent transfers share
+        the bandwidth fairly, and chunks larger than burst are allowed.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.bytes_per_second,
+            )
+            self._updated = now
+            self._tokens -= nbytes
+            delay = -self._tokens / self.bytes_per_second
+        if delay > 0:
+            time.sleep(delay)
+
+
+def set_global_limit(bytes_per_second, burst=None):
+    """
+    Cap the bandwidth of all transfers in the process.
+
+    :param bytes_per_second: The limit. None removes it.
+    :param burst: See BandwidthLimiter.
+    """
+    global _GLOBAL_LIMITER  # pylint: disable=global-statement
+    _GLOBAL_LIMITER = (
+        None if bytes_per_second is None else BandwidthLimiter(bytes_per_second, burst)
+    )
+
+
+def limiters_for(imgur):
+    """Return the limiters that transfers made with imgur draw from."""
+    return tuple(
+        limiter
+        for limiter in (imgur.bandwidth_limiter, _GLOBAL_LIMITER)
+        if limiter is not None
+    )
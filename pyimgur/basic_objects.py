@@ -15,6 +15,10 @@
 
 """Basic object, which all subsequent objects inherit from."""
 
+import copy
+
+from pyimgur.tracing import traced
+
 
 def _change_object(from_object, to_object):
     from_object.__class__ = to_object.__class__
@@ -22,6 +26,7 @@ def _change_object(from_object, to_object):
     from_object.__repr__ = to_object.__repr__
 
 
+@traced
 class Basic_object:  # pylint: disable=invalid-name
     """Contains basic functionality shared by a lot of PyImgur's classes."""
 
@@ -68,9 +73,40 @@ class Basic_object:  # pylint: disable=invalid-name
             if attr in vars(self):
                 del self.__dict__[attr]
 
+        metadata_store = getattr(self._imgur, "metadata_store", None)
+        if metadata_store is not None:
+            metadata_store.save(self, json_dict)
+
     def __repr__(self):
         return f"<{type(self).__name__} {self.id}>"
 
+    def __getstate__(self):
+        # The Imgur object holds connections and locks. Leave it out, so
+        # objects can be pickled, see pyimgur.serialization.attach.
+        state = dict(vars(self))
+        state["_imgur"] = None
+        return state
+
+    def __copy__(self):
+        # Copies stay in the same process, so they keep the Imgur object
+        # that __getstate__ leaves out
+        duplicate = object.__new__(type(self))
+        duplicate.__dict__.update(vars(self))
+        return duplicate
+
+    def __deepcopy__(self, memo):
+        duplicate = object.__new__(type(self))
+        memo[id(self)] = duplicate
+        for key, value in vars(self).items():
+            duplicate.__dict__[key] = (
+                value if key == "_imgur" else copy.deepcopy(value, memo)
+            )
+        return duplicate
+
+    def __setstate__(self, state):
+        # Defined so unpickling doesn't look for it through __getattr__
+        self.__dict__.update(state)
+
     def __getattr__(self, attribute):
         if not self._has_fetched:
             self.refresh()
@@ -94,8 +130,9 @@ class Basic_object:  # pylint: disable=invalid-name
         loading, will be added by calling refresh.
         """
         resp = self._imgur.send_request(self._info_url)
-        self._populate(resp)
+        # Set first, so the metadata store knows the object is complete
         self._has_fetched = True
+        self._populate(resp)
 
 
 def _change_object(from_object, to_object):
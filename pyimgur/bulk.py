@@ -0,0 +1,300 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Transfer many images at once, concurrently."""
+
+import os
+import time
+
+from pyimgur.exceptions import RateLimitError
+
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_RESOLVE_WORKERS = 8
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_UPLOAD_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 1
+
+# Imgur charges 10 credits for each upload, against 1 for other requests.
+UPLOAD_COST = 10
+
+
+class TransferResult:
+    """
+    The outcome of transferring one item in a bulk operation.
+
+    :ivar error: The exception raised while transferring the item, or None
+        if it succeeded.
+    :ivar item: The item given as input.
+    :ivar value: The result of the transfer, such as the downloaded path.
+        None if the transfer failed.
+    """
+
+    def __init__(self, item, value=None, error=None):
+        self.item = item
+        self.value = value
+        self.error = error
+
+    def __repr__(self):
+        outcome = repr(self.value) if self.ok else f"error={self.error!r}"
+        return f"<{type(self).__name__} {self.item!r} {outcome}>"
+
+    @property
+    def ok(self):  # pylint: disable=invalid-name
+        """Did the transfer succeed?"""
+        return self.error is None
+
+
+def _run_all(function, items, max_workers):
+    """Call function on every item concurrently. Results are in input order."""
+    # Imported here, like in upload_images, to keep import pyimgur fast
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(item):
+        try:
+            return TransferResult(item, value=function(item))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return TransferResult(item, error=e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, items))
+
+
+def download_images(
+    images, path="", size=None, overwrite=False, max_workers=DEFAULT_DOWNLOAD_WORKERS
+):
+    """
+    Download several images concurrently.
+
+    A failed download doesn't stop the others. Check the ok attribute of the
+    results to see which succeeded.
+
+    :param images: The Image objects to download.
+    :param path: The folder the images are saved in. Defaults to the current
+        working directory.
+    :param size: Download this thumbnail size instead of the original, see
+        Image.download for the options. Thumbnails are fetched from their
+        link_ urls, which transfers far fewer bytes than the originals.
+    :param overwrite: If True overwrite already existing files.
+    :param max_workers: The number of downloads running at the same time.
+
+    :returns: A TransferResult per image, in the same order as images, with
+        the path of the downloaded file as value.
+    """
+    return _run_all(
+        lambda image: image.download(path=path, overwrite=overwrite, size=size),
+        images,
+        max_workers,
+    )
+
+
+def resolve_urls(imgur, urls, max_workers=DEFAULT_RESOLVE_WORKERS):
+    """
+    Return the objects at several urls, resolved concurrently.
+
+    Each distinct url is only resolved once, duplicates share the result.
+
+    :param imgur: The Imgur object to resolve the urls with.
+    :param urls: The urls to resolve, see Imgur.get_at_url.
+    :param max_workers: The number of urls resolved at the same time.
+
+    :returns: A TransferResult per url, in the same order as urls, with the
+        object at the url as value.
+    """
+    urls = list(urls)
+    resolved = {
+        result.item: result
+        for result in _run_all(imgur.get_at_url, dict.fromkeys(urls), max_workers)
+    }
+    return [resolved[url] for url in urls]
+
+
+class UploadResults(list):
+    """
+    The TransferResults of a bulk upload, in the same order as the sources.
+
+    :ivar album: The album the uploaded images were added to. None if they
+        weren't added to an album.
+    """
+
+    def __init__(self, results, album=None):
+        super().__init__(results)
+        self.album = album
+
+
+class RequestBudget:
+    """
+    Keeps concurrent requests within the ratelimit reported by Imgur.
+
+    :ivar cost: The ratelimit credits each request uses.
+    :ivar in_flight: The number of requests reserved, but not yet finished.
+    """
+
+    def __init__(self, imgur, cost=1):
+        # Imported here, like the other modules that are slow to import, so
+        # import pyimgur stays fast. See pyimgur.LAZY_ATTRIBUTES.
+        import threading  # pylint: disable=import-outside-toplevel
+
+        self.imgur = imgur
+        self.cost = cost
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Reserve the credits for one request, or raise RateLimitError."""
+        with self._lock:
+            remaining = self.imgur.remaining_requests()
+            if remaining is not None:
+                remaining -= self.in_flight * self.cost
+                if remaining < self.cost:
+                    raise RateLimitError("Not enough ratelimit left for more requests.")
+            self.in_flight += 1
+
+    def release(self):
+        """Release the credits reserved for a request that has finished."""
+        with self._lock:
+            self.in_flight -= 1
+
+
+def _source_kwargs(source):
+    """Return the upload_image argument for source."""
+    if isinstance(source, (bytes, bytearray)) or hasattr(source, "read"):
+        return {"file": source}
+    source = os.fspath(source)
+    if source.startswith(("http://", "https://")):
+        return {"url": source}
+    return {"path": source}
+
+
+def _preprocess(processes, preprocessor, source):
+    """
+    Submit the preprocessing of source to processes and return its future.
+
+    None for urls, which are uploaded as they are. A source that can't be
+    submitted gives a future with the error, so only its upload fails.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import Future
+
+    try:
+        if "url" in _source_kwargs(source):
+            return None
+        return processes.submit(preprocessor, _picklable(source))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        failed = Future()
+        failed.set_exception(e)
+        return failed
+
+
+def _picklable(source):
+    """Return source in a form that can be sent to a worker process."""
+    if hasattr(source, "read"):
+        return source.read()
+    return source
+
+
+def upload_images(
+    imgur,
+    sources,
+    album=None,
+    create_album=False,
+    album_title=None,
+    max_workers=DEFAULT_UPLOAD_WORKERS,
+    retries=DEFAULT_UPLOAD_RETRIES,
+    preprocessor=None,
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    """
+    Upload several images concurrently with Imgur.upload_image.
+
+    Uploads that fail with a transient error, such as Imgur being down or a
+    dropped connection, are retried with exponential backoff. An upload that
+    still fails doesn't stop the others. Uploads are not started once the
+    ratelimit reported by Imgur can't cover them, they fail with
+    RateLimitError instead.
+
+    When all uploads are done, the uploaded images can be added to an
+    existing album or a new one, with a single request.
+
+    :param imgur: The Imgur object to upload with.
+    :param sources: The images to upload. Each can be a path, a url, bytes
+        or a file object opened in binary mode.
+    :param album: An Album object or album id to add the uploaded images to.
+    :param create_album: If True, create a new album with the uploaded images.
+    :param album_title: The title of the album created with create_album.
+    :param max_workers: The number of uploads running at the same time.
+    :param retries: How many times a failed upload is retried.
+    :param preprocessor: A pyimgur.preprocess.Preprocessor to run on each
+        image, except urls, before it's uploaded. Preprocessing is CPU bound,
+        so it runs in a pool of worker processes while other images upload.
+        The processed images are kept in memory, never written to disk.
+
+    :returns: An UploadResults list with a TransferResult per source, in the
+        same order as sources, with the uploaded Image as value.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    from pyimgur.objects import Album
+    from pyimgur.request import is_transient_error
+
+    budget = RequestBudget(imgur, UPLOAD_COST)
+    sources = list(sources)
+    processes = None
+    jobs = [None] * len(sources)
+    if preprocessor is not None:
+        # Every job is submitted before the upload threads start, as forking
+        # the worker processes while other threads run can deadlock.
+        processes = ProcessPoolExecutor()
+        jobs = [_preprocess(processes, preprocessor, source) for source in sources]
+
+    def upload(source_and_job):
+        source, job = source_and_job
+        kwargs = _source_kwargs(source)
+        if job is not None:
+            kwargs = {"file": job.result()}
+        for attempt in range(retries + 1):
+            budget.reserve()
+            try:
+                return imgur.upload_image(**kwargs)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if attempt == retries or not is_transient_error(e):
+                    raise
+            finally:
+                budget.release()
+            if hasattr(kwargs.get("file"), "seek"):
+                kwargs["file"].seek(0)
+            time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+        return None  # Unreachable, the last attempt returns or raises
+
+    try:
+        results = UploadResults(
+            TransferResult(result.item[0], result.value, result.error)
+            for result in _run_all(upload, zip(sources, jobs), max_workers)
+        )
+    finally:
+        if processes is not None:
+            processes.shutdown()
+    uploaded = [result.value for result in results if result.ok]
+    if not uploaded:
+        return results
+
+    if create_album:
+        results.album = imgur.create_album(title=album_title, images=uploaded)
+    elif album is not None:
+        if not isinstance(album, Album):
+            album = Album({"id": album}, imgur, has_fetched=False)
+        album.add_images(uploaded)
+        results.album = album
+    return results
@@ -0,0 +1,154 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Paginated crawls that save their progress and can be resumed."""
+
+import signal
+import threading
+
+from pyimgur.conversion import clean_imgur_params
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.objects import Gallery_item
+from pyimgur.stores import JSONFileStore
+
+# Key of the crawl state in the checkpoint file
+CHECKPOINT_KEY = "crawl"
+
+
+class CheckpointedCrawl:
+    """
+    Crawl a paginated gallery listing, saving a checkpoint after each page.
+
+    The checkpoint file holds the url and params of the listing, the next
+    page and the ids already yielded. Creating a crawl with an existing
+    checkpoint resumes it where it stopped, skipping items already yielded.
+
+    While iterating in the main thread, SIGTERM makes the crawl save its
+    checkpoint and end after the current item, instead of killing the
+    process. If the process dies without warning, the crawl resumes from the
+    last completed page.
+
+        crawl = im.crawl_gallery("gallery.checkpoint", limit=5000)
+        for item in crawl:
+            store(item)
+        if not crawl.done:
+            print("Stopped, run again to resume")
+    """
+
+    def __init__(
+        self, imgur, checkpoint, url, params=None, limit=None, signals=(signal.SIGTERM,)
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Create the crawl, or resume it if checkpoint exists.
+
+        :param imgur: The Imgur object to send the requests with.
+        :param checkpoint: The path of the checkpoint file.
+        :param url: The url of the listing, with {} where the page goes.
+        :param params: The params sent with every page request.
+        :param limit: The number of items to yield in total, over all runs.
+            None for all of them.
+        :param signals: The signals that stop the crawl gracefully.
+        """
+        self.imgur = imgur
+        self.limit = limit
+        self.signals = signals
+        self._store = JSONFileStore(checkpoint)
+        self._stopped = threading.Event()
+
+        params = clean_imgur_params(params)
+        state = self._store.get(CHECKPOINT_KEY)
+        if state is None:
+            state = {
+                "url": url,
+                "params": params,
+                "page": 0,
+                "count": 0,
+                "seen": [],
+                "done": False,
+            }
+        elif state["url"] != url or state["params"] != params:
+            raise InvalidParameterError(
+                f"The checkpoint {self._store.path} is for a different crawl"
+            )
+        self._state = state
+
+    def __iter__(self):
+        """Yield the gallery items not yielded before, saving progress."""
+        self._stopped.clear()
+        previous_handlers = self._install_signal_handlers()
+        try:
+            yield from self._crawl()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    @property
+    def count(self):
+        """The number of items yielded, over all runs."""
+        return self._state["count"]
+
+    @property
+    def done(self):
+        """True when the whole listing, or limit items of it, was crawled."""
+        return self._state["done"] or self._limit_reached()
+
+    @property
+    def page(self):
+        """The page the crawl continues from."""
+        return self._state["page"]
+
+    def stop(self):
+        """Make iteration save the checkpoint and end after the current item."""
+        self._stopped.set()
+
+    def _crawl(self):
+        seen = set(self._state["seen"])
+        try:
+            while not self.done and not self._stopped.is_set():
+                page = self._state["page"]
+                items = self.imgur.send_request(
+                    self._state["url"].format(page), params=self._state["params"]
+                )
+                for thing in items:
+                    if self._stopped.is_set() or self._limit_reached():
+                        return
+                    if thing["id"] in seen:
+                        continue
+                    seen.add(thing["id"])
+                    self._state["count"] += 1
+                    yield Gallery_item.get_album_or_image(thing, self.imgur)
+                if items:
+                    self._state["page"] = page + 1
+                else:
+                    self._state["done"] = True
+                self._save(seen)
+        finally:
+            self._save(seen)
+
+    def _install_signal_handlers(self):
+        # Signal handlers can only be set from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        return {
+            signum: signal.signal(signum, lambda *_: self.stop())
+            for signum in self.signals
+        }
+
+    def _limit_reached(self):
+        return self.limit is not None and self._state["count"] >= self.limit
+
+    def _save(self, seen):
+        self._state["seen"] = sorted(seen)
+        self._store.set(CHECKPOINT_KEY, self._state)
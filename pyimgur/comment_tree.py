@@ -0,0 +1,186 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Comment threads stored as flat arrays, with Comments built on demand.
+
+Building a Comment for every reply in a large thread allocates several
+objects per reply and recurses once per level of nesting. A CommentTree
+instead parses the nested json once, iteratively, into one row per comment.
+Traversals work on row indexes, and a Comment is only built for the rows
+that are accessed.
+"""
+
+import sys
+from array import array
+from collections import deque
+from collections.abc import Sequence
+
+# Fields stored in their own arrays, rather than in the row's json
+INDEXED_FIELDS = ("id", "author", "points", "comment", "children")
+
+
+class CommentTree:  # pylint: disable=too-many-instance-attributes
+    """
+    A comment thread, parsed into an array backed table.
+
+    Rows are numbered in breadth-first order. The top-level comments are the
+    first rows and the replies to a comment are consecutive rows.
+
+    :ivar roots: The row indexes of the top-level comments.
+    """
+
+    def __init__(self, comments, make_comment):
+        """
+        Parse the thread.
+
+        :param comments: The json of the top-level comments, each with their
+            replies nested in children, as returned by Imgur.
+        :param make_comment: Called with the json of a comment, without its
+            children, to build the Comment when it's accessed.
+        """
+        self._make_comment = make_comment
+        self._ids = []
+        self._parents = array("l")
+        self._first_child = array("l")
+        self._child_count = array("l")
+        self._authors = []
+        self._points = array("l")
+        self._text_offsets = array("L", [0])
+        self._rows = []
+        self._built = {}
+
+        texts = []
+        queue = deque((comment, -1) for comment in comments)
+        self.roots = range(len(queue))
+        while queue:
+            comment, parent = queue.popleft()
+            index = len(self._rows)
+            children = comment.get("children") or []
+            self._ids.append(comment["id"])
+            self._parents.append(parent)
+            # Replies are queued together, so they get consecutive rows
+            self._first_child.append(len(self._rows) + len(queue) + 1)
+            self._child_count.append(len(children))
+            self._authors.append(sys.intern(comment.get("author") or ""))
+            self._points.append(comment.get("points") or 0)
+            text = comment.get("comment") or ""
+            texts.append(text)
+            self._text_offsets.append(self._text_offsets[index] + len(text))
+            self._rows.append(
+                {k: v for k, v in comment.items() if k not in INDEXED_FIELDS}
+            )
+            queue.extend((child, index) for child in children)
+        self._text = "".join(texts)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return self.depth_first()
+
+    def id(self, index):  # pylint: disable=invalid-name
+        """Return the id of the comment in row index."""
+        return self._ids[index]
+
+    def author(self, index):
+        """Return the name of the author of the comment in row index."""
+        return self._authors[index]
+
+    def points(self, index):
+        """Return the points of the comment in row index."""
+        return self._points[index]
+
+    def text(self, index):
+        """Return the text of the comment in row index."""
+        return self._text[self._text_offsets[index] : self._text_offsets[index + 1]]
+
+    def parent(self, index):
+        """Return the row of the comment replied to, or None for top-level."""
+        parent = self._parents[index]
+        return None if parent == -1 else parent
+
+    def children(self, index):
+        """Return the rows of the replies to the comment in row index."""
+        first = self._first_child[index]
+        return range(first, first + self._child_count[index])
+
+    def comment(self, index):
+        """Return the Comment in row index. It's built on first access."""
+        comment = self._built.get(index)
+        if comment is None:
+            json = dict(
+                self._rows[index],
+                id=self._ids[index],
+                author=self._authors[index],
+                points=self._points[index],
+                comment=self.text(index),
+            )
+            comment = self._make_comment(json)
+            comment.replies = TreeReplies(self, index)
+            self._built[index] = comment
+        return comment
+
+    def depth_first(self, start=None):
+        """
+        Yield row indexes in depth-first order, parents before replies.
+
+        :param start: Only yield the subtree below this row, including it.
+            Defaults to the whole tree.
+        """
+        stack = list(reversed(self.roots if start is None else [start]))
+        while stack:
+            index = stack.pop()
+            yield index
+            stack.extend(reversed(self.children(index)))
+
+    def breadth_first(self, start=None):
+        """
+        Yield row indexes in breadth-first order, level by level.
+
+        :param start: Only yield the subtree below this row, including it.
+            Defaults to the whole tree.
+        """
+        if start is None:
+            yield from range(len(self))
+            return
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            yield index
+            queue.extend(self.children(index))
+
+    def comments(self, breadth_first=False):
+        """Yield the Comments of the tree, building them as they're reached."""
+        order = self.breadth_first() if breadth_first else self.depth_first()
+        return (self.comment(index) for index in order)
+
+
+class TreeReplies(Sequence):
+    """The replies of a Comment in a CommentTree, built when accessed."""
+
+    def __init__(self, tree, index):
+        self._tree = tree
+        self._rows = tree.children(index)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._tree.comment(row) for row in self._rows[position]]
+        return self._tree.comment(self._rows[position])
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} comments>"
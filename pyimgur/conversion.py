@@ -23,19 +23,26 @@ def get_content_to_send(
     method="GET",
     as_json=False,
     use_form_data=False,
+    body=None,
 ):
     """Get the content to send to Imgur, in the format it expects.
 
     This means formatting stuff properly, removing None values and figuring out whether imgur wants
     stuff as data, json or form data.
 
+    A body, such as a streaming.MultipartStream, is sent as is with its own
+    Content-Type.
+
     """
 
     params, files = to_imgur_format(params, as_json and use_form_data)
 
     content_to_send = {"files": files, "params": None, "data": None, "json": None}
 
-    if method == "GET":
+    if body is not None:
+        content_to_send["data"] = body
+        content_to_send["headers"] = {"Content-Type": body.content_type}
+    elif method == "GET":
         content_to_send["params"] = params
     elif as_json:
         content_to_send["json"] = params
@@ -86,6 +93,11 @@ def to_imgur_format(params, use_form_data=False):
 
         del params["image_path"]
 
+    if params and "image_file" in params:
+        # requests accepts both bytes and file objects as file content
+        files.append(("image", params["image_file"]))
+        del params["image_file"]
+
     if params is None:
         return {}, files
 
@@ -0,0 +1,138 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Crawl whole comment threads concurrently."""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pyimgur.bulk import RequestBudget, TransferResult
+from pyimgur.objects import Gallery_item
+
+DEFAULT_CRAWL_WORKERS = 8
+
+
+def crawl_comments(start, callback=None, max_workers=DEFAULT_CRAWL_WORKERS):
+    """
+    Collect every reply below some comments, fetching replies concurrently.
+
+    Replies that are already known, such as the nested replies returned by
+    Gallery_item.get_comments, are used as they are. The replies of other
+    comments are fetched with Comment.get_replies on a pool of threads, and
+    the replies of those are expanded in turn. Each comment id is expanded
+    only once, even if it turns up in several threads. Fetches stop with
+    RateLimitError when the ratelimit reported by Imgur runs out.
+
+    :param start: A Gallery_album or Gallery_image, to crawl all its
+        comments, or Comments, such as from User.get_comments. The replies of
+        Comments given directly are always fetched.
+    :param callback: Called with the TransferResult of each top-level
+        comment, as soon as the comments below it are complete. It's called
+        from the crawling threads.
+    :param max_workers: The number of replies fetched at the same time.
+
+    :returns: A TransferResult per top-level comment, in order, with the
+        comment as value. Its replies, and theirs, are filled in all the way
+        down. If fetching some replies failed, error is the first failure
+        and value is None.
+    """
+    if isinstance(start, Gallery_item):
+        # Without a limit, get_comments would stop after DEFAULT_LIMIT comments
+        crawl = _CommentCrawl(start.get_comments(limit=sys.maxsize), callback)
+        fetch_roots = False
+    else:
+        crawl = _CommentCrawl(list(start), callback)
+        fetch_roots = True
+    return crawl.run(max_workers, fetch_roots)
+
+
+class _CommentCrawl:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """The state of one crawl_comments call, shared by its threads."""
+
+    def __init__(self, roots, callback):
+        self.roots = roots
+        self.callback = callback
+        self.executor = None
+        self.budget = None
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+        self._seen = set()
+        # Work outstanding, first error and result per top-level comment
+        self._pending = [1] * len(roots)
+        self._errors = [None] * len(roots)
+        self._results = [None] * len(roots)
+
+    def run(self, max_workers, fetch_roots):
+        """Crawl below every top-level comment and return their results."""
+        if not self.roots:
+            return []
+        # pylint: disable-next=protected-access
+        self.budget = RequestBudget(self.roots[0]._imgur)
+        with ThreadPoolExecutor(max_workers=max_workers) as self.executor:
+            for root, comment in enumerate(self.roots):
+                self._expand(root, comment, force_fetch=fetch_roots)
+                self._done(root)
+            with self._finished:
+                self._finished.wait_for(lambda: all(self._results))
+        return self._results
+
+    def _expand(self, root, comment, force_fetch=False):
+        """Walk the known replies below comment, fetching the unknown ones."""
+        stack = [comment]
+        while stack:
+            comment = stack.pop()
+            with self._lock:
+                if comment.id in self._seen:
+                    continue
+                self._seen.add(comment.id)
+            if "replies" in vars(comment) and not force_fetch:
+                stack.extend(comment.replies)
+            else:
+                with self._lock:
+                    self._pending[root] += 1
+                self.executor.submit(self._fetch, root, comment)
+            force_fetch = False
+
+    def _fetch(self, root, comment):
+        try:
+            self.budget.reserve()
+            try:
+                comment.replies = comment.get_replies()
+            finally:
+                self.budget.release()
+            for reply in comment.replies:
+                self._expand(root, reply)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                self._errors[root] = self._errors[root] or e
+        finally:
+            self._done(root)
+
+    def _done(self, root):
+        """Mark one piece of work below root as done."""
+        with self._lock:
+            self._pending[root] -= 1
+            if self._pending[root]:
+                return
+            comment, error = self.roots[root], self._errors[root]
+            if error is None:
+                result = TransferResult(comment, value=comment)
+            else:
+                result = TransferResult(comment, error=error)
+            self._results[root] = result
+            self._finished.notify_all()
+        if self.callback is not None:
+            self.callback(result)
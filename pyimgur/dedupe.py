@@ -0,0 +1,126 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Seen-sets for dropping items repeated across the pages of a listing.
+
+Gallery sections sorted by virality or time shift while they're paginated, so
+an item can appear on two pages. A seen-set remembers the ids already
+received. Its add method returns False for an id it has seen before.
+"""
+
+import hashlib
+import math
+import threading
+
+from pyimgur.exceptions import InvalidParameterError
+
+DEFAULT_BLOOM_CAPACITY = 1_000_000
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+
+
+class SeenSet:
+    """An exact seen-set, holding every id in memory."""
+
+    def __init__(self):
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, key):
+        """Add key. Return True if it wasn't in the set before."""
+        with self._lock:
+            if key in self._ids:
+                return False
+            self._ids.add(key)
+            return True
+
+
+class BloomFilter:
+    """
+    A compact, probabilistic seen-set for huge crawls.
+
+    It uses a fixed amount of memory, about 1.8 bytes per id at the default
+    error rate, however many ids are added. The price is that a new id is
+    mistaken for a seen one, and dropped, with probability error_rate once
+    capacity ids have been added. Seen ids are never mistaken for new ones.
+    """
+
+    def __init__(
+        self, capacity=DEFAULT_BLOOM_CAPACITY, error_rate=DEFAULT_BLOOM_ERROR_RATE
+    ):
+        """
+        Create an empty Bloom filter.
+
+        :param capacity: The number of ids it's sized for.
+        :param error_rate: The chance of a new id being taken as seen, when
+            capacity ids have been added.
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise InvalidParameterError(
+                "capacity must be positive and error_rate between 0 and 1"
+            )
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key)
+        )
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        """Add key. Return True if it definitely wasn't in the filter before."""
+        with self._lock:
+            is_new = False
+            for index in self._indexes(key):
+                mask = 1 << (index & 7)
+                if not self._bits[index >> 3] & mask:
+                    self._bits[index >> 3] |= mask
+                    is_new = True
+            self.count += is_new
+            return is_new
+
+    def _indexes(self, key):
+        # Double hashing, the hash_count indexes are derived from two hashes
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+
+def make_seen_set(dedupe):
+    """
+    Return the seen-set for the dedupe argument of a listing call.
+
+    False or None for no de-duplication, True for a new SeenSet, or a seen-set
+    to use as is, such as a BloomFilter or one shared between calls.
+    """
+    if dedupe is None or dedupe is False:
+        return None
+    if dedupe is True:
+        return SeenSet()
+    return dedupe
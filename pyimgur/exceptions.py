@@ -50,3 +50,19 @@ class ResourceNotFoundError(PyImgurError):
 
 class InvalidParameterError(PyImgurError):
     """Raised when invalid parameters are provided to an API call."""
+
+
+class RateLimitError(PyImgurError):
+    """Raised when every available credential has used up its ratelimit."""
+
+
+class MarkViewedError(PyImgurError):
+    """Raised when notifications could not be marked as viewed.
+
+    :ivar results: The TransferResult of each notification that failed, with
+        the notification as item and the exception raised as error.
+    """
+
+    def __init__(self, message, results=()):
+        super().__init__(message)
+        self.results = list(results)
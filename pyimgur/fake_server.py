@@ -0,0 +1,551 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A local fake of the Imgur API, for load testing and benchmarks.
+
+The server runs in a background thread and answers the endpoints PyImgur
+uses with synthetic, deterministic data. Point Imgur.base_url at it:
+
+    with FakeImgurServer(latency=0.05) as server:
+        im = pyimgur.Imgur("client_id")
+        im.base_url = server.base_url
+        im.get_gallery(limit=500)
+
+It is not a faithful copy of Imgur. Anything posted to it is accepted and
+thrown away, and every id exists.
+"""
+
+import json
+import random
+import re
+import string
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ID_ALPHABET = string.ascii_letters + string.digits
+ID_LENGTH = 7
+
+# Size of the downloadable thumbnails relative to the full image.
+THUMBNAIL_FRACTIONS = {
+    "s": 0.005,
+    "b": 0.01,
+    "t": 0.005,
+    "m": 0.02,
+    "l": 0.05,
+    "h": 0.1,
+}
+
+
+def synthetic_id(number):
+    """Return the Imgur-like id of the number'th synthetic object."""
+    chars = []
+    for _ in range(ID_LENGTH):
+        number, index = divmod(number, len(ID_ALPHABET))
+        chars.append(ID_ALPHABET[index])
+    return "".join(reversed(chars))
+
+
+def make_image(image_id, base_url, number=0):
+    """Return the json of a synthetic image."""
+    return {
+        "id": image_id,
+        "title": f"Synthetic image {number}",
+        "description": "A synthetic image served by the fake Imgur server.",
+        "datetime": 1700000000 + number,
+        "type": "image/jpeg",
+        "animated": False,
+        "width": 1920,
+        "height": 1080,
+        "size": 350000,
+        "views": number * 7,
+        "bandwidth": number * 7 * 350000,
+        "deletehash": None,
+        "section": None,
+        "favorite": False,
+        "nsfw": False,
+        "vote": None,
+        "in_gallery": False,
+        "link": f"{base_url}/i/{image_id}.jpg",
+    }
+
+
+def make_gallery_image(image_id, base_url, number=0):
+    """Return the json of a synthetic gallery image."""
+    image = make_image(image_id, base_url, number)
+    image.update(
+        {
+            "is_album": False,
+            "account_url": f"user{number % 100}",
+            "account_id": number % 100,
+            "ups": number % 1000,
+            "downs": number % 50,
+            "points": number % 1000 - number % 50,
+            "score": number % 5000,
+            "comment_count": number % 200,
+            "topic": "No Topic",
+            "tags": [{"name": f"tag{number % 20}"}],
+            "in_gallery": True,
+        }
+    )
+    return image
+
+
+def make_album(album_id, base_url, number=0, images_count=5):
+    """Return the json of a synthetic album, including its images."""
+    images = [
+        make_image(synthetic_id(number * 1000 + i), base_url, number * 1000 + i)
+        for i in range(images_count)
+    ]
+    return {
+        "id": album_id,
+        "title": f"Synthetic album {number}",
+        "description": None,
+        "datetime": 1700000000 + number,
+        "cover": images[0]["id"] if images else None,
+        "account_url": f"user{number % 100}",
+        "account_id": number % 100,
+        "privacy": "public",
+        "layout": "blog",
+        "views": number * 3,
+        "link": f"{base_url}/a/{album_id}",
+        "favorite": False,
+        "nsfw": False,
+        "section": None,
+        "images_count": images_count,
+        "images": images,
+    }
+
+
+def make_gallery_album(album_id, base_url, number=0, images_count=5):
+    """Return the json of a synthetic gallery album."""
+    album = make_album(album_id, base_url, number, images_count)
+    album.update(
+        {
+            "is_album": True,
+            "ups": number % 1000,
+            "downs": number % 50,
+            "points": number % 1000 - number % 50,
+            "score": number % 5000,
+            "comment_count": number % 200,
+            "tags": [{"name": f"tag{number % 20}"}],
+            "in_gallery": True,
+        }
+    )
+    return album
+
+
+def make_gallery_item(number, base_url):
+    """Return the json of a gallery image, or every fifth time, album."""
+    item_id = synthetic_id(number)
+    if number % 5 == 4:
+        return make_gallery_album(item_id, base_url, number)
+    return make_gallery_image(item_id, base_url, number)
+
+
+def make_comment(
+    number, image_id, parent_id=0, depth=0, breadth=0
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Return the json of a synthetic comment.
+
+    :param depth: How many levels of replies to generate below this comment.
+    :param breadth: How many replies each comment has.
+    """
+    comment_id = 100000 + number
+    children = []
+    for i in range(breadth if depth > 0 else 0):
+        child_number = number * (breadth + 1) + i + 1
+        children.append(
+            make_comment(child_number, image_id, comment_id, depth - 1, breadth)
+        )
+    return {
+        "id": comment_id,
+        "image_id": image_id,
+        "comment": f"Synthetic comment {number}",
+        "author": f"user{number % 100}",
+        "author_id": number % 100,
+        "on_album": False,
+        "album_cover": None,
+        "ups": number % 30,
+        "downs": number % 3,
+        "points": number % 30 - number % 3,
+        "datetime": 1700000000 + number,
+        "parent_id": parent_id,
+        "deleted": False,
+        "vote": None,
+        "platform": "desktop",
+        "children": children,
+    }
+
+
+def make_user(username, number=0):
+    """Return the json of a synthetic user."""
+    return {
+        "id": number,
+        "url": username,
+        "bio": None,
+        "avatar": None,
+        "reputation": number * 11,
+        "reputation_name": "Neutral",
+        "created": 1300000000 + number,
+        "pro_expiration": False,
+    }
+
+
+class FakeImgurServer:  # pylint: disable=too-many-instance-attributes
+    """
+    A fake Imgur API served from a background thread.
+
+    :param port: The port to listen on. 0 picks a free port.
+    :param latency: Seconds to wait before answering each request.
+    :param error_rate: Fraction of requests answered with error_status
+        instead of the real response.
+    :param error_status: The status code of injected errors.
+    :param page_size: Number of items on each page of a listing.
+    :param total_items: Number of items in each listing, across all pages.
+    :param ratelimit: The client and user limit sent in the x-ratelimit
+        headers. Requests beyond the limit get a 429 response.
+    :param image_bytes: Size of a downloaded full size image.
+    :param comment_depth: Levels of nested replies on comment listings.
+    :param comment_breadth: Replies per comment on comment listings.
+    :param seed: Seed for the error injection.
+
+    :ivar bytes_received: Total request body bytes received.
+    :ivar bytes_sent: Total response body bytes sent.
+    :ivar requests_served: Number of requests answered.
+    """
+
+    def __init__(
+        self,
+        port=0,
+        latency=0,
+        error_rate=0,
+        error_status=500,
+        page_size=60,
+        total_items=300,
+        ratelimit=12500,
+        image_bytes=500000,
+        comment_depth=2,
+        comment_breadth=3,
+        seed=0,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.page_size = page_size
+        self.total_items = total_items
+        self.ratelimit = ratelimit
+        self.image_bytes = image_bytes
+        self.comment_depth = comment_depth
+        self.comment_breadth = comment_breadth
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._payloads = {}
+        self._thread = None
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._routes = _make_routes(self)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def base_url(self):
+        """The url to set as Imgur.base_url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def page(self, page, make_item):
+        """Return the items on page of a listing built with make_item."""
+        start = page * self.page_size
+        end = min(start + self.page_size, self.total_items)
+        return [make_item(number) for number in range(start, end)]
+
+    def payload(self, size):
+        """Return size bytes of image data. Cached, as it never changes."""
+        if size not in self._payloads:
+            self._payloads[size] = bytes(i % 251 for i in range(size))
+        return self._payloads[size]
+
+    def handle(self, method, path):
+        """
+        Return (status, headers, body) for the request.
+
+        Applies the configured latency, injected errors and ratelimits.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self.requests_served += 1
+            remaining = self.ratelimit - self.requests_served
+            inject_error = self._random.random() < self.error_rate
+
+        headers = {
+            "x-ratelimit-clientlimit": str(self.ratelimit),
+            "x-ratelimit-clientremaining": str(max(remaining, 0)),
+            "x-ratelimit-userlimit": str(self.ratelimit),
+            "x-ratelimit-userremaining": str(max(remaining, 0)),
+            "x-ratelimit-userreset": str(int(time.time()) + 3600),
+        }
+
+        if remaining < 0:
+            return 429, headers, _json_body({"error": "Too Many Requests"}, 429)
+        if inject_error:
+            return (
+                self.error_status,
+                headers,
+                _json_body({"error": "Injected error"}, self.error_status),
+            )
+
+        path = path.split("?", 1)[0]
+        for route_method, regex, handler in self._routes:
+            match = regex.fullmatch(path)
+            if match and route_method == method:
+                result = handler(**match.groupdict())
+                if isinstance(result, bytes):
+                    headers["Content-Type"] = "image/jpeg"
+                    return 200, headers, result
+                return 200, headers, _json_body(result, 200)
+
+        return 404, headers, _json_body({"error": "Unable to find route"}, 404)
+
+
+def _json_body(data, status):
+    return json.dumps({"data": data, "success": status < 400, "status": status}).encode(
+        "utf-8"
+    )
+
+
+def _make_routes(server):  # pylint: disable=too-many-locals
+    """Return the (method, regex, handler) routes served by server."""
+    base = server.base_url
+
+    def listing(page, **_):
+        return server.page(int(page), lambda number: make_gallery_item(number, base))
+
+    def images(page, **_):
+        return server.page(
+            int(page),
+            lambda number: make_image(synthetic_id(number), base, number),
+        )
+
+    def albums(page, **_):
+        return server.page(
+            int(page),
+            lambda number: make_album(synthetic_id(number), base, number, 0),
+        )
+
+    def comments(item_id, page, **_):
+        return server.page(
+            int(page),
+            lambda number: make_comment(
+                number, item_id, 0, server.comment_depth, server.comment_breadth
+            ),
+        )
+
+    def download(suffix="", **_):
+        fraction = THUMBNAIL_FRACTIONS.get(suffix, 1)
+        return server.payload(max(int(server.image_bytes * fraction), 1))
+
+    def uploaded(**_):
+        with server._lock:  # pylint: disable=protected-access
+            number = server.requests_served
+        image = make_image(synthetic_id(10**9 + number), base, number)
+        image["deletehash"] = synthetic_id(2 * 10**9 + number)
+        return image
+
+    def tokens(**_):
+        return {
+            "access_token": "fake_access_token",
+            "refresh_token": "fake_refresh_token",
+            "expires_in": 3600,
+            "token_type": "bearer",
+            "account_username": "fake_user",
+        }
+
+    ident = r"(?P<{}>[\w.]+)"
+    routes = [
+        (
+            "GET",
+            "/3/image/" + ident.format("image_id"),
+            lambda image_id: make_image(image_id, base),
+        ),
+        ("POST", "/3/image/?", uploaded),
+        ("DELETE", "/3/image/" + ident.format("image_id"), lambda **_: True),
+        ("POST", "/3/image/[\\w.]+(/favorite)?", lambda **_: True),
+        (
+            "GET",
+            "/3/album/" + ident.format("album_id"),
+            lambda album_id: make_album(album_id, base),
+        ),
+        ("POST", "/3/album/?", lambda **_: {"id": "newalbm", "deletehash": "dh"}),
+        ("POST", "/3/album/[\\w.]+/(add|remove_images|favorite)", lambda **_: True),
+        ("PUT", "/3/album/[\\w.]+", lambda **_: True),
+        ("DELETE", "/3/album/[\\w.]+", lambda **_: True),
+        (
+            "GET",
+            "/3/gallery/image/" + ident.format("item_id"),
+            lambda item_id: make_gallery_image(item_id, base),
+        ),
+        (
+            "GET",
+            "/3/gallery/album/" + ident.format("item_id"),
+            lambda item_id: make_gallery_album(item_id, base),
+        ),
+        (
+            "GET",
+            "/3/gallery/" + ident.format("item_id") + "/comments/\\w+/(?P<page>\\d+)",
+            comments,
+        ),
+        ("GET", "/3/gallery/.+/(?P<page>\\d+)", listing),
+        (
+            "GET",
+            "/3/gallery/r/\\w+/" + ident.format("item_id"),
+            lambda item_id: make_gallery_image(item_id, base),
+        ),
+        (
+            "GET",
+            "/3/comment/(?P<comment_id>\\d+)",
+            lambda comment_id: make_comment(int(comment_id) - 100000, "fakeimg"),
+        ),
+        (
+            "GET",
+            "/3/comment/(?P<comment_id>\\d+)/replies",
+            lambda comment_id: make_comment(
+                int(comment_id) - 100000, "fakeimg", 0, 1, server.comment_breadth
+            ),
+        ),
+        ("GET", "/3/account/\\w+/images/(?P<page>\\d+)", images),
+        ("GET", "/3/account/\\w+/albums/(?P<page>\\d+)", albums),
+        ("GET", "/3/account/\\w+/(submissions|favorites)/(?P<page>\\d+)", listing),
+        (
+            "GET",
+            "/3/account/\\w+/comments/\\w+/(?P<page>\\d+)",
+            lambda page: comments("fakeimg", page),
+        ),
+        (
+            "GET",
+            "/3/account/\\w+/notifications",
+            lambda: {"messages": [], "replies": []},
+        ),
+        ("GET", "/3/account/\\w+/notifications/\\w+", lambda: []),
+        (
+            "GET",
+            "/3/account/" + ident.format("username"),
+            make_user,
+        ),
+        ("POST", "/oauth2/token", tokens),
+        ("GET", "/download/" + ident.format("image_id") + "/undefined", download),
+        (
+            "GET",
+            "/i/(?P<image_id>\\w{%d})(?P<suffix>[sbtmlh]?)\\.\\w+" % ID_LENGTH,
+            download,
+        ),
+        ("GET", "/i/(?P<image_id>\\w+)\\.\\w+", download),
+    ]
+    return [(method, re.compile(regex), handler) for method, regex, handler in routes]
+
+
+def _make_handler(server):
+    """Return a request handler class serving requests from server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Reads the request, lets server answer it and writes the response."""
+
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately. With Nagle enabled, the
+        # body waits for the client's delayed ACK, adding ~40ms per request.
+        disable_nagle_algorithm = True
+
+        def _respond(self):
+            received = self._read_body()
+            if received is None:
+                # The request was truncated, there's nobody left to answer
+                self.close_connection = True
+                return
+            status, headers, body = server.handle(self.command, self.path)
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            if "Content-Type" not in headers:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            # Count before writing, so the counters are up to date as soon as
+            # the client has the response.
+            with server._lock:  # pylint: disable=protected-access
+                server.bytes_received += received
+                server.bytes_sent += len(body)
+            self.wfile.write(body)
+
+        def _read_body(self):
+            """
+            Read and drop the request body, and return its size.
+
+            None is returned if the client disconnected before sending all of
+            it.
+            """
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                received = 0
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return None
+                    size = int(line.strip() or b"0", 16)
+                    received += size
+                    if len(self.rfile.read(size + 2)) < size + 2:
+                        return None
+                    if size == 0:
+                        return received
+            length = int(self.headers.get("Content-Length", 0))
+            remaining = length
+            while remaining > 0:
+                chunk = self.rfile.read(min(remaining, 65536))
+                if not chunk:
+                    return None
+                remaining -= len(chunk)
+            return length
+
+        do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    return Handler
@@ -0,0 +1,135 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Hooks for observing what happens inside PyImgur.
+
+Register callbacks on Imgur.hooks to be told when requests are sent, retried
+and answered, when the access token is refreshed, and so on. Every callback
+is called with a single dict of information about the event:
+
+    def log_slow_requests(info):
+        if info["elapsed"] > 1:
+            print(f"{info['method']} {info['endpoint']} took {info['elapsed']}s")
+
+    im.hooks.register(AFTER_RESPONSE, log_slow_requests)
+
+The dict given to before_request is given again to after_response for the
+same request, so callbacks can store their own data in it between the two.
+"""
+
+from pyimgur.exceptions import InvalidParameterError
+
+# Called just before a request is sent. Info: method, url, endpoint, attempt.
+BEFORE_REQUEST = "before_request"
+# Called when a request has been answered, or failed with an exception. Info
+# adds elapsed (seconds) and either status_code and bytes_received or error.
+AFTER_RESPONSE = "after_response"
+# Called before a failed request is retried. Info: method, url, endpoint,
+# attempt, status_code and delay (seconds).
+ON_RETRY = "on_retry"
+# Called after the access token has been refreshed. Info: elapsed.
+ON_TOKEN_REFRESH = "on_token_refresh"
+# Called when new ratelimit info has been received. Info: the ratelimit
+# attributes on Imgur, such as ratelimit_clientremaining, and their values.
+ON_RATELIMIT_UPDATE = "on_ratelimit_update"
+# Called when a cache answers instead of Imgur. Info: cache, key.
+ON_CACHE_HIT = "on_cache_hit"
+# Called after each page of a paginated request. Info: url, page, items and
+# duplicates, the number of items dropped as repeats.
+ON_PAGE = "on_page"
+
+EVENTS = (
+    BEFORE_REQUEST,
+    AFTER_RESPONSE,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+    ON_RATELIMIT_UPDATE,
+    ON_CACHE_HIT,
+    ON_PAGE,
+)
+
+API_VERSION = "3"
+
+# Path segments that are part of Imgur's endpoints. Anything else in a path,
+# such as ids, usernames and page numbers, is replaced by {id}.
+ENDPOINT_WORDS = frozenset(
+    """
+    account add album albums all authorize best comment comments day down
+    download favorite favorites follow g gallery gallery_favorites
+    gallery_profile hot image images memes message messages month new newest
+    notification notifications oauth2 oldest r remove_images replies search
+    settings stats submissions tag thread time token top undefined up user
+    verifyemail viral vote votes week worst year
+    """.split()
+)
+
+
+def endpoint_template(url):
+    """
+    Return the endpoint of url with ids replaced by {id}.
+
+    For instance https://api.imgur.com/3/image/abc123 becomes /3/image/{id}.
+    This keeps the number of distinct endpoints small, which is needed when
+    they are used as metric labels.
+    """
+    # Imported here, as urllib.parse is slow to import
+    from urllib.parse import urlparse  # pylint: disable=import-outside-toplevel
+
+    segments = urlparse(url).path.split("/")
+    return "/".join(
+        (
+            segment
+            if not segment
+            or segment in ENDPOINT_WORDS
+            or (index == 1 and segment == API_VERSION)
+            else "{id}"
+        )
+        for index, segment in enumerate(segments)
+    )
+
+
+class Hooks:
+    """The callbacks registered for each event."""
+
+    def __init__(self):
+        self._callbacks = {event: [] for event in EVENTS}
+
+    def __bool__(self):
+        return any(self._callbacks.values())
+
+    def emit(self, event, info):
+        """Call every callback registered for event with info."""
+        for callback in self._callbacks[event]:
+            callback(info)
+
+    def register(self, event, callback):
+        """
+        Call callback whenever event happens.
+
+        :param event: One of the event names in pyimgur.hooks.EVENTS.
+        :param callback: A callable taking a single dict of information.
+
+        :returns: The callback, so it can later be unregistered.
+        """
+        if event not in self._callbacks:
+            raise InvalidParameterError(
+                f"Unknown event {event}. Valid events are: {', '.join(EVENTS)}"
+            )
+        self._callbacks[event].append(callback)
+        return callback
+
+    def unregister(self, event, callback):
+        """Stop calling callback when event happens."""
+        self._callbacks[event].remove(callback)
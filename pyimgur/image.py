@@ -17,16 +17,83 @@
 
 from pathlib import Path
 
-import requests
-
+from pyimgur.bandwidth import limiters_for
 from pyimgur.basic_objects import Basic_object, _change_object
 from pyimgur.exceptions import (
     InvalidParameterError,
     FileOverwriteError,
     UnexpectedImgurException,
 )
+from pyimgur.request import get_default_transport
+from pyimgur.streaming import (
+    DEFAULT_PROGRESS_INTERVAL,
+    READ_CHUNK_SIZE,
+    ProgressReporter,
+)
+from pyimgur.tracing import traced
+
+DOWNLOAD_TIMEOUT_SECONDS = 60
+
+# The thumbnail sizes Imgur offers and the suffix added to the image id for them.
+# See https://api.imgur.com/models/image
+THUMBNAIL_SIZES = {
+    "small_square": "s",
+    "big_square": "b",
+    "small_thumbnail": "t",
+    "medium_thumbnail": "m",
+    "large_thumbnail": "l",
+    "huge_thumbnail": "h",
+}
+
+
+def resolve_size(size):
+    """
+    Return the suffix Imgur uses for the thumbnail size.
 
+    :param size: One of the keys in THUMBNAIL_SIZES. Case and spaces instead
+        of underscores are ignored, so 'Small square' works. None means the
+        original size, which has no suffix.
+    """
+    if size is None:
+        return ""
+    size = size.lower().replace(" ", "_")
+    if size not in THUMBNAIL_SIZES:
+        raise InvalidParameterError(
+            f"Invalid size. Valid options are: {', '.join(THUMBNAIL_SIZES.keys())}"
+        )
+    return THUMBNAIL_SIZES[size]
+
+
+def thumbnail_link(link, size):
+    """Return the url of the thumbnail of size for the image at link."""
+    base, sep, ext = link.rpartition(".")
+    return base + resolve_size(size) + sep + ext
+
+
+def thumbnail_links(images, size):
+    """
+    Return the url of the thumbnail of size for each of the images.
 
+    The size is resolved once for the whole batch, which makes this faster
+    than reading the link_ attribute of every image.
+    """
+    suffix = resolve_size(size)
+    links = []
+    for image in images:
+        base, sep, ext = image.link.rpartition(".")
+        links.append(base + suffix + sep + ext)
+    return links
+
+
+def _thumbnail_property(size):
+    def link_of_size(self):
+        return thumbnail_link(self.link, size)
+
+    link_of_size.__doc__ = f"The URL to a {size.replace('_', ' ')} of the image."
+    return property(link_of_size)
+
+
+@traced
 class Image(Basic_object):  # pylint: disable=too-many-instance-attributes
     """
     An image uploaded to Imgur.
@@ -60,23 +127,32 @@ class Image(Basic_object):  # pylint: disable=too-many-instance-attributes
         self.deletehash = None
         super().__init__(json_dict, imgur, has_fetched)
 
-    def _populate(self, json_dict):
-        super()._populate(json_dict)
-        if "link" in vars(self):
-            base, sep, ext = self.link.rpartition(".")
-            self.link_small_square = base + "s" + sep + ext
-            self.link_big_square = base + "b" + sep + ext
-            self.link_small_thumbnail = base + "t" + sep + ext
-            self.link_medium_thumbnail = base + "m" + sep + ext
-            self.link_large_thumbnail = base + "l" + sep + ext
-            self.link_huge_thumbnail = base + "h" + sep + ext
+    # Computed when read, as most users never need them and building them
+    # for every image in a large listing is wasted work.
+    link_small_square = _thumbnail_property("small_square")
+    link_big_square = _thumbnail_property("big_square")
+    link_small_thumbnail = _thumbnail_property("small_thumbnail")
+    link_medium_thumbnail = _thumbnail_property("medium_thumbnail")
+    link_large_thumbnail = _thumbnail_property("large_thumbnail")
+    link_huge_thumbnail = _thumbnail_property("huge_thumbnail")
 
     def delete(self):
         """Delete the image."""
         url = self._imgur.base_url + f"/3/image/{self._delete_or_id_hash}"
-        return self._imgur.send_request(url, method="DELETE")
-
-    def download(self, path="", name=None, overwrite=False, size=None):
+        resp = self._imgur.send_request(url, method="DELETE")
+        if self._imgur.upload_index is not None:
+            self._imgur.upload_index.discard(self.id)
+        return resp
+
+    def download(
+        self,
+        path="",
+        name=None,
+        overwrite=False,
+        size=None,
+        progress=None,
+        progress_interval=DEFAULT_PROGRESS_INTERVAL,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
         Download the image.
 
@@ -93,7 +169,13 @@ class Image(Basic_object):  # pylint: disable=too-many-instance-attributes
         :param size: Instead of downloading the image in it's original size, we
             can choose to instead download a thumbnail of it. Options are
             'small_square', 'big_square', 'small_thumbnail',
-            'medium_thumbnail', 'large_thumbnail' or 'huge_thumbnail'.
+            'medium_thumbnail', 'large_thumbnail' or 'huge_thumbnail'. The
+            thumbnail is fetched from its link_ url.
+        :param progress: Called with bytes downloaded, total bytes (None if
+            Imgur doesn't say) and the current rate in bytes per second, as
+            the download progresses.
+        :param progress_interval: The minimum number of seconds between calls
+            to progress.
 
         :returns: Name of the new file.
         :raises FileExistsError: If the file already exists and overwrite is False
@@ -105,27 +187,25 @@ class Image(Basic_object):  # pylint: disable=too-many-instance-attributes
                 raise FileOverwriteError(
                     f"Trying to save as {local_path}, but file already exists."
                 )
+            limiters = limiters_for(self._imgur)
+            reporter = None
+            if progress is not None:
+                total = resp.headers.get("Content-Length")
+                reporter = ProgressReporter(
+                    progress, total and int(total), progress_interval
+                )
             with open(local_path, "wb") as out_file:
-                out_file.write(resp.content)
+                for chunk in resp.iter_content(READ_CHUNK_SIZE):
+                    out_file.write(chunk)
+                    for limiter in limiters:
+                        limiter.acquire(len(chunk))
+                    if reporter is not None:
+                        reporter.update(len(chunk))
+            if reporter is not None:
+                reporter.finish()
             return local_path
 
-        valid_sizes = {
-            "small_square": "s",
-            "big_square": "b",
-            "small_thumbnail": "t",
-            "medium_thumbnail": "m",
-            "large_thumbnail": "l",
-            "huge_thumbnail": "h",
-        }
-
-        if size is not None:
-            size = size.lower().replace(" ", "_")
-            if size not in valid_sizes:
-                raise InvalidParameterError(
-                    f"Invalid size. Valid options are: {', '.join(valid_sizes.keys())}"
-                )
-
-        suffix = valid_sizes.get(size, "")
+        suffix = resolve_size(size)
         _, sep, ext = self.link.rpartition(".")
 
         headers = {
@@ -134,9 +214,17 @@ class Image(Basic_object):  # pylint: disable=too-many-instance-attributes
             "referer": "https://imgur.com/gallery/cat-synth-AgnksJY",
         }
 
-        url = f"https://imgur.com/download/{self.id}/undefined"
+        if suffix:
+            # Thumbnails are served directly from the image host. Fetching them
+            # moves only a fraction of the bytes of the original.
+            url = thumbnail_link(self.link, size)
+        else:
+            url = self._imgur.download_url.format(self.id)
         # Should be a way to reuse existing functionality without making things too complicated
-        resp = requests.get(url, headers=headers, stream=True, timeout=60)
+        transport = self._imgur.transport or get_default_transport()
+        resp = transport.request(
+            "GET", url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT_SECONDS
+        )
 
         if resp.status_code != 200:
             raise UnexpectedImgurException(
@@ -0,0 +1,111 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Decode the items of a JSON array while the document is still arriving.
+
+Imgur wraps every response in {"data": ..., "success": ..., "status": ...}.
+For listings, data is an array, which can be large when it holds comment
+threads. iter_array_items decodes its items one at a time from the chunks of
+the response body, so each can be processed and dropped before the rest of
+the body has been received.
+"""
+
+import codecs
+import json
+import re
+
+from pyimgur.exceptions import UnexpectedImgurException
+
+# Enough to hold the start of the document up to the array, unless Imgur
+# changes the order of the keys. Then the whole document is decoded at once.
+MAX_PREFIX_LENGTH = 256
+
+_SEPARATORS = re.compile(r"[\s,]*")
+_WHITESPACE = re.compile(r"\s*")
+
+
+def iter_array_items(chunks, key="data"):
+    """
+    Yield the items of the array at key, as they're decoded from chunks.
+
+    :param chunks: The document as an iterable of bytes, such as
+        response.iter_content().
+    :param key: The key of the array in the top-level object.
+    """
+    prefix = re.compile(r'\s*\{\s*"%s"\s*:\s*\[' % re.escape(key))
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = None
+    # An incomplete item is decoded again once the buffer has grown this
+    # big. Growing it geometrically keeps large items from being decoded over
+    # and over, once per chunk.
+    retry_length = 0
+    finished = False
+
+    while not finished:
+        chunk = next(chunks, None)
+        finished = chunk is None
+        buffer += text_decoder.decode(chunk or b"", final=finished)
+
+        if position is None:
+            match = prefix.match(buffer)
+            if match is None:
+                if finished or len(buffer) > MAX_PREFIX_LENGTH:
+                    yield from _decode_whole(buffer, chunks, text_decoder, key)
+                    return
+                continue
+            position = match.end()
+
+        while finished or len(buffer) >= retry_length:
+            position = _SEPARATORS.match(buffer, position).end()
+            if buffer.startswith("]", position):
+                return
+            if position == len(buffer) and not finished:
+                break
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if finished:
+                    raise
+                retry_length = 2 * len(buffer) - position
+                break
+            if not isinstance(item, (dict, list)):
+                # A number or literal may continue in the next chunk, "2." is
+                # decoded as 2 when ".5" hasn't been received yet. So it's
+                # only complete once the delimiter after it is in the buffer.
+                delimiter = _WHITESPACE.match(buffer, end).end()
+                if buffer[delimiter : delimiter + 1] not in (",", "]"):
+                    if finished:
+                        raise json.JSONDecodeError(
+                            "Expecting ',' delimiter", buffer, delimiter
+                        )
+                    retry_length = len(buffer) + 1
+                    break
+            yield item
+            buffer = buffer[end:]
+            position = 0
+            retry_length = 0
+
+
+def _decode_whole(buffer, chunks, text_decoder, key):
+    """Decode the rest of the document at once and yield the array's items."""
+    rest = "".join(text_decoder.decode(chunk) for chunk in chunks)
+    document = json.loads(buffer + rest + text_decoder.decode(b"", final=True))
+    items = document.get(key) if isinstance(document, dict) else None
+    if not isinstance(items, list):
+        raise UnexpectedImgurException(f"Expected an array at {key!r}")
+    yield from items
@@ -0,0 +1,285 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Keep the metadata of parsed objects in SQLite, to query it offline.
+
+Give a MetadataStore to Imgur and the JSON behind every Image, Album,
+Gallery_album, Gallery_image, Comment and User it parses is saved:
+
+    store = MetadataStore("metadata.sqlite")
+    im = pyimgur.Imgur(client_id, metadata_store=store)
+    im.get_gallery(limit=1000)
+
+Objects are written in one transaction per response, when the next request
+is sent. Call flush or close once done, to write the last ones.
+
+Later, without any requests to Imgur:
+
+    for image in store.query(im, "Gallery_image", tag="cats", since=1700000000):
+        print(image.title)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.image import Image
+from pyimgur.objects import Album, Comment, Gallery_album, Gallery_image, User
+
+STORED_CLASSES = {
+    cls.__name__: cls
+    for cls in (Album, Comment, Gallery_album, Gallery_image, Image, User)
+}
+
+# The JSON fields that hold the id, author and datetime, where they differ
+# from id, account_url and datetime.
+ID_FIELDS = {"User": "url"}
+AUTHOR_FIELDS = {"Comment": "author", "User": "url"}
+DATETIME_FIELDS = {"User": "created"}
+# The JSON fields that aren't stored, as they hold objects that are stored on
+# their own. Each reply to a comment is a Comment, with the parent_id.
+SKIPPED_FIELDS = {"Comment": ("children",)}
+
+# Pending objects are written once there are this many, even if no request is
+# sent, such as while parsing saved responses.
+MAX_PENDING = 1000
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS objects (kind TEXT NOT NULL, id TEXT NOT NULL, "
+    "author TEXT, datetime INTEGER, section TEXT, json TEXT NOT NULL, "
+    "PRIMARY KEY (kind, id))",
+    "CREATE TABLE IF NOT EXISTS tags (kind TEXT NOT NULL, id TEXT NOT NULL, "
+    "tag TEXT NOT NULL, PRIMARY KEY (kind, id, tag))",
+    "CREATE INDEX IF NOT EXISTS objects_author ON objects (author)",
+    "CREATE INDEX IF NOT EXISTS objects_datetime ON objects (datetime)",
+    "CREATE INDEX IF NOT EXISTS objects_section ON objects (section)",
+    "CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag)",
+)
+
+
+def _tag_names(tags):
+    # Gallery items have tags as dicts with a name, accept plain names too
+    return {tag["name"] if isinstance(tag, dict) else str(tag) for tag in tags or ()}
+
+
+def _is_json(value):
+    """Can value be stored as JSON, as Imgur sent it?"""
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json(item) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return all(_is_json(item) for item in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+class MetadataStore:
+    """
+    An SQLite database of the JSON of parsed objects.
+
+    Each object is stored once per class and id. When it's parsed again, such
+    as after a refresh, the new fields are merged into the stored ones, so a
+    partial object never erases what was stored before. Authors, datetimes,
+    sections and tags are indexed for query. Objects that haven't been
+    fetched, such as the author of a comment, hold little more than an id
+    and aren't stored.
+
+    Parsed objects are kept in memory until flush writes them all in one
+    transaction. Imgur calls it before sending each request, and get, query
+    and close call it too.
+    """
+
+    def __init__(self, path):
+        """
+        Open the store, creating the database if needed.
+
+        :param path: The path of the SQLite database.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._loading = threading.local()
+        self._pending = {}
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            for statement in SCHEMA:
+                self._connection.execute(statement)
+
+    def save(self, obj, json_dict):
+        """
+        Store the JSON an object was parsed from, on the next flush.
+
+        Called by the objects as they're parsed. Objects of other classes,
+        objects that haven't been fetched and objects rebuilt by query are
+        ignored, as are values that aren't JSON.
+        """
+        kind = type(obj).__name__
+        object_id = json_dict.get(ID_FIELDS.get(kind, "id"))
+        if (
+            kind not in STORED_CLASSES
+            or object_id is None
+            or not obj._has_fetched  # pylint: disable=protected-access
+            or getattr(self._loading, "active", False)
+        ):
+            return
+
+        skipped = SKIPPED_FIELDS.get(kind, ())
+        fields = {
+            key: value
+            for key, value in json_dict.items()
+            if key not in skipped and _is_json(value)
+        }
+        with self._lock:
+            key = (kind, str(object_id))
+            self._pending[key] = {**self._pending.get(key, {}), **fields}
+            full = len(self._pending) >= MAX_PENDING
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write the objects parsed since the last flush, in one transaction."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            with self._connection:
+                for (kind, object_id), fields in pending.items():
+                    self._write(kind, object_id, fields)
+
+    def _write(self, kind, object_id, fields):
+        row = self._connection.execute(
+            "SELECT json FROM objects WHERE kind = ? AND id = ?", (kind, object_id)
+        ).fetchone()
+        merged = {**json.loads(row[0]), **fields} if row else fields
+        self._connection.execute(
+            "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                kind,
+                object_id,
+                merged.get(AUTHOR_FIELDS.get(kind, "account_url")),
+                merged.get(DATETIME_FIELDS.get(kind, "datetime")),
+                merged.get("section"),
+                json.dumps(merged),
+            ),
+        )
+        if "tags" in fields:
+            self._connection.execute(
+                "DELETE FROM tags WHERE kind = ? AND id = ?", (kind, object_id)
+            )
+            self._connection.executemany(
+                "INSERT INTO tags VALUES (?, ?, ?)",
+                [(kind, object_id, tag) for tag in _tag_names(fields["tags"])],
+            )
+
+    def get(self, imgur, kind, object_id):
+        """
+        Return the stored object of class kind with object_id, or None.
+
+        :param imgur: The Imgur object the rebuilt object belongs to.
+        :param kind: The name of the class, such as "Image" or "User". Users
+            are stored by name.
+        :param object_id: The id of the object.
+        """
+        self._check_kind(kind)
+        self.flush()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT kind, json FROM objects WHERE kind = ? AND id = ?",
+                (kind, str(object_id)),
+            ).fetchone()
+        return None if row is None else self._rebuild(imgur, row)
+
+    def query(
+        self,
+        imgur,
+        kind=None,
+        author=None,
+        section=None,
+        tag=None,
+        since=None,
+        until=None,
+        limit=None,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Return the stored objects matching all the given conditions.
+
+        The objects are rebuilt from the stored JSON without any requests,
+        newest first. Objects nested in them, such as the images of an album,
+        are fetched from Imgur if an attribute they lack is used.
+
+        :param imgur: The Imgur object the rebuilt objects belong to.
+        :param kind: The name of the class of the objects, such as "Image".
+            None for all classes.
+        :param author: The name of the account that posted the objects.
+        :param section: The gallery section, such as a subreddit.
+        :param tag: A tag the objects have.
+        :param since: The earliest datetime, as a unix timestamp.
+        :param until: The latest datetime, as a unix timestamp.
+        :param limit: The maximum number of objects. None for all of them.
+        """
+        conditions = []
+        params = []
+        for column, value in (("kind", kind), ("author", author), ("section", section)):
+            if value is not None:
+                conditions.append(f"objects.{column} = ?")
+                params.append(value)
+        if kind is not None:
+            self._check_kind(kind)
+        if tag is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM tags WHERE tags.kind = objects.kind "
+                "AND tags.id = objects.id AND tags.tag = ?)"
+            )
+            params.append(tag)
+        if since is not None:
+            conditions.append("objects.datetime >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("objects.datetime <= ?")
+            params.append(until)
+
+        sql = "SELECT kind, json FROM objects"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY datetime DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [self._rebuild(imgur, row) for row in rows]
+
+    def close(self):
+        """Write the pending objects and close the database connection."""
+        self.flush()
+        self._connection.close()
+
+    @staticmethod
+    def _check_kind(kind):
+        if kind not in STORED_CLASSES:
+            raise InvalidParameterError(
+                f"kind must be one of {', '.join(sorted(STORED_CLASSES))}"
+            )
+
+    def _rebuild(self, imgur, row):
+        kind, json_text = row
+        # Don't store the objects being rebuilt again
+        self._loading.active = True
+        try:
+            return STORED_CLASSES[kind](json.loads(json_text), imgur, has_fetched=True)
+        finally:
+            self._loading.active = False
@@ -0,0 +1,197 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Export request metrics in the Prometheus / OpenMetrics text format.
+
+    metrics = PrometheusMetrics()
+    metrics.attach(im)
+    ...
+    print(metrics.render())
+
+Requests are labelled with their method and endpoint template, such as
+/3/image/{id}, so ids don't create a new time series per request.
+"""
+
+import threading
+
+from pyimgur.hooks import (
+    AFTER_RESPONSE,
+    ON_CACHE_HIT,
+    ON_RATELIMIT_UPDATE,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+)
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+PREFIX = "pyimgur"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class PrometheusMetrics:  # pylint: disable=too-many-instance-attributes
+    """
+    Collects request metrics from the hooks of one or more Imgur objects.
+
+    :param buckets: Upper bounds, in seconds, of the latency histogram.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._latency = {}
+        self._bytes = {}
+        self._errors = {}
+        self._retries = {}
+        self._cache_hits = {}
+        self._token_refreshes = 0
+        self._ratelimits = {}
+
+    def attach(self, imgur):
+        """Start collecting metrics from the requests imgur sends."""
+        imgur.hooks.register(AFTER_RESPONSE, self._on_response)
+        imgur.hooks.register(ON_RETRY, self._on_retry)
+        imgur.hooks.register(ON_TOKEN_REFRESH, self._on_token_refresh)
+        imgur.hooks.register(ON_RATELIMIT_UPDATE, self._on_ratelimit_update)
+        imgur.hooks.register(ON_CACHE_HIT, self._on_cache_hit)
+
+    def _on_response(self, info):
+        key = (info["method"], info["endpoint"])
+        with self._lock:
+            # Per bucket counts, then sum and count
+            latency = self._latency.setdefault(key, [0] * len(self.buckets) + [0, 0])
+            for index, bound in enumerate(self.buckets):
+                if info["elapsed"] <= bound:
+                    latency[index] += 1
+            latency[-2] += info["elapsed"]
+            latency[-1] += 1
+            self._bytes[key] = self._bytes.get(key, 0) + info.get("bytes_received", 0)
+
+            if "error" in info:
+                error_key = key + (type(info["error"]).__name__,)
+            elif info["status_code"] >= 400:
+                error_key = key + (str(info["status_code"]),)
+            else:
+                return
+            self._errors[error_key] = self._errors.get(error_key, 0) + 1
+
+    def _on_retry(self, info):
+        key = (info["method"], info["endpoint"])
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def _on_token_refresh(self, _):
+        with self._lock:
+            self._token_refreshes += 1
+
+    def _on_ratelimit_update(self, info):
+        with self._lock:
+            self._ratelimits.update(info)
+
+    def _on_cache_hit(self, info):
+        key = (info["cache"],)
+        with self._lock:
+            self._cache_hits[key] = self._cache_hits.get(key, 0) + 1
+
+    def render(self, openmetrics=False):
+        """
+        Return the metrics in the Prometheus text exposition format.
+
+        :param openmetrics: If True, return the OpenMetrics text format
+            instead. The two differ in how counters are declared and in the
+            terminating # EOF line.
+        """
+        lines = []
+
+        def family(name, kind, description):
+            # OpenMetrics declares counters without the _total suffix
+            declared = name if openmetrics or kind != "counter" else name + "_total"
+            lines.append(f"# HELP {PREFIX}_{declared} {description}")
+            lines.append(f"# TYPE {PREFIX}_{declared} {kind}")
+
+        def counter(name, description, values, label_names):
+            family(name, "counter", description)
+            for key, value in sorted(values.items()):
+                labels = _labels(**dict(zip(label_names, key)))
+                lines.append(f"{PREFIX}_{name}_total{labels} {value}")
+
+        with self._lock:
+            family(
+                "request_duration_seconds",
+                "histogram",
+                "Time from sending a request to receiving the response.",
+            )
+            for (method, endpoint), values in sorted(self._latency.items()):
+                for bound, count in zip(self.buckets, values):
+                    labels = _labels(method=method, endpoint=endpoint, le=bound)
+                    lines.append(
+                        f"{PREFIX}_request_duration_seconds_bucket{labels} {count}"
+                    )
+                labels = _labels(method=method, endpoint=endpoint, le="+Inf")
+                lines.append(
+                    f"{PREFIX}_request_duration_seconds_bucket{labels} {values[-1]}"
+                )
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append(
+                    f"{PREFIX}_request_duration_seconds_sum{labels} {values[-2]}"
+                )
+                lines.append(
+                    f"{PREFIX}_request_duration_seconds_count{labels} {values[-1]}"
+                )
+
+            counter(
+                "response_bytes",
+                "Bytes received in response bodies.",
+                self._bytes,
+                ("method", "endpoint"),
+            )
+            counter(
+                "request_errors",
+                "Requests answered with an error status or failed with an exception.",
+                self._errors,
+                ("method", "endpoint", "error"),
+            )
+            counter(
+                "request_retries",
+                "Requests retried after a transient error.",
+                self._retries,
+                ("method", "endpoint"),
+            )
+            counter(
+                "cache_hits",
+                "Requests answered from a cache.",
+                self._cache_hits,
+                ("cache",),
+            )
+            family("token_refreshes", "counter", "Access token refreshes.")
+            lines.append(f"{PREFIX}_token_refreshes_total {self._token_refreshes}")
+
+            family("ratelimit", "gauge", "Latest ratelimit values reported by Imgur.")
+            for name, value in sorted(self._ratelimits.items()):
+                lines.append(f"{PREFIX}_ratelimit{_labels(name=name)} {value}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,302 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Keep a local mirror of an account's images up to date."""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+from pyimgur.bulk import _run_all
+from pyimgur.image import Image
+
+DEFAULT_SYNC_WORKERS = 8
+MANIFEST_NAME = ".pyimgur-manifest.sqlite"
+
+
+class Manifest:
+    """
+    The images and albums of a mirror, kept in an SQLite database.
+
+    Images are stored with their datetime and size on Imgur, to tell when
+    they change, and the path of their local copy. Albums are stored with
+    the ids of their images.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS images (id TEXT PRIMARY KEY, "
+                "datetime INTEGER, size INTEGER, path TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS albums (id TEXT PRIMARY KEY, "
+                "datetime INTEGER, images_count INTEGER, image_ids TEXT NOT NULL)"
+            )
+
+    def images(self):
+        """Return a dict from image id to its (datetime, size, path)."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, datetime, size, path FROM images"
+            ).fetchall()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def albums(self):
+        """Return a dict from album id to its (datetime, images_count, image_ids)."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, datetime, images_count, image_ids FROM albums"
+            ).fetchall()
+        return {row[0]: (row[1], row[2], json.loads(row[3])) for row in rows}
+
+    def set_image(self, image_id, datetime, size, path):
+        """Store the local copy of an image."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?)",
+                (image_id, datetime, size, os.fspath(path)),
+            )
+
+    def set_album(
+        self, album_id, datetime, images_count, image_ids
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Store the images of an album."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO albums VALUES (?, ?, ?, ?)",
+                (album_id, datetime, images_count, json.dumps(image_ids)),
+            )
+
+    def delete_image(self, image_id):
+        """Remove an image from the manifest."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM images WHERE id = ?", (image_id,))
+
+    def delete_album(self, album_id):
+        """Remove an album from the manifest."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM albums WHERE id = ?", (album_id,))
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+
+class SyncReport:  # pylint: disable=too-few-public-methods
+    """
+    What a sync of a mirror did.
+
+    :ivar deleted: The ids of the images whose local copy was deleted, as
+        they're no longer on the account.
+    :ivar downloaded: A TransferResult per image downloaded, with the local
+        path as value.
+    :ivar failed: A TransferResult per image download or album fetch that
+        failed. They're retried on the next sync.
+    :ivar unchanged: The number of images whose local copy was up to date.
+    """
+
+    def __init__(self):
+        self.deleted = []
+        self.downloaded = []
+        self.failed = []
+        self.unchanged = 0
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} downloaded={len(self.downloaded)} "
+            f"deleted={len(self.deleted)} failed={len(self.failed)} "
+            f"unchanged={self.unchanged}>"
+        )
+
+
+class AccountMirror:  # pylint: disable=too-few-public-methods
+    """
+    A local copy of the images of an account, and of its albums.
+
+    Every image is saved once in path, named by its id, however many albums
+    it's in. A manifest in the same folder remembers what was downloaded, so
+    a sync only fetches the images that are new or changed since the last
+    one, and deletes the local copies of images removed from the account.
+
+        mirror = AccountMirror(im.get_user("me"), "backup")
+        print(mirror.sync())
+
+    Albums are only fetched again when their datetime or number of images
+    changes.
+    """
+
+    def __init__(self, user, path, max_workers=DEFAULT_SYNC_WORKERS):
+        """
+        Create the mirror, or open it if it exists.
+
+        :param user: The User whose images are mirrored.
+        :param path: The folder the images are saved in. It's created if
+            needed.
+        :param max_workers: The number of downloads running at the same time.
+        """
+        self.user = user
+        self.path = os.fspath(path)
+        self.max_workers = max_workers
+        os.makedirs(self.path, exist_ok=True)
+        self.manifest = Manifest(os.path.join(self.path, MANIFEST_NAME))
+
+    def sync(self):
+        """
+        Bring the mirror up to date with the account.
+
+        Nothing is deleted unless the account's images and albums were all
+        listed, so a failed sync never removes local copies by mistake.
+
+        :returns: A SyncReport.
+        """
+        # pylint: disable-next=protected-access
+        imgur = self.user._imgur
+        account_url = f"{imgur.base_url}/3/account/{self.user.name}"
+        report = SyncReport()
+
+        known = self.manifest.images()
+        # Every item is needed, as missing ones would be removed locally
+        remote = {
+            image["id"]: image
+            for image in imgur.iter_request(
+                account_url + "/images/{}", limit=sys.maxsize, dedupe=True
+            )
+        }
+        album_image_ids, fetched_albums = self._sync_albums(
+            imgur,
+            {
+                album["id"]: album
+                for album in imgur.iter_request(
+                    account_url + "/albums/{}", limit=sys.maxsize, dedupe=True
+                )
+            },
+            remote,
+            known,
+            report,
+        )
+
+        to_download = []
+        for image_id, image in remote.items():
+            local = known.get(image_id)
+            if _has_copy(local) and local[:2] == (
+                image.get("datetime"),
+                image.get("size"),
+            ):
+                report.unchanged += 1
+            else:
+                to_download.append(image)
+        # Images of unchanged albums aren't in remote. _sync_albums fetched
+        # every album with an image missing locally, so these are all there.
+        report.unchanged += len(album_image_ids - remote.keys())
+
+        for result in _run_all(
+            lambda image: self._download(imgur, image), to_download, self.max_workers
+        ):
+            (report.downloaded if result.ok else report.failed).append(result)
+        self._record_albums(fetched_albums, report)
+
+        for image_id, (_, _, local_path) in known.items():
+            if image_id not in remote and image_id not in album_image_ids:
+                try:
+                    os.remove(local_path)
+                except FileNotFoundError:
+                    pass
+                self.manifest.delete_image(image_id)
+                report.deleted.append(image_id)
+        return report
+
+    def _download(self, imgur, image):
+        local_path = Image(image, imgur).download(
+            path=self.path, name=image["id"], overwrite=True
+        )
+        self.manifest.set_image(
+            image["id"], image.get("datetime"), image.get("size"), local_path
+        )
+        return local_path
+
+    def _record_albums(self, fetched_albums, report):
+        """
+        Store the fetched albums whose images all have a local copy.
+
+        An album with images that failed to download isn't stored, so it's
+        fetched again on the next sync.
+        """
+        failed_ids = {result.item["id"] for result in report.failed}
+        for album, image_ids in fetched_albums:
+            if failed_ids.isdisjoint(image_ids):
+                self.manifest.set_album(
+                    album["id"],
+                    album.get("datetime"),
+                    album.get("images_count"),
+                    image_ids,
+                )
+
+    def _sync_albums(
+        self, imgur, albums, remote, known_images, report
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        """
+        Fetch the albums that changed and add their images to remote.
+
+        Albums with an image that has no local copy are fetched again too.
+        Return the ids of the images in all albums, and a list of the fetched
+        albums with the ids of their images.
+        """
+        known = self.manifest.albums()
+        changed = [
+            album
+            for album_id, album in albums.items()
+            if album_id not in known
+            or known[album_id][:2] != (album.get("datetime"), album.get("images_count"))
+            or not all(
+                _has_copy(known_images.get(image_id)) for image_id in known[album_id][2]
+            )
+        ]
+        results = _run_all(
+            lambda album: imgur.send_request(f"{imgur.base_url}/3/album/{album['id']}"),
+            changed,
+            self.max_workers,
+        )
+
+        image_ids = set()
+        fetched = []
+        for result in results:
+            if not result.ok:
+                report.failed.append(result)
+                continue
+            images = result.value.get("images") or []
+            for image in images:
+                remote.setdefault(image["id"], image)
+            fetched.append((result.item, [image["id"] for image in images]))
+            image_ids.update(image["id"] for image in images)
+
+        fetched_ids = {album["id"] for album, _ in fetched}
+        for album_id, (_, _, album_image_ids) in known.items():
+            if album_id not in albums:
+                self.manifest.delete_album(album_id)
+            elif album_id not in fetched_ids:
+                # Unchanged, or its fetch failed. Keep the images it had.
+                image_ids.update(album_image_ids)
+        return image_ids, fetched
+
+
+def _has_copy(local):
+    """Is there a local copy of an image, given its row in the manifest?"""
+    return local is not None and os.path.exists(local[2])
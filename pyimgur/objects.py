@@ -20,11 +20,16 @@ each object. However, they reference each other and attempts to
 move them into multiple files have failed on circular imports.
 """
 
+import sys
+
 from pyimgur.basic_objects import Basic_object, _change_object
+from pyimgur.comment_tree import CommentTree
 from pyimgur.image import Image
 from pyimgur.exceptions import InvalidParameterError
+from pyimgur.tracing import traced
 
 
+@traced
 class Album(Basic_object):  # pylint: disable=too-many-instance-attributes
     """
     An album is a collection of images.
@@ -220,6 +225,7 @@ class Album(Basic_object):  # pylint: disable=too-many-instance-attributes
         return is_updated
 
 
+@traced
 class Comment(Basic_object):
     """
     A comment a user has made.
@@ -315,6 +321,7 @@ class Comment(Basic_object):
         return self._imgur.send_request(url, needs_auth=True, method="POST")
 
 
+@traced
 class Notification(Basic_object):
     """
     This corresponds to the notifications a user may receive.
@@ -346,6 +353,7 @@ class Notification(Basic_object):
         return self._imgur.send_request(url, method="POST")
 
 
+@traced
 class Message(Basic_object):
     """This corresponds to the messages users can send each other."""
 
@@ -392,6 +400,7 @@ class Message(Basic_object):
         return self.author.send_message(body=body, reply_to=self.id)
 
 
+@traced
 class Gallery_item:  # pylint: disable=invalid-name
     """Functionality shared by Gallery_image and Gallery_album."""
 
@@ -428,6 +437,39 @@ class Gallery_item:  # pylint: disable=invalid-name
         resp = self._imgur.send_request(url, limit=limit)
         return [Comment(com, self._imgur) for com in resp]
 
+    def iter_comments(self, sort="new", limit=None):
+        """
+        Yield the top-level comments as they're received.
+
+        Like get_comments, but each comment, with its replies, is decoded and
+        yielded as soon as it has arrived, so large threads can be processed
+        without holding all of them in memory.
+        """
+        if sort not in (None, "best", "top", "new"):
+            raise InvalidParameterError("sort must be None, 'best', 'top', or 'new'")
+
+        url = self._imgur.base_url + f"/3/gallery/{self.id}/comments/{sort}/{{}}"
+        for com in self._imgur.iter_request(url, limit=limit):
+            yield Comment(com, self._imgur)
+
+    def get_comment_tree(self, sort="new", limit=None):
+        """
+        Get all comments as a CommentTree.
+
+        Unlike get_comments, no Comment is built until it's accessed. Use
+        this for large threads.
+
+        :param sort: See get_comments.
+        :param limit: The maximum number of top-level comments to get. If
+            None, every comment is fetched.
+        """
+        if sort not in (None, "best", "top", "new"):
+            raise InvalidParameterError("sort must be None, 'best', 'top', or 'new'")
+
+        url = self._imgur.base_url + f"/3/gallery/{self.id}/comments/{sort}/{{}}"
+        resp = self._imgur.send_request(url, limit=limit or sys.maxsize)
+        return CommentTree(resp, lambda json: Comment(json, self._imgur))
+
     @staticmethod
     def get_album_or_image(json, imgur):
         """Return a gallery image/album depending on what the json represent."""
@@ -491,6 +533,7 @@ class Gallery_image(Image, Gallery_item):  # pylint: disable=invalid-name
             del self.account_url
 
 
+@traced
 class User(Basic_object):
     """
     A User on Imgur.
@@ -0,0 +1,180 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Poll a user's notifications, yielding only the ones not seen before."""
+
+import threading
+
+from pyimgur.bulk import _run_all
+from pyimgur.exceptions import MarkViewedError
+from pyimgur.objects import Comment, Message, Notification
+from pyimgur.stores import MemoryStore
+
+DEFAULT_MIN_INTERVAL = 5
+DEFAULT_MAX_INTERVAL = 300
+DEFAULT_BACKOFF = 2
+DEFAULT_MARK_WORKERS = 4
+
+# Key of the high-water mark of a user in the store
+HIGH_WATER_MARK_KEY = "notifications:{}"
+
+
+class NotificationPoller:  # pylint: disable=too-many-instance-attributes
+    """
+    Poll the notifications of the authenticated user for new ones.
+
+    The id and datetime of the newest notification handled is kept in store as
+    a high-water mark, so notifications are only yielded once, also across
+    restarts when the store is persistent. The mark is moved past a
+    notification once the next one is requested, so a notification whose
+    processing crashed is yielded again by the next poller. While no new
+    notifications arrive,
+    the poll interval grows by backoff, up to max_interval. It drops back to
+    min_interval as soon as there are new ones.
+
+        poller = NotificationPoller(im.get_user("me"), JSONFileStore("seen"))
+        for notification in poller:
+            print(notification.content)
+
+    :ivar interval: The number of seconds until the next poll.
+    :ivar high_water_mark: A dict with the id and datetime of the newest
+        notification seen, or None if none has been seen.
+    """
+
+    def __init__(
+        self,
+        user,
+        store=None,
+        mark_viewed=True,
+        min_interval=DEFAULT_MIN_INTERVAL,
+        max_interval=DEFAULT_MAX_INTERVAL,
+        backoff=DEFAULT_BACKOFF,
+        max_workers=DEFAULT_MARK_WORKERS,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Create the poller.
+
+        :param user: The User to poll notifications of. Must be the
+            authenticated user.
+        :param store: A store from pyimgur.stores to keep the high-water mark
+            in. Defaults to a store in memory.
+        :param mark_viewed: Mark each batch of new notifications as viewed on
+            Imgur, concurrently, once all of them have been yielded. Failures
+            raise MarkViewedError.
+        :param min_interval: The poll interval in seconds while notifications
+            keep arriving.
+        :param max_interval: The longest poll interval in seconds.
+        :param backoff: The factor the interval grows by after an idle poll.
+        :param max_workers: The number of notifications marked as viewed at
+            the same time.
+        """
+        self.user = user
+        self.store = MemoryStore() if store is None else store
+        self.mark_viewed = mark_viewed
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.interval = min_interval
+        self._key = HIGH_WATER_MARK_KEY.format(user.name)
+        self._stopped = threading.Event()
+
+    def __iter__(self):
+        """
+        Poll until stop is called, yielding new notifications, oldest first.
+
+        Iteration ends with MarkViewedError if a batch couldn't be marked as
+        viewed.
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            yield from self.poll()
+            self._stopped.wait(self.interval)
+
+    @property
+    def high_water_mark(self):
+        """The id and datetime of the newest notification seen."""
+        return self.store.get(self._key)
+
+    def poll(self):
+        """
+        Fetch the notifications once and yield the new ones, oldest first.
+
+        The poll interval is adjusted right away. The high-water mark is moved
+        past each notification once the next one is requested, and the batch
+        is marked as viewed after the last one.
+
+        The content of notifications about replies is a Comment and the
+        content of notifications about messages is a Message.
+
+        :raises MarkViewedError: If some notifications couldn't be marked as
+            viewed. The high-water mark has already moved past them.
+        """
+        # pylint: disable-next=protected-access
+        imgur = self.user._imgur
+        url = f"{imgur.base_url}/3/account/{self.user.name}/notifications"
+        resp = imgur.send_request(url, params={"new": True}, needs_auth=True)
+
+        mark = self.high_water_mark
+        last_id = mark["id"] if mark else -1
+        new = sorted(
+            (
+                _notification(notification, imgur, content_class)
+                for key, content_class in (("replies", Comment), ("messages", Message))
+                for notification in resp[key]
+                if notification["id"] > last_id
+            ),
+            key=lambda notification: notification.id,
+        )
+
+        if not new:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+            return
+
+        self.interval = self.min_interval
+        for notification in new:
+            yield notification
+            self.store.set(
+                self._key,
+                {
+                    "id": notification.id,
+                    "datetime": getattr(notification.content, "datetime", None),
+                },
+            )
+
+        if self.mark_viewed:
+            results = _run_all(
+                lambda notification: notification.mark_as_viewed(),
+                new,
+                self.max_workers,
+            )
+            failed = [result for result in results if not result.ok]
+            if failed:
+                raise MarkViewedError(
+                    f"{len(failed)} notifications couldn't be marked as viewed",
+                    failed,
+                )
+
+    def stop(self):
+        """Make iteration end, after the current poll or wait."""
+        self._stopped.set()
+
+
+def _notification(json_dict, imgur, content_class):
+    """Build a Notification, with content built as content_class."""
+    notification = Notification(json_dict, imgur)
+    if isinstance(getattr(notification, "content", None), dict):
+        notification.content = content_class(notification.content, imgur)
+    return notification
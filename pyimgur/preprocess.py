@@ -0,0 +1,124 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Shrink images before they are uploaded.
+
+Imgur recompresses large images anyway, so uploading them at full size wastes
+bandwidth. A Preprocessor downscales, strips metadata and re-encodes images
+in memory, ready to be passed to Imgur.upload_image.
+
+Preprocessing requires Pillow. Install it with pip install pyimgur[preprocess]
+
+    from pyimgur.preprocess import Preprocessor
+
+    shrink = Preprocessor(max_dimension=2048, format="JPEG", quality=85)
+    im.upload_image("huge.png", preprocessor=shrink)
+"""
+
+import io
+
+# Image info that's needed to display the image correctly, not metadata
+KEPT_INFO = ("transparency",)
+
+# Formats that can't store an alpha channel or a palette
+RGB_ONLY_FORMATS = ("JPEG",)
+
+
+class Preprocessor:
+    """
+    Downscale, strip metadata and re-encode images before upload.
+
+    A Preprocessor only holds its settings, so it can be sent to worker
+    processes as is.
+
+    :ivar format: The Pillow format to re-encode to, such as "JPEG" or
+        "WEBP". None keeps the original format.
+    :ivar max_dimension: Images wider or taller than this many pixels are
+        downscaled to fit, keeping their aspect ratio. None never downscales.
+    :ivar quality: The encoder quality for lossy formats. None uses Pillow's
+        default.
+    :ivar strip_metadata: Drop EXIF, ICC profiles and other metadata. The
+        EXIF orientation is applied to the pixels first, so the image is
+        still shown the right way up.
+    """
+
+    def __init__(
+        self,
+        max_dimension=None,
+        format=None,  # pylint: disable=redefined-builtin
+        quality=None,
+        strip_metadata=True,
+    ):
+        self.max_dimension = max_dimension
+        self.format = format
+        self.quality = quality
+        self.strip_metadata = strip_metadata
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} max_dimension={self.max_dimension} "
+            f"format={self.format} quality={self.quality} "
+            f"strip_metadata={self.strip_metadata}>"
+        )
+
+    def __call__(self, source):
+        """
+        Return the processed image.
+
+        :param source: The image, as a path, bytes or a file object opened in
+            binary mode.
+
+        :returns: The processed image in a BytesIO, positioned at the start.
+        """
+        pil_image, pil_image_ops = _import_pillow()
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+
+        with pil_image.open(source) as image:
+            output_format = (self.format or image.format).upper()
+            save_options = {}
+            if self.strip_metadata:
+                image = pil_image_ops.exif_transpose(image)
+                image.info = {
+                    key: value for key, value in image.info.items() if key in KEPT_INFO
+                }
+            else:
+                for key in ("exif", "icc_profile"):
+                    if key in image.info:
+                        save_options[key] = image.info[key]
+
+            if self.max_dimension:
+                image.thumbnail((self.max_dimension, self.max_dimension))
+            if output_format in RGB_ONLY_FORMATS and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            if self.quality is not None:
+                save_options["quality"] = self.quality
+
+            output = io.BytesIO()
+            image.save(output, format=output_format, **save_options)
+        output.seek(0)
+        return output
+
+
+def _import_pillow():
+    try:
+        # pylint: disable=import-outside-toplevel
+        from PIL import Image, ImageOps
+    except ImportError as e:
+        raise ImportError(
+            "Preprocessing requires Pillow. Install it with "
+            "pip install pyimgur[preprocess]"
+        ) from e
+    return Image, ImageOps
@@ -20,20 +20,32 @@ import os
 import time
 import random
 
-import requests
-
 from pyimgur.exceptions import (
     UnexpectedImgurException,
     InvalidParameterError,
     ResourceNotFoundError,
     ImgurIsDownException,
 )
+from pyimgur.hooks import AFTER_RESPONSE, BEFORE_REQUEST, ON_RETRY, endpoint_template
+from pyimgur.jsonstream import iter_array_items
+from pyimgur.transport import RequestsTransport
 
 MAX_RETRIES = 3
 RETRY_CODES = [500]
 
 VERIFY_SSL = os.getenv("PYIMGUR_VERIFY_SSL", "True").lower() == "true"
 TIMEOUT_SECONDS = int(os.getenv("PYIMGUR_TIMEOUT", "30"))
+STREAM_CHUNK_SIZE = 16 * 1024
+
+_DEFAULT_TRANSPORT = None
+
+
+def get_default_transport():
+    """Return the transport used when none is given. Created on first use."""
+    global _DEFAULT_TRANSPORT  # pylint: disable=global-statement
+    if _DEFAULT_TRANSPORT is None:
+        _DEFAULT_TRANSPORT = RequestsTransport()
+    return _DEFAULT_TRANSPORT
 
 
 def send_request(
@@ -41,7 +53,9 @@ def send_request(
     content_to_send=None,
     headers=None,
     method="GET",
-):
+    transport=None,
+    hooks=None,
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
     """Send a request to the Imgur API.
 
     Note that a lot is also handled in the send_request method inside the __init__.py file.
@@ -51,14 +65,81 @@ def send_request(
         params: Optional dictionary of parameters to send with the request.
         method: HTTP method to use ('GET', 'POST', 'PUT'). Defaults to 'GET'.
         headers: Headers to send with the request.
+        transport: The transport that performs the request. Defaults to the
+            shared RequestsTransport.
+        hooks: The Hooks to emit request events on.
 
     """
 
     if content_to_send is None:
         content_to_send = {}
 
-    response = perform_request(url, method, content_to_send, headers)
+    response = perform_request(
+        url, method, content_to_send, headers, transport=transport, hooks=hooks
+    )
+    return parse_response(response, url)
+
+
+def stream_request(url, headers=None, transport=None, hooks=None):
+    """Send a GET request, whose data array is decoded as it arrives.
+
+    The response is checked for errors, which are raised right away. The
+    body is then decoded incrementally with jsonstream.iter_array_items, so
+    items can be processed before the whole body has been received.
+
+    Args:
+        url: The API endpoint URL to send the request to.
+        headers: Headers to send with the request.
+        transport: The transport that performs the request.
+        hooks: The Hooks to emit request events on.
+
+    Returns:
+        StreamedItems over the items of the data array, and the ratelimit
+        info. Close the StreamedItems if it's not read to the end.
+
+    """
+    response = perform_request(
+        url, "GET", {}, headers, transport=transport, hooks=hooks, stream=True
+    )
+    if not response.ok:
+        try:
+            parse_response(response, url)
+        finally:
+            response.close()
 
+    return StreamedItems(response), _ratelimit_info(response)
+
+
+class StreamedItems:
+    """
+    Iterate over the data array of a streamed response.
+
+    The response is closed once the items run out, or when close is called,
+    so its connection goes back to the pool.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self._items = iter_array_items(response.iter_content(STREAM_CHUNK_SIZE))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._items)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """Stop reading the items and release the response."""
+        self._items.close()
+        self._response.close()
+
+
+def parse_response(response, url):
+    """Raise the error in response, or return its data and ratelimit info."""
     if response.status_code == 404:
         raise ResourceNotFoundError(f"Resource not found: {url}")
 
@@ -77,42 +158,132 @@ def send_request(
         )
         raise UnexpectedImgurException(error_msg, response=response)
 
-    ratelimit_info = dict(
+    return content, _ratelimit_info(response)
+
+
+def _ratelimit_info(response):
+    return dict(
         (k, int(v))
         for (k, v) in response.headers.items()
         if k.startswith("x-ratelimit")
     )
 
-    return content, ratelimit_info
 
+def is_transient_error(error):
+    """Is error likely to go away if the request is sent again?"""
+    if isinstance(error, ImgurIsDownException):
+        return True
+    if isinstance(error, UnexpectedImgurException):
+        return error.response is not None and error.response.status_code >= 500
+    # Network errors from requests are OSErrors too. Local file errors aren't
+    # going to fix themselves.
+    return isinstance(error, OSError) and not isinstance(
+        error, (FileNotFoundError, IsADirectoryError, PermissionError)
+    )
+
+
+def perform_request(
+    url, method, content_to_send, headers, transport=None, hooks=None, stream=False
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    """Perform the actual request to the Imgur API with retries.
 
-def perform_request(url, method, content_to_send, headers):
-    """Perform the actual request to the Imgur API with retries."""
+    With stream, the body isn't read before the response is returned.
+    """
     if method not in ["GET", "POST", "PUT", "DELETE"]:
         raise InvalidParameterError("Unsupported Method used")
 
+    if transport is None:
+        transport = get_default_transport()
+
     tries = 0
     backoff = 1
 
+    request_kwargs = {
+        "params": content_to_send.get("params", None),
+        "data": content_to_send.get("data", None),
+        "json": content_to_send.get("json", None),
+        "files": content_to_send.get("files", None),
+        "headers": {**(headers or {}), **content_to_send.get("headers", {})},
+        "verify": VERIFY_SSL,
+        "timeout": TIMEOUT_SECONDS,
+    }
+    if stream:
+        request_kwargs["stream"] = True
+    # Uploaded file objects are read to the end by each attempt
+    file_starts = [
+        (file, file.tell())
+        for _, file in request_kwargs["files"] or ()
+        if hasattr(file, "seek")
+    ]
+
     while tries <= MAX_RETRIES:
-        response = requests.request(
-            method,
-            url,
-            params=content_to_send.get("params", None),
-            data=content_to_send.get("data", None),
-            json=content_to_send.get("json", None),
-            files=content_to_send.get("files", None),
-            headers=headers,
-            verify=VERIFY_SSL,
-            timeout=TIMEOUT_SECONDS,
-        )
+        if hasattr(request_kwargs["data"], "seek"):
+            # A streamed body is used up by the previous attempt
+            request_kwargs["data"].seek(0)
+        for file, start in file_starts:
+            file.seek(start)
+
+        if hooks:
+            info = {
+                "method": method,
+                "url": url,
+                "endpoint": endpoint_template(url),
+                "attempt": tries,
+            }
+            response = _request_with_hooks(
+                transport, hooks, info, method, url, request_kwargs
+            )
+        else:
+            response = transport.request(method, url, **request_kwargs)
 
-        if response.status_code in RETRY_CODES or response.content == "":
+        if response.status_code in RETRY_CODES or (
+            not stream and response.content == ""
+        ):
             tries += 1
             delay = backoff * (2**tries) + random.uniform(0, 0.5)
+            if hooks:
+                hooks.emit(
+                    ON_RETRY,
+                    {
+                        "method": method,
+                        "url": url,
+                        "endpoint": endpoint_template(url),
+                        "attempt": tries,
+                        "status_code": response.status_code,
+                        "delay": delay,
+                    },
+                )
+            if stream and tries <= MAX_RETRIES:
+                # Release the connection of the response that's thrown away
+                response.close()
             time.sleep(delay)
 
         else:
             break
 
     return response
+
+
+def _request_with_hooks(
+    transport, hooks, info, method, url, request_kwargs
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Send the request with transport, emitting the request hooks around it."""
+    hooks.emit(BEFORE_REQUEST, info)
+    start = time.perf_counter()
+    try:
+        response = transport.request(method, url, **request_kwargs)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        info["elapsed"] = time.perf_counter() - start
+        info["error"] = e
+        hooks.emit(AFTER_RESPONSE, info)
+        raise
+
+    info["elapsed"] = time.perf_counter() - start
+    info["status_code"] = response.status_code
+    if request_kwargs.get("stream"):
+        # Reading the body here would defeat streaming it
+        info["bytes_received"] = int(response.headers.get("Content-Length", 0))
+    else:
+        info["bytes_received"] = len(response.content)
+    hooks.emit(AFTER_RESPONSE, info)
+    return response
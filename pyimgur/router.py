@@ -0,0 +1,59 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Work out which object an Imgur url points to, from the url alone."""
+
+import re
+from urllib.parse import urlparse
+
+IMGUR_URL = re.compile(r"(https?://)?(www\.|m\.|i\.)?imgur\.com", re.I)
+
+# Tried in order, the first match wins. A comment url is also a gallery url.
+ROUTES = [
+    ("album", re.compile(r"/a/(?P<id>[\w.]+)/?$")),
+    ("comment", re.compile(r"/gallery/\w*/comment/(?P<id>[\w.]+)/?$")),
+    ("gallery", re.compile(r"/(gallery|r/\w+)/(?P<id>[\w.]+)/?$")),
+    # Valid image extensions: http://imgur.com/faq#types
+    # All are between 3 and 4 chars long.
+    ("image", re.compile(r"/(?P<id>[\w.]+?)(\.\w{3,4})?$")),
+    ("user", re.compile(r"/user/(?P<id>[\w.]+)/?$")),
+]
+
+
+def is_imgur_url(url):
+    """Is the given url a valid Imgur url?"""
+    return IMGUR_URL.match(url) is not None
+
+
+def route(url):
+    """
+    Return the kind of object at url and its id.
+
+    The kind is one of the names in ROUTES. Gallery and image urls can point
+    to several types of object, which can only be told apart by asking Imgur.
+
+    :returns: A (kind, id) tuple, or None if url isn't an Imgur url of a known
+        format.
+    """
+    if not is_imgur_url(url):
+        return None
+    if "://" not in url:
+        url = "http://" + url
+    path = urlparse(url).path
+    for kind, regex in ROUTES:
+        match = regex.match(path)
+        if match is not None:
+            return kind, match.group("id")
+    return None
@@ -0,0 +1,295 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compact, versioned binary serialization of PyImgur objects.
+
+    data = dumps(im.get_gallery())
+    items = loads(data, im)
+
+The Imgur object the objects belong to is left out, so the data is small and
+safe to cache or send to another process. loads attaches the given Imgur
+object, or none. Objects loaded without one must be given one with attach
+before anything is fetched from Imgur.
+
+The data is encoded with msgpack if it's installed, or else with a compact
+format of PyImgur's own. loads reads both.
+"""
+
+import struct
+
+from pyimgur.basic_objects import Basic_object
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.image import Image
+from pyimgur.objects import (
+    Album,
+    Comment,
+    Gallery_album,
+    Gallery_image,
+    Message,
+    Notification,
+    User,
+)
+
+MAGIC = b"PYI"
+VERSION = 1
+PYIMGUR_CODEC = 0
+MSGPACK_CODEC = 1
+
+# Objects are stored with the index of their class. Only ever append to this,
+# or loading data from earlier versions breaks.
+CLASSES = (
+    Album,
+    Comment,
+    Gallery_album,
+    Gallery_image,
+    Image,
+    Message,
+    Notification,
+    User,
+)
+CLASS_INDEXES = {cls: index for index, cls in enumerate(CLASSES)}
+
+# Attributes not serialized, as they're specific to the process
+DROPPED_ATTRIBUTES = ("_imgur", "_has_fetched")
+
+# msgpack extension type of objects
+OBJECT_EXT_TYPE = 1
+
+DOUBLE = struct.Struct(">d")
+
+
+def _msgpack(required):
+    try:
+        import msgpack  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        if required:
+            raise ImportError(
+                "This data needs msgpack. Install it with "
+                "pip install pyimgur[msgpack]"
+            ) from e
+        return None
+    return msgpack
+
+
+def dumps(value, use_msgpack=None):
+    """
+    Return value serialized as bytes.
+
+    :param value: A PyImgur object, or a list, tuple or dict of them and
+        JSON-like values. Tuples are loaded as lists.
+    :param use_msgpack: True to encode with msgpack, False for PyImgur's own
+        format. None to use msgpack if it's installed.
+    """
+    msgpack = _msgpack(required=bool(use_msgpack)) if use_msgpack is not False else None
+    if msgpack is None:
+        out = bytearray(MAGIC)
+        out += bytes((VERSION, PYIMGUR_CODEC))
+        _encode(value, out)
+        return bytes(out)
+
+    def default(obj):
+        if isinstance(obj, Basic_object):
+            fetched, index, attributes = _object_state(obj)
+            return msgpack.ExtType(
+                OBJECT_EXT_TYPE,
+                msgpack.packb([index, fetched, attributes], default=default),
+            )
+        raise TypeError(f"Can't serialize {type(obj).__name__}")
+
+    return (
+        MAGIC + bytes((VERSION, MSGPACK_CODEC)) + msgpack.packb(value, default=default)
+    )
+
+
+def loads(data, imgur=None):
+    """
+    Return the value serialized in data by dumps.
+
+    :param data: The bytes returned by dumps.
+    :param imgur: The Imgur object to attach to the loaded objects.
+    """
+    header_length = len(MAGIC) + 2
+    if data[: len(MAGIC)] != MAGIC or len(data) < header_length:
+        raise InvalidParameterError("The data wasn't serialized by PyImgur")
+    version, codec = data[len(MAGIC)], data[len(MAGIC) + 1]
+    if version > VERSION:
+        raise InvalidParameterError(
+            f"The data is version {version}, this PyImgur reads up to {VERSION}"
+        )
+
+    if codec == PYIMGUR_CODEC:
+        try:
+            value, position = _decode(data, header_length, imgur)
+        except (IndexError, struct.error) as e:
+            raise InvalidParameterError("The serialized data is truncated") from e
+        if position != len(data):
+            raise InvalidParameterError("Trailing bytes after serialized data")
+        return value
+    if codec != MSGPACK_CODEC:
+        raise InvalidParameterError(f"Unknown codec {codec}")
+
+    msgpack = _msgpack(required=True)
+
+    def ext_hook(code, ext_data):
+        if code != OBJECT_EXT_TYPE:
+            return msgpack.ExtType(code, ext_data)
+        index, fetched, attributes = msgpack.unpackb(
+            ext_data, ext_hook=ext_hook, strict_map_key=False
+        )
+        return _restore(index, fetched, attributes, imgur)
+
+    return msgpack.unpackb(
+        data[header_length:], ext_hook=ext_hook, strict_map_key=False
+    )
+
+
+def attach(value, imgur):
+    """Attach imgur to the loaded objects in value, and the objects in them."""
+    if isinstance(value, Basic_object):
+        # pylint: disable-next=protected-access
+        value._imgur = imgur
+        value = vars(value)
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            attach(item, imgur)
+
+
+def _object_state(obj):
+    index = CLASS_INDEXES.get(type(obj))
+    if index is None:
+        raise TypeError(f"Can't serialize {type(obj).__name__}")
+    attributes = {
+        key: value for key, value in vars(obj).items() if key not in DROPPED_ATTRIBUTES
+    }
+    # pylint: disable-next=protected-access
+    return obj._has_fetched, index, attributes
+
+
+def _restore(index, fetched, attributes, imgur):
+    # Bypass __init__, the attributes are already converted
+    obj = object.__new__(CLASSES[index])
+    obj.__dict__.update(attributes)
+    obj.__dict__["_imgur"] = imgur
+    obj.__dict__["_has_fetched"] = fetched
+    return obj
+
+
+def _encode_uint(number, out):
+    # Little endian base 128, as in protocol buffers
+    while number > 0x7F:
+        out.append(number & 0x7F | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _decode_uint(data, position):
+    number = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, position
+        shift += 7
+
+
+def _encode(value, out):  # pylint: disable=too-many-branches
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i"
+        # Zigzag, so small negative numbers are short too
+        _encode_uint(value * 2 if value >= 0 else -value * 2 - 1, out)
+    elif isinstance(value, float):
+        out += b"f" + DOUBLE.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        out += b"s"
+        _encode_uint(len(encoded), out)
+        out += encoded
+    elif isinstance(value, (bytes, bytearray)):
+        out += b"b"
+        _encode_uint(len(value), out)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += b"l"
+        _encode_uint(len(value), out)
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out += b"d"
+        _encode_uint(len(value), out)
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    elif isinstance(value, Basic_object):
+        fetched, index, attributes = _object_state(value)
+        out += b"o"
+        _encode_uint(index, out)
+        out += b"T" if fetched else b"F"
+        _encode(attributes, out)
+    else:
+        raise TypeError(f"Can't serialize {type(value).__name__}")
+
+
+def _decode(
+    data, position, imgur
+):  # pylint: disable=too-many-return-statements,too-many-branches
+    tag = data[position : position + 1]
+    position += 1
+    constants = {b"N": None, b"T": True, b"F": False}
+    if tag in constants:
+        return constants[tag], position
+    if tag == b"i":
+        number, position = _decode_uint(data, position)
+        return (number >> 1) ^ -(number & 1), position
+    if tag == b"f":
+        return DOUBLE.unpack_from(data, position)[0], position + DOUBLE.size
+    if tag in (b"s", b"b"):
+        length, position = _decode_uint(data, position)
+        raw = bytes(data[position : position + length])
+        if len(raw) != length:
+            raise InvalidParameterError("The serialized data is truncated")
+        return (raw.decode("utf-8") if tag == b"s" else raw), position + length
+    if tag == b"l":
+        length, position = _decode_uint(data, position)
+        items = []
+        for _ in range(length):
+            item, position = _decode(data, position, imgur)
+            items.append(item)
+        return items, position
+    if tag == b"d":
+        length, position = _decode_uint(data, position)
+        result = {}
+        for _ in range(length):
+            key, position = _decode(data, position, imgur)
+            result[key], position = _decode(data, position, imgur)
+        return result, position
+    if tag == b"o":
+        index, position = _decode_uint(data, position)
+        fetched = data[position : position + 1] == b"T"
+        attributes, position = _decode(data, position + 1, imgur)
+        if index >= len(CLASSES):
+            raise InvalidParameterError(f"Unknown object class {index}")
+        return _restore(index, fetched, attributes, imgur), position
+    raise InvalidParameterError(
+        "The serialized data is truncated" if not tag else f"Unknown tag {tag!r}"
+    )
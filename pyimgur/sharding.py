@@ -0,0 +1,146 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Spread anonymous requests across several application credentials.
+
+Imgur limits the number of requests per application (client_id). Reads that
+don't need to be authenticated as a user can be spread over several
+applications, which multiplies the available budget.
+"""
+
+import threading
+import time
+
+from pyimgur.exceptions import RateLimitError
+
+# Imgur reports the remaining application budget in the first header, RapidAPI
+# in the second.
+REMAINING_HEADERS = ("x-ratelimit-clientremaining", "x-ratelimit-requests-remaining")
+
+# Imgur doesn't say when the application budget is reset. So an exhausted
+# credential is put aside for this long, before it is tried again.
+EXHAUSTED_COOLDOWN_SECONDS = 3600
+
+
+class Credential:
+    """
+    A single set of application credentials.
+
+    :ivar base_url: The API base url requests with this credential go to.
+    :ivar client_id: The applications client_id.
+    :ivar exhausted_until: Epoch time before which this credential won't be
+        used, because it has run out of requests.
+    :ivar rapidapi_key: The RapidAPI key, if the credential goes via RapidAPI.
+    :ivar remaining: Requests left according to the latest ratelimit headers.
+        None until a response has been received with this credential.
+    """
+
+    def __init__(self, client_id, base_url, rapidapi_key=None):
+        self.client_id = client_id
+        self.base_url = base_url
+        self.rapidapi_key = rapidapi_key
+        self.remaining = None
+        self.exhausted_until = 0
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.client_id}>"
+
+    @property
+    def headers(self):
+        """The authentication headers for a request with this credential."""
+        headers = {"Authorization": f"Client-ID {self.client_id}"}
+        if self.rapidapi_key:
+            headers["X-Mashape-Key"] = self.rapidapi_key
+        return headers
+
+    def rebase(self, url, base_url):
+        """Move url, built against base_url, over to this credentials base url."""
+        if url.startswith(base_url):
+            return self.base_url + url[len(base_url) :]
+        return url
+
+
+class CredentialPool:
+    """
+    A thread-safe pool of credentials, handed out by remaining budget.
+
+    :ivar credentials: The list of Credential objects in the pool.
+    """
+
+    def __init__(self, credentials, cooldown=EXHAUSTED_COOLDOWN_SECONDS):
+        self.credentials = list(credentials)
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Return the credential with the largest remaining budget.
+
+        Credentials whose budget is still unknown are preferred, so every
+        credential gets probed. The budget of the returned credential is
+        lowered by one straight away, so concurrent callers are spread out
+        before the responses arrive.
+
+        :raises RateLimitError: If every credential is exhausted.
+        """
+        now = time.time()
+        with self._lock:
+            available = [
+                cred for cred in self.credentials if cred.exhausted_until <= now
+            ]
+            if not available:
+                raise RateLimitError(
+                    "All credentials have used up their ratelimit. Try again later."
+                )
+            credential = max(
+                available,
+                key=lambda cred: (
+                    float("inf") if cred.remaining is None else cred.remaining
+                ),
+            )
+            if credential.remaining is not None:
+                credential.remaining -= 1
+            return credential
+
+    def remaining(self):
+        """
+        Return how many requests are left across the usable credentials.
+
+        None if the budget of a usable credential is still unknown.
+        """
+        now = time.time()
+        with self._lock:
+            available = [
+                cred for cred in self.credentials if cred.exhausted_until <= now
+            ]
+            if any(cred.remaining is None for cred in available):
+                return None
+            return sum(cred.remaining for cred in available)
+
+    def mark_exhausted(self, credential):
+        """Put credential aside until its cooldown has passed."""
+        with self._lock:
+            credential.remaining = 0
+            credential.exhausted_until = time.time() + self.cooldown
+
+    def update(self, credential, ratelimit_info):
+        """Update the budget of credential from the ratelimit headers."""
+        for header in REMAINING_HEADERS:
+            if header in ratelimit_info:
+                with self._lock:
+                    credential.remaining = ratelimit_info[header]
+                if credential.remaining <= 0:
+                    self.mark_exhausted(credential)
+                return
@@ -0,0 +1,127 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Small persistent key-value stores for caches and indexes.
+
+Every store maps string keys to JSON serializable values and has the same
+get, set and delete methods, so any of them, or a custom class with those
+methods, can be plugged into the features that keep state between runs.
+"""
+
+import json
+import os
+import threading
+
+from pyimgur.exceptions import InvalidParameterError
+
+
+class MemoryStore:
+    """A store kept in memory. Its content is lost when the program exits."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the value stored at key, or default if there is none."""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key, value):
+        """Store value at key."""
+        with self._lock:
+            self._data[key] = value
+
+    def delete(self, key):
+        """Remove key from the store, if it's there."""
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class JSONFileStore(MemoryStore):
+    """
+    A store saved to a JSON file after every change.
+
+    Fine for small stores. The whole file is rewritten on each change, use
+    SQLiteStore for stores with many keys.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = os.fspath(path)
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as infile:
+                self._data = json.load(infile)
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._save()
+
+    def delete(self, key):
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._save()
+
+    def _save(self):
+        # Write to a temporary file first, so a crash never leaves half a file
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as outfile:
+            json.dump(self._data, outfile)
+        os.replace(temporary_path, self.path)
+
+
+class SQLiteStore:
+    """A store saved in a table of an SQLite database."""
+
+    def __init__(self, path, table="pyimgur_store"):
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        if not table.isidentifier():
+            raise InvalidParameterError(f"Invalid table name {table!r}")
+        self.path = os.fspath(path)
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def get(self, key, default=None):
+        """Return the value stored at key, or default if there is none."""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key, value):
+        """Store value at key."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def delete(self, key):
+        """Remove key from the store, if it's there."""
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
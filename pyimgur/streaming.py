@@ -0,0 +1,215 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Stream request bodies from disk instead of building them in memory."""
+
+import io
+import os
+import time
+
+READ_CHUNK_SIZE = 64 * 1024
+DEFAULT_PROGRESS_INTERVAL = 0.5
+
+
+class ProgressReporter:
+    """
+    Call a progress callback as a transfer advances.
+
+    The callback gets the bytes transferred so far, the total bytes, or None
+    if the total is unknown, and the rate in bytes per second since the
+    previous call. It's called at most once every interval seconds, and
+    always when the transfer is complete.
+    """
+
+    def __init__(self, callback, total, interval=DEFAULT_PROGRESS_INTERVAL):
+        self.callback = callback
+        self.total = total
+        self.interval = interval
+        self.restart()
+
+    def restart(self):
+        """Start counting from 0 again, such as when a transfer is retried."""
+        self.bytes_done = 0
+        self._last_bytes = 0
+        self._last_time = time.perf_counter()
+        self._next_report = self._last_time + self.interval
+
+    def update(self, nbytes):
+        """Count nbytes more as transferred."""
+        self.bytes_done += nbytes
+        now = time.perf_counter()
+        if now >= self._next_report or self.bytes_done == self.total:
+            self._report(now)
+
+    def finish(self):
+        """Report the final count, if it hasn't been reported already."""
+        if self.bytes_done != self._last_bytes:
+            self._report(time.perf_counter())
+
+    def _report(self, now):
+        elapsed = now - self._last_time
+        rate = (self.bytes_done - self._last_bytes) / elapsed if elapsed > 0 else 0.0
+        self._last_bytes = self.bytes_done
+        self._last_time = now
+        self._next_report = now + self.interval
+        self.callback(self.bytes_done, self.total, rate)
+
+
+class MultipartStream:  # pylint: disable=too-many-instance-attributes
+    """
+    A multipart/form-data body, with a single file, read as it's sent.
+
+    The file is never loaded into memory as a whole. The stream is a file
+    object, with a known length, so requests sends it with a Content-Length
+    header and reads it in chunks. It can be rewound with seek(0) to send it
+    again.
+
+    :ivar content_type: The Content-Type header to send the body with.
+    :ivar bytes_read: How much of the body has been read so far.
+    """
+
+    def __init__(
+        self,
+        fields,
+        file_field,
+        path=None,
+        file=None,
+        progress=None,
+        limiters=(),
+        progress_interval=DEFAULT_PROGRESS_INTERVAL,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Create the body.
+
+        :param fields: The form fields sent before the file. Fields that are
+            None are left out.
+        :param file_field: The name of the form field holding the file.
+        :param path: The path of the file to send.
+        :param file: The file to send, as bytes or a file object opened in
+            binary mode. Used if path isn't given.
+        :param progress: Called with bytes_read, the total length and the
+            rate in bytes per second since the previous call, as the body is
+            read. See ProgressReporter.
+        :param limiters: The pyimgur.bandwidth.BandwidthLimiters every read
+            draws from.
+        :param progress_interval: The minimum number of seconds between calls
+            to progress.
+        """
+        boundary = os.urandom(16).hex()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.limiters = limiters
+
+        if path is not None:
+            self._file = open(path, "rb")  # pylint: disable=consider-using-with
+            self._owns_file = True
+            filename = os.path.basename(path)
+        else:
+            if isinstance(file, (bytes, bytearray)):
+                file = io.BytesIO(file)
+            self._file = file
+            self._owns_file = False
+            filename = os.path.basename(getattr(file, "name", "") or "upload")
+        self._file_start = self._file.tell()
+        file_size = self._file.seek(0, io.SEEK_END) - self._file_start
+        self._file.seek(self._file_start)
+
+        # pylint: disable-next=import-outside-toplevel
+        import mimetypes
+
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        head = b"".join(
+            _part_header(boundary, name) + str(value).encode() + b"\r\n"
+            for name, value in fields.items()
+            if value is not None
+        )
+        self._head = head + _part_header(boundary, file_field, filename, content_type)
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._length = len(self._head) + file_size + len(self._tail)
+        self.bytes_read = 0
+        self._reporter = None
+        if progress is not None:
+            self._reporter = ProgressReporter(progress, self._length, progress_interval)
+
+    def __len__(self):
+        return self._length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def tell(self):
+        """Return how far into the body the stream is."""
+        return self.bytes_read
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Rewind the stream. Only seeking to the start is supported."""
+        if (offset, whence) != (0, io.SEEK_SET):
+            raise io.UnsupportedOperation("MultipartStream can only seek to 0")
+        self.bytes_read = 0
+        if self._reporter is not None:
+            self._reporter.restart()
+        self._file.seek(self._file_start)
+        return 0
+
+    def read(self, size=-1):
+        """Read up to size bytes of the body. Read the rest if size is -1."""
+        if size is None or size < 0:
+            size = self._length - self.bytes_read
+
+        chunks = []
+        wanted = size
+        while wanted > 0 and self.bytes_read < self._length:
+            chunk = self._read_segment(wanted)
+            self.bytes_read += len(chunk)
+            wanted -= len(chunk)
+            chunks.append(chunk)
+        data = b"".join(chunks)
+
+        if data:
+            for limiter in self.limiters:
+                limiter.acquire(len(data))
+            if self._reporter is not None:
+                self._reporter.update(len(data))
+        return data
+
+    def close(self):
+        """Close the file, if the stream opened it."""
+        if self._owns_file:
+            self._file.close()
+
+    def _read_segment(self, size):
+        head_length = len(self._head)
+        file_end = self._length - len(self._tail)
+        if self.bytes_read < head_length:
+            return self._head[self.bytes_read : self.bytes_read + size]
+        if self.bytes_read < file_end:
+            chunk = self._file.read(min(size, file_end - self.bytes_read))
+            if not chunk:
+                raise OSError("File was truncated while it was being sent")
+            return chunk
+        offset = self.bytes_read - file_end
+        return self._tail[offset : offset + size]
+
+
+def _part_header(boundary, name, filename=None, content_type=None):
+    disposition = f'Content-Disposition: form-data; name="{name}"'
+    if filename is not None:
+        disposition += f'; filename="{filename}"'
+    lines = [f"--{boundary}", disposition]
+    if content_type is not None:
+        lines.append(f"Content-Type: {content_type}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
@@ -0,0 +1,164 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Optional tracing of PyImgur calls with OpenTelemetry.
+
+    from pyimgur.tracing import enable_tracing
+
+    enable_tracing(im)
+
+Each call to a public method, such as Imgur.get_album or User.get_images,
+becomes a span. Every HTTP request attempt made while it runs, including
+pagination, retries, token refreshes and lazy loading, becomes a child span
+with the endpoint template, status, retry count and bytes as attributes.
+
+While tracing is disabled, which is the default, no spans are created and
+opentelemetry isn't imported.
+"""
+
+import functools
+import types
+
+from pyimgur.hooks import AFTER_RESPONSE, BEFORE_REQUEST
+
+# Key the request span is stored under in the hook info
+_SPAN_KEY = "_tracing_span"
+# inspect.CO_GENERATOR, as importing inspect would slow down importing PyImgur
+_CO_GENERATOR = 0x20
+
+
+def traced(cls=None, exclude=()):
+    """
+    Class decorator making every public method of cls a span when tracing.
+
+    :param exclude: Names of public methods that shouldn't be traced.
+    """
+    if cls is None:
+        return functools.partial(traced, exclude=exclude)
+
+    for name, member in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or name in exclude
+            or not isinstance(member, types.FunctionType)
+        ):
+            continue
+        setattr(cls, name, _traced_method(member, name))
+    return cls
+
+
+def _traced_method(method, name):
+    if method.__code__.co_flags & _CO_GENERATOR:
+        return _traced_generator(method, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        tracer = getattr(self.__dict__.get("_imgur", self), "tracer", None)
+        if tracer is None:
+            return method(self, *args, **kwargs)
+        with tracer.method_span(f"{type(self).__name__}.{name}"):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _traced_generator(method, name):
+    """Like _traced_method, but the span stays open until iteration stops."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        tracer = getattr(self.__dict__.get("_imgur", self), "tracer", None)
+        if tracer is None:
+            return (yield from method(self, *args, **kwargs))
+        with tracer.method_span(f"{type(self).__name__}.{name}"):
+            return (yield from method(self, *args, **kwargs))
+
+    return wrapper
+
+
+class Tracer:
+    """
+    Creates the spans for one Imgur object.
+
+    :ivar tracer: The OpenTelemetry tracer spans are created with.
+    """
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def method_span(self, name):
+        """Return a context manager for the span of a public method call."""
+        return self.tracer.start_as_current_span(
+            name, attributes={"code.function": name}
+        )
+
+    def start_request_span(self, info):
+        """Start the span of a request attempt. Registered as a hook."""
+        info[_SPAN_KEY] = self.tracer.start_span(
+            f"{info['method']} {info['endpoint']}",
+            attributes={
+                "http.request.method": info["method"],
+                "url.template": info["endpoint"],
+                "pyimgur.retry_count": info["attempt"],
+            },
+        )
+
+    @staticmethod
+    def end_request_span(info):
+        """End the span of a request attempt. Registered as a hook."""
+        span = info.pop(_SPAN_KEY, None)
+        if span is None:
+            return
+        if "error" in info:
+            span.record_exception(info["error"])
+            span.set_attribute("error.type", type(info["error"]).__name__)
+        else:
+            span.set_attribute("http.response.status_code", info["status_code"])
+            span.set_attribute("http.response.body.size", info["bytes_received"])
+            if info["status_code"] >= 400:
+                span.set_attribute("error.type", str(info["status_code"]))
+        span.end()
+
+
+def enable_tracing(imgur, tracer=None):
+    """
+    Start creating spans for the calls made with imgur.
+
+    :param imgur: The Imgur object to trace.
+    :param tracer: An OpenTelemetry tracer. Defaults to the "pyimgur" tracer
+        from the globally configured tracer provider.
+    """
+    if tracer is None:
+        try:
+            from opentelemetry import trace  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "Tracing requires opentelemetry-api. Install it with "
+                "pip install pyimgur[tracing]"
+            ) from e
+        tracer = trace.get_tracer("pyimgur")
+
+    disable_tracing(imgur)
+    imgur.tracer = Tracer(tracer)
+    imgur.hooks.register(BEFORE_REQUEST, imgur.tracer.start_request_span)
+    imgur.hooks.register(AFTER_RESPONSE, imgur.tracer.end_request_span)
+
+
+def disable_tracing(imgur):
+    """Stop creating spans for the calls made with imgur."""
+    if imgur.tracer is not None:
+        imgur.hooks.unregister(BEFORE_REQUEST, imgur.tracer.start_request_span)
+        imgur.hooks.unregister(AFTER_RESPONSE, imgur.tracer.end_request_span)
+    imgur.tracer = None
@@ -0,0 +1,186 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Transports perform the actual HTTP requests to Imgur.
+
+A transport is any object with a request method taking the same arguments as
+requests.request, and returning an object that behaves like a
+requests.Response. The default transport uses requests. The recording and
+replay transports make it possible to run PyImgur against saved responses,
+without any network access.
+"""
+
+import base64
+import json
+import threading
+import time
+from pathlib import Path
+
+from pyimgur.exceptions import PyImgurError
+
+CASSETTE_VERSION = 2
+
+
+class RequestsTransport:  # pylint: disable=too-few-public-methods
+    """
+    Send requests with the requests library.
+
+    A single session is used for all requests, so connections to Imgur are
+    kept alive and reused between calls.
+    """
+
+    def __init__(self, session=None):
+        if session is None:
+            # Imported here, as requests takes longer to import than the rest
+            # of PyImgur together. See get_default_transport.
+            import requests  # pylint: disable=import-outside-toplevel
+
+            session = requests.Session()
+        self.session = session
+
+    def request(self, method, url, **kwargs):
+        """Send the request and return the response."""
+        return self.session.request(method, url, **kwargs)
+
+
+class RecordedResponse:
+    """
+    A response read back from a recording.
+
+    Has the subset of the requests.Response interface that PyImgur uses.
+    """
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        # pylint: disable-next=import-outside-toplevel
+        from requests.structures import CaseInsensitiveDict
+
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def ok(self):  # pylint: disable=invalid-name
+        """Is the status code below 400?"""
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        """The body decoded as text."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def iter_content(self, chunk_size=1):
+        """Iterate over the body in chunks of chunk_size bytes."""
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def json(self):
+        """The body decoded as json."""
+        return json.loads(self.content)
+
+    def close(self):
+        """Do nothing, the body is already in memory."""
+
+
+def _interaction_key(method, url, params):
+    return json.dumps([method, url, params or {}], sort_keys=True)
+
+
+class RecordingTransport:  # pylint: disable=too-few-public-methods
+    """
+    Send requests with another transport and save the responses to disk.
+
+    The saved file can be played back with ReplayTransport. It holds one
+    json document per line: a header with the format version, followed by one
+    line per recorded response.
+
+    :param path: The file the recording is saved to. Any existing file is
+        overwritten. Each response is appended as soon as it's received, so an
+        interrupted run still leaves a usable recording.
+    :param transport: The transport that performs the requests. Defaults to a
+        new RequestsTransport.
+    """
+
+    def __init__(self, path, transport=None):
+        self.path = Path(path)
+        self.transport = transport or RequestsTransport()
+        self._lock = threading.Lock()
+        self._write("w", {"version": CASSETTE_VERSION})
+
+    def request(self, method, url, **kwargs):
+        """Send the request, record the response and return it."""
+        response = self.transport.request(method, url, **kwargs)
+        interaction = {
+            "key": _interaction_key(method, url, kwargs.get("params")),
+            "url": url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            self._write("a", interaction)
+        return response
+
+    def _write(self, mode, document):
+        with self.path.open(mode, encoding="utf-8") as cassette:
+            cassette.write(json.dumps(document) + "\n")
+
+
+class ReplayTransport:  # pylint: disable=too-few-public-methods
+    """
+    Serve responses saved by RecordingTransport, without network access.
+
+    Requests are matched on method, url and query parameters. If the same
+    request was recorded several times, the responses are served in the
+    recorded order, and the last one is repeated once they run out.
+
+    :param path: The recording to play back.
+    :param latency: Seconds to wait before serving each response. Use this
+        to simulate the round trip time to Imgur.
+    """
+
+    def __init__(self, path, latency=0):
+        with Path(path).open(encoding="utf-8") as cassette:
+            lines = [json.loads(line) for line in cassette if line.strip()]
+        if not lines or lines[0].get("version") != CASSETTE_VERSION:
+            raise PyImgurError(f"Unsupported recording version in {path}")
+        self.latency = latency
+        self._served = {}
+        self._interactions = {}
+        self._lock = threading.Lock()
+        for interaction in lines[1:]:
+            self._interactions.setdefault(interaction["key"], []).append(interaction)
+
+    def request(self, method, url, **kwargs):
+        """Return the recorded response for the request."""
+        key = _interaction_key(method, url, kwargs.get("params"))
+        if key not in self._interactions:
+            raise PyImgurError(f"No recorded response for {method} {url}")
+
+        with self._lock:
+            recorded = self._interactions[key]
+            index = min(self._served.get(key, 0), len(recorded) - 1)
+            self._served[key] = index + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        interaction = recorded[index]
+        return RecordedResponse(
+            interaction["url"],
+            interaction["status_code"],
+            interaction["headers"],
+            base64.b64decode(interaction["body"]),
+        )
@@ -0,0 +1,93 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Avoid uploading the same image twice.
+
+An UploadIndex remembers the content hash of every image uploaded through
+Imgur.upload_image. When the same content is uploaded again, the image that
+is already on Imgur is returned instead.
+"""
+
+import hashlib
+
+from pyimgur.stores import MemoryStore
+
+CHUNK_SIZE = 64 * 1024
+
+# Keys of the two mappings kept in the store
+DIGEST_KEY = "digest:{}"
+IMAGE_KEY = "image:{}"
+
+
+class UploadIndex:
+    """
+    Map content hashes of uploaded images to the images on Imgur.
+
+    :ivar algorithm: The hashlib algorithm used to hash content.
+    :ivar store: Where the index is kept. Any store from pyimgur.stores, or
+        an object with the same get, set and delete methods. Use a persistent
+        store to keep the index between runs.
+    """
+
+    def __init__(self, store=None, algorithm="sha256"):
+        self.algorithm = algorithm
+        self.store = MemoryStore() if store is None else store
+
+    def hash_content(self, path=None, file=None):
+        """
+        Return the hex digest of the image at path or in file.
+
+        Files are read in chunks, so large images are never held in memory.
+        File objects are rewound to where they started afterwards, ready to
+        be uploaded.
+        """
+        digest = hashlib.new(self.algorithm)
+        if path is not None:
+            with open(path, "rb") as infile:
+                _update_from_file(digest, infile)
+        elif isinstance(file, (bytes, bytearray)):
+            digest.update(file)
+        else:
+            start = file.tell()
+            _update_from_file(digest, file)
+            file.seek(start)
+        return digest.hexdigest()
+
+    def lookup(self, digest):
+        """
+        Return the uploaded image with content digest.
+
+        :returns: A dict with the id and deletehash of the image, or None
+            if no image with that content has been uploaded.
+        """
+        return self.store.get(DIGEST_KEY.format(digest))
+
+    def add(self, digest, image):
+        """Record that image was uploaded with content digest."""
+        entry = {"id": image.id, "deletehash": image.deletehash}
+        self.store.set(DIGEST_KEY.format(digest), entry)
+        self.store.set(IMAGE_KEY.format(image.id), digest)
+
+    def discard(self, image_id):
+        """Forget the image with image_id, so its content is uploaded again."""
+        digest = self.store.get(IMAGE_KEY.format(image_id))
+        if digest is not None:
+            self.store.delete(DIGEST_KEY.format(digest))
+            self.store.delete(IMAGE_KEY.format(image_id))
+
+
+def _update_from_file(digest, infile):
+    for chunk in iter(lambda: infile.read(CHUNK_SIZE), b""):
+        digest.update(chunk)
@@ -0,0 +1,99 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import threading
+import time
+
+import pytest
+
+from pyimgur import Imgur
+from pyimgur import bandwidth
+from pyimgur.bandwidth import BandwidthLimiter, limiters_for, set_global_limit
+from pyimgur.fake_server import FakeImgurServer
+
+
+@pytest.fixture(name="sleeps")
+def fixture_sleeps(monkeypatch):
+    # time.sleep is mocked out, so the clock stands nearly still between calls
+    delays = []
+    monkeypatch.setattr("time.sleep", delays.append)
+    return delays
+
+
+@pytest.fixture(autouse=True)
+def reset_global_limit():
+    yield
+    set_global_limit(None)
+
+
+def test_limiter_allows_burst_without_waiting(sleeps):
+    limiter = BandwidthLimiter(1000)
+    limiter.acquire(600)
+    limiter.acquire(400)
+    assert not sleeps
+
+
+def test_limiter_waits_for_tokens(sleeps):
+    limiter = BandwidthLimiter(1000, burst=0)
+    limiter.acquire(500)
+    limiter.acquire(500)
+    assert sleeps == [pytest.approx(0.5, rel=0.01), pytest.approx(1, rel=0.01)]
+
+
+def test_limiter_is_shared_between_threads():
+    limiter = BandwidthLimiter(1000000, burst=0)
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=limiter.acquire, args=(50000,)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.perf_counter() - start >= 0.19
+
+
+def test_limiters_for_includes_client_limiter():
+    limiter = BandwidthLimiter(1000)
+    im = Imgur("fake_client_id", bandwidth_limiter=limiter)
+    assert limiters_for(im) == (limiter,)
+
+
+def test_limiters_for_includes_global_limiter():
+    limiter = BandwidthLimiter(1000)
+    im = Imgur("fake_client_id", bandwidth_limiter=limiter)
+    set_global_limit(2000)
+    assert limiters_for(im) == (limiter, bandwidth._GLOBAL_LIMITER)
+
+
+def test_limiters_for_without_limits():
+    assert not limiters_for(Imgur("fake_client_id"))
+
+
+def test_uploads_and_downloads_draw_from_limiter(tmp_path):
+    class CountingLimiter:  # pylint: disable=too-few-public-methods
+        acquired = 0
+
+        def acquire(self, nbytes):
+            self.acquired += nbytes
+
+    with FakeImgurServer(image_bytes=100000) as server:
+        limiter = CountingLimiter()
+        im = Imgur("fake_client_id", bandwidth_limiter=limiter)
+        im.base_url = server.base_url
+        im.download_url = server.base_url + "/download/{}/undefined"
+        im.upload_image(file=b"x" * 100000)
+        assert limiter.acquired == server.bytes_received
+        im.get_image("abcdefg").download(path=tmp_path)
+        assert limiter.acquired == server.bytes_received + 100000
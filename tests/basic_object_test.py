@@ -3,6 +3,7 @@ import pytest
 import pyimgur
 
 from pyimgur.basic_objects import Basic_object
+from pyimgur.image import thumbnail_links
 
 from . import im, USER_NOT_AUTHENTICATED
 from .data import (
@@ -77,6 +78,33 @@ def test_populate_with_gallery_image():
     assert result == GALLERY_IMAGE_EXPECTED_DATA
 
 
+def test_image_thumbnail_links_are_computed_on_access():
+    image = pyimgur.Image(MOCKED_IMAGE_DATA, im, True)
+    assert "link_small_square" not in vars(image)
+    assert image.link_small_square == "https://i.imgur.com/JPz2is.png"
+
+
+def test_gallery_image_thumbnail_link():
+    gallery_image = pyimgur.Gallery_image(MOCKED_GALLERY_IMAGE_DATA, im, True)
+    assert gallery_image.link_huge_thumbnail == "https://i.imgur.com/CleiK2Vh.gif"
+
+
+def test_thumbnail_links_for_batch_of_images():
+    images = [
+        pyimgur.Image(MOCKED_IMAGE_DATA, im, True),
+        pyimgur.Gallery_image(MOCKED_GALLERY_IMAGE_DATA, im, True),
+    ]
+    assert thumbnail_links(images, "Medium thumbnail") == [
+        "https://i.imgur.com/JPz2im.png",
+        "https://i.imgur.com/CleiK2Vm.gif",
+    ]
+
+
+def test_thumbnail_links_invalid_size():
+    with pytest.raises(pyimgur.InvalidParameterError):
+        thumbnail_links([], "tiny")
+
+
 def test_populate_with_comment():
     comment = pyimgur.Comment(MOCKED_COMMENT_DATA, im, True)
     result = vars(comment)
@@ -0,0 +1,143 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+import responses
+
+from pyimgur import Image, Imgur
+from pyimgur.bulk import download_images, upload_images
+from pyimgur.exceptions import (
+    FileOverwriteError,
+    ImgurIsDownException,
+    RateLimitError,
+)
+from pyimgur.fake_server import FakeImgurServer
+
+from .data import MOCKED_IMAGE_DATA
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur():
+    with FakeImgurServer(image_bytes=100000) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        im.download_url = server.base_url + "/download/{}/undefined"
+        yield im
+
+
+@pytest.fixture(name="album")
+def fixture_album(imgur):
+    return imgur.get_album("abcdefg")
+
+
+@responses.activate
+def test_image_download_fetches_thumbnail_link(tmp_path):
+    responses.get("https://i.imgur.com/JPz2is.png", body=b"thumbnail")
+    image = Image(MOCKED_IMAGE_DATA, Imgur("fake_client_id"))
+    image.download(path=tmp_path, size="small_square")
+    assert responses.calls[0].request.url == "https://i.imgur.com/JPz2is.png"
+
+
+def test_download_images_returns_results_in_order(album, tmp_path):
+    results = download_images(album.images, path=tmp_path)
+    assert [result.value.name for result in results] == [
+        image.id + ".jpg" for image in album.images
+    ]
+
+
+def test_download_images_thumbnails_are_small(album, tmp_path):
+    results = download_images(album.images, path=tmp_path, size="small_square")
+    assert all(result.ok for result in results)
+    assert results[0].value.stat().st_size == 500
+
+
+def test_download_images_collects_failures(album, tmp_path):
+    download_images(album.images[:1], path=tmp_path)
+    results = download_images(album.images[:2], path=tmp_path)
+    assert isinstance(results[0].error, FileOverwriteError)
+    assert results[1].ok
+
+
+def test_upload_images_accepts_paths_and_buffers(imgur, tmp_path):
+    path = tmp_path / "cat.png"
+    path.write_bytes(b"cat")
+    with open(path, "rb") as file:
+        results = imgur.upload_images([path, b"dog", file])
+    assert all(result.ok for result in results)
+    assert all(isinstance(result.value, Image) for result in results)
+
+
+def test_upload_images_without_album(imgur):
+    assert imgur.upload_images([b"cat"]).album is None
+
+
+def test_upload_images_creates_album(imgur):
+    results = imgur.upload_images([b"cat", b"dog"], create_album=True)
+    assert results.album.id == "newalbm"
+
+
+def test_upload_images_retries_transient_errors(imgur, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    upload_image = imgur.upload_image
+    attempts = []
+
+    def flaky_upload_image(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) == 1:
+            raise ImgurIsDownException("Imgur is down")
+        return upload_image(**kwargs)
+
+    monkeypatch.setattr(imgur, "upload_image", flaky_upload_image)
+    results = upload_images(imgur, [b"cat"])
+    assert results[0].ok
+    assert len(attempts) == 2
+
+
+class InlineProcessPool:
+    def __init__(self):
+        self.submitted_from = []
+
+    def submit(self, function, argument):
+        self.submitted_from.append(threading.current_thread())
+        job = Future()
+        job.set_result(function(argument))
+        return job
+
+    def shutdown(self):
+        pass
+
+
+def test_upload_images_preprocesses_before_upload_threads(imgur, monkeypatch):
+    pool = InlineProcessPool()
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", lambda: pool)
+    results = imgur.upload_images([b"cat", b"dog"], preprocessor=bytes.upper)
+    assert all(result.ok for result in results)
+    assert pool.submitted_from == [threading.main_thread()] * 2
+
+
+def test_upload_images_keeps_sources_as_items_with_preprocessor(imgur, monkeypatch):
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", InlineProcessPool)
+    results = imgur.upload_images([b"cat"], preprocessor=bytes.upper)
+    assert results[0].item == b"cat"
+
+
+def test_upload_images_stops_before_ratelimit(imgur):
+    imgur.ratelimit_clientremaining = 5
+    results = imgur.upload_images([b"cat"], create_album=True)
+    assert isinstance(results[0].error, RateLimitError)
+    assert results.album is None
@@ -0,0 +1,157 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import signal
+import threading
+
+import pytest
+
+from pyimgur import Gallery_item, Imgur
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.fake_server import FakeImgurServer
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur():
+    with FakeImgurServer(page_size=10, total_items=35) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        yield im
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+@pytest.fixture(name="finished")
+def fixture_finished(imgur, tmp_path):
+    crawl = imgur.crawl_gallery(tmp_path / "crawl")
+    return crawl, list(crawl)
+
+
+def test_crawl_gallery_yields_whole_listing(imgur, finished):
+    _, items = finished
+    assert ids(items) == ids(imgur.get_gallery(limit=35))
+
+
+def test_crawl_gallery_yields_gallery_items(finished):
+    _, items = finished
+    assert all(isinstance(item, Gallery_item) for item in items)
+
+
+def test_crawl_gallery_ends_done(finished):
+    crawl, _ = finished
+    assert crawl.done
+    assert crawl.page == 4
+
+
+def read_checkpoint(path):
+    with open(path, encoding="utf-8") as infile:
+        return json.load(infile)["crawl"]
+
+
+def test_crawl_saves_no_checkpoint_within_first_page(imgur, tmp_path):
+    items = iter(imgur.crawl_gallery(tmp_path / "crawl"))
+    for _ in range(10):
+        next(items)
+    assert not (tmp_path / "crawl").exists()
+
+
+def test_crawl_saves_checkpoint_after_each_page(imgur, tmp_path):
+    items = iter(imgur.crawl_gallery(tmp_path / "crawl"))
+    for _ in range(11):
+        next(items)
+    state = read_checkpoint(tmp_path / "crawl")
+    assert state["page"] == 1
+    assert len(state["seen"]) == 10
+
+
+def test_crawl_resumes_where_it_stopped(imgur, tmp_path):
+    everything = ids(imgur.get_gallery(limit=35))
+    crawl = imgur.crawl_gallery(tmp_path / "crawl")
+    first = []
+    for item in crawl:
+        first.append(item.id)
+        if len(first) == 13:
+            crawl.stop()
+
+    resumed = imgur.crawl_gallery(tmp_path / "crawl")
+    assert resumed.page == 1
+    assert first + ids(resumed) == everything
+
+
+def test_crawl_limit_counts_over_all_runs(imgur, tmp_path):
+    list(imgur.crawl_gallery(tmp_path / "crawl", limit=15))
+    crawl = imgur.crawl_gallery(tmp_path / "crawl", limit=25)
+    assert len(list(crawl)) == 10
+    assert crawl.count == 25
+
+
+def test_crawl_limit_stops_first_run(imgur, tmp_path):
+    assert len(list(imgur.crawl_gallery(tmp_path / "crawl", limit=15))) == 15
+
+
+def test_finished_crawl_yields_nothing(imgur, tmp_path):
+    list(imgur.crawl_gallery(tmp_path / "crawl"))
+    assert not list(imgur.crawl_gallery(tmp_path / "crawl"))
+
+
+def test_checkpoint_of_other_crawl_is_rejected(imgur, tmp_path):
+    list(imgur.crawl_gallery(tmp_path / "crawl", limit=1))
+    with pytest.raises(InvalidParameterError):
+        imgur.crawl_search_gallery(tmp_path / "crawl", q="cats")
+
+
+def test_crawl_search_gallery_keeps_params(imgur, tmp_path):
+    items = list(imgur.crawl_search_gallery(tmp_path / "crawl", q="cats"))
+    assert len(items) == 35
+    assert imgur.crawl_search_gallery(tmp_path / "crawl", q="cats").done
+
+
+def test_crawl_subreddit_gallery_checks_sort(imgur, tmp_path):
+    with pytest.raises(InvalidParameterError):
+        imgur.crawl_subreddit_gallery(tmp_path / "crawl", "pics", sort="viral")
+
+
+def test_crawl_subreddit_gallery(imgur, tmp_path):
+    assert len(list(imgur.crawl_subreddit_gallery(tmp_path / "crawl", "pics"))) == 35
+
+
+@pytest.fixture(name="terminated")
+def fixture_terminated(imgur, tmp_path):
+    if threading.current_thread() is not threading.main_thread():
+        pytest.skip("signal handlers are only installed in the main thread")
+    crawl = imgur.crawl_gallery(tmp_path / "crawl")
+    first = []
+    for item in crawl:
+        first.append(item.id)
+        if len(first) == 5:
+            os.kill(os.getpid(), signal.SIGTERM)
+    return first
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM"), reason="needs SIGTERM")
+def test_sigterm_stops_crawl_and_saves_checkpoint(imgur, tmp_path, terminated):
+    resumed = ids(imgur.crawl_gallery(tmp_path / "crawl"))
+    assert len(terminated) == 5
+    assert terminated + resumed == ids(imgur.get_gallery(limit=35))
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM"), reason="needs SIGTERM")
+def test_sigterm_handler_is_restored(imgur, tmp_path):
+    previous = signal.getsignal(signal.SIGTERM)
+    list(imgur.crawl_gallery(tmp_path / "crawl", limit=5))
+    assert signal.getsignal(signal.SIGTERM) == previous
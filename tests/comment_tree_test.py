@@ -0,0 +1,148 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import pytest
+
+from pyimgur import Comment, Imgur
+from pyimgur.comment_tree import CommentTree
+from pyimgur.fake_server import FakeImgurServer, make_comment
+
+IMGUR = Imgur("fake_client_id")
+
+
+def make_tree(comments):
+    return CommentTree(comments, lambda json: Comment(json, IMGUR))
+
+
+def comment(comment_id, *children):
+    return {
+        "id": comment_id,
+        "author": f"user{comment_id}",
+        "points": comment_id * 10,
+        "comment": f"text {comment_id}",
+        "parent_id": 0,
+        "children": list(children),
+    }
+
+
+@pytest.fixture(name="tree")
+def fixture_tree():
+    # 1 - 3 - 5
+    #   \ 4
+    # 2
+    return make_tree([comment(1, comment(3, comment(5)), comment(4)), comment(2)])
+
+
+def test_tree_indexes_in_breadth_first_order(tree):
+    assert len(tree) == 5
+    assert [tree.id(index) for index in tree.breadth_first()] == [1, 2, 3, 4, 5]
+
+
+def test_tree_indexes_author_and_points(tree):
+    assert tree.author(2) == "user3"
+    assert tree.points(2) == 30
+
+
+def test_tree_indexes_text(tree):
+    assert tree.text(4) == "text 5"
+
+
+def test_tree_links_roots_and_children(tree):
+    assert list(tree.roots) == [0, 1]
+    assert [tree.id(index) for index in tree.children(0)] == [3, 4]
+
+
+def test_tree_links_parents(tree):
+    assert tree.parent(4) == 2
+    assert tree.parent(0) is None
+
+
+def test_tree_depth_first(tree):
+    assert [tree.id(index) for index in tree.depth_first()] == [1, 3, 5, 4, 2]
+    assert [tree.id(index) for index in tree.depth_first(start=2)] == [3, 5]
+
+
+def test_tree_breadth_first_subtree(tree):
+    assert [tree.id(index) for index in tree.breadth_first(start=0)] == [1, 3, 4, 5]
+
+
+@pytest.fixture(name="lazy_tree")
+def fixture_lazy_tree():
+    built = []
+    lazy_tree = CommentTree(
+        [comment(1, comment(2))],
+        lambda json: built.append(json["id"]) or Comment(json, IMGUR),
+    )
+    lazy_tree.built = built
+    return lazy_tree
+
+
+def test_tree_builds_only_accessed_comments(lazy_tree):
+    first = lazy_tree.comment(0)
+    assert lazy_tree.built == [1]
+    assert first.text == "text 1"
+
+
+def test_tree_builds_comment_author(lazy_tree):
+    assert lazy_tree.comment(0).author.name == "user1"
+
+
+def test_tree_reuses_built_comments(lazy_tree):
+    assert lazy_tree.comment(0) is lazy_tree.comment(0)
+
+
+def test_tree_builds_replies_on_access(lazy_tree):
+    replies = lazy_tree.comment(0).replies
+    assert [reply.id for reply in replies] == [2]
+    assert lazy_tree.built == [1, 2]
+
+
+def test_tree_handles_deep_threads():
+    thread = comment(0)
+    node = thread
+    for comment_id in range(1, 5000):
+        node["children"] = [comment(comment_id)]
+        node = node["children"][0]
+    tree = make_tree([thread])
+    assert list(tree.depth_first()) == list(range(5000))
+
+
+def test_tree_matches_fake_server_threads():
+    threads = [make_comment(number, "abc", 0, 2, 3) for number in range(3)]
+    assert len(make_tree(threads)) == 3 * (1 + 3 + 9)
+
+
+def get_fake_comment_tree():
+    with FakeImgurServer(comment_depth=2, comment_breadth=2) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        return im.get_gallery_image("abcdefg").get_comment_tree(limit=5)
+
+
+def test_gallery_item_get_comment_tree():
+    tree = get_fake_comment_tree()
+    assert len(tree.roots) == 5
+    assert len(tree) == 5 * (1 + 2 + 4)
+
+
+def test_gallery_item_comment_tree_gets_every_comment():
+    with FakeImgurServer(total_items=250, page_size=250, comment_depth=0) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        tree = im.get_gallery_image("abcdefg").get_comment_tree()
+        assert len(tree.roots) == 250
+
+
+def test_gallery_item_comment_tree_builds_comments():
+    assert isinstance(next(get_fake_comment_tree().comments()), Comment)
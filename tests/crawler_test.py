@@ -0,0 +1,113 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import sys
+import threading
+
+import pytest
+
+from pyimgur import Comment, Imgur, RateLimitError
+from pyimgur.crawler import crawl_comments
+from pyimgur.fake_server import FakeImgurServer
+
+IMGUR = Imgur("fake_client_id")
+
+
+def make_comment(comment_id, **extra):
+    return Comment({"id": comment_id, "parent_id": 0, **extra}, IMGUR)
+
+
+@pytest.fixture(name="replies")
+def fixture_replies(monkeypatch):
+    """Comment n has replies 10n+1 and 10n+2, until ids pass 1000."""
+    fetched = []
+    lock = threading.Lock()
+
+    def get_replies(comment):
+        with lock:
+            fetched.append(comment.id)
+        if comment.id > 100:
+            return []
+        return [make_comment(comment.id * 10 + i) for i in (1, 2)]
+
+    monkeypatch.setattr(Comment, "get_replies", get_replies)
+    return fetched
+
+
+def all_ids(comment):
+    ids = []
+    stack = [comment]
+    while stack:
+        comment = stack.pop()
+        ids.append(comment.id)
+        stack.extend(comment.replies)
+    return sorted(ids)
+
+
+@pytest.mark.usefixtures("replies")
+def test_crawl_comments_fetches_every_level():
+    results = crawl_comments([make_comment(1), make_comment(2)])
+    assert all(result.ok for result in results)
+    assert all_ids(results[0].value) == [1, 11, 12, 111, 112, 121, 122]
+
+
+def test_crawl_comments_fetches_replies_once_per_comment(replies):
+    crawl_comments([make_comment(1), make_comment(2)])
+    assert len(replies) == 14
+
+
+def test_crawl_comments_skips_duplicate_ids(replies):
+    results = crawl_comments([make_comment(1), make_comment(11)])
+    assert all(result.ok for result in results)
+    assert replies.count(11) == 1
+
+
+@pytest.mark.usefixtures("replies")
+def test_crawl_comments_streams_results_to_callback():
+    finished = []
+    results = crawl_comments(
+        [make_comment(1), make_comment(2)], callback=finished.append
+    )
+    assert sorted(finished, key=results.index) == results
+
+
+def test_crawl_comments_respects_ratelimit(replies):
+    imgur = Imgur("fake_client_id")
+    imgur.ratelimit_clientremaining = 0
+    comment = Comment({"id": 1, "parent_id": 0}, imgur)
+    results = crawl_comments([comment])
+    assert isinstance(results[0].error, RateLimitError)
+    assert not replies
+
+
+def test_crawl_comments_from_gallery_item():
+    with FakeImgurServer(comment_depth=2, comment_breadth=2) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        item = im.get_gallery_image("abcdefg")
+        requests_served = server.requests_served
+        item.get_comments(limit=sys.maxsize)
+        listing_requests = server.requests_served - requests_served
+        results = crawl_comments(item)
+        assert all(result.ok for result in results)
+        # The comments endpoint returns whole threads, no replies are fetched
+        assert server.requests_served - requests_served == 2 * listing_requests
+
+
+def test_crawl_comments_gets_every_top_level_comment():
+    with FakeImgurServer(total_items=250, page_size=250, comment_depth=0) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        results = crawl_comments(im.get_gallery_image("abcdefg"))
+        assert len(results) == 250
@@ -76,12 +76,6 @@ IMAGE_EXPECTED_DATA = {
     "is_favorited": False,
     "is_nsfw": None,
     "is_animated": False,
-    "link_small_square": "https://i.imgur.com/JPz2is.png",
-    "link_big_square": "https://i.imgur.com/JPz2ib.png",
-    "link_small_thumbnail": "https://i.imgur.com/JPz2it.png",
-    "link_medium_thumbnail": "https://i.imgur.com/JPz2im.png",
-    "link_large_thumbnail": "https://i.imgur.com/JPz2il.png",
-    "link_huge_thumbnail": "https://i.imgur.com/JPz2ih.png",
 }
 
 MOCKED_ALBUM_DATA = {
@@ -622,12 +616,6 @@ GALLERY_IMAGE_EXPECTED_DATA = {
     "is_favorited": False,
     "is_nsfw": False,
     "is_animated": True,
-    "link_small_square": "https://i.imgur.com/CleiK2Vs.gif",
-    "link_big_square": "https://i.imgur.com/CleiK2Vb.gif",
-    "link_small_thumbnail": "https://i.imgur.com/CleiK2Vt.gif",
-    "link_medium_thumbnail": "https://i.imgur.com/CleiK2Vm.gif",
-    "link_large_thumbnail": "https://i.imgur.com/CleiK2Vl.gif",
-    "link_huge_thumbnail": "https://i.imgur.com/CleiK2Vh.gif",
 }
 
 MOCKED_COMMENT_DATA = {
@@ -0,0 +1,112 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import re
+
+import pytest
+
+from pyimgur import Imgur, request
+from pyimgur.dedupe import BloomFilter, SeenSet
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.hooks import ON_PAGE
+
+# The listing shifts by two items between pages, so each page repeats the
+# last two items of the one before it.
+PAGES = [
+    [{"id": f"item{n}", "is_album": False} for n in range(start, start + 5)]
+    for start in (0, 3, 6)
+] + [[]]
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur(monkeypatch):
+    def page_of(url):
+        return PAGES[int(re.search(r"/(\d+)\?", url).group(1))]
+
+    monkeypatch.setattr(
+        request, "send_request", lambda url, **kwargs: (page_of(url), {})
+    )
+    # Streamed items are closed after use, which generators support
+    monkeypatch.setattr(
+        request,
+        "stream_request",
+        lambda url, **kwargs: ((item for item in page_of(url)), {}),
+    )
+    return Imgur("fake_client_id")
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+def test_listing_keeps_duplicates_by_default(imgur):
+    assert len(imgur.get_gallery(limit=100)) == 15
+
+
+def test_dedupe_drops_repeated_items(imgur):
+    items = imgur.get_gallery(limit=100, dedupe=True)
+    assert ids(items) == [f"item{n}" for n in range(11)]
+    assert imgur.duplicates_dropped == 4
+
+
+def test_dedupe_fills_limit_with_unique_items(imgur):
+    assert len(imgur.get_gallery(limit=8, dedupe=True)) == 8
+
+
+def test_dedupe_reports_duplicates_per_page(imgur):
+    pages = []
+    imgur.hooks.register(ON_PAGE, pages.append)
+    imgur.get_gallery(limit=100, dedupe=True)
+    assert [page["duplicates"] for page in pages] == [0, 2, 2]
+    assert [page["items"] for page in pages] == [5, 3, 3]
+
+
+def test_dedupe_with_shared_seen_set(imgur):
+    seen = SeenSet()
+    imgur.get_gallery(limit=5, dedupe=seen)
+    items = imgur.get_gallery(limit=100, dedupe=seen)
+    assert ids(items) == [f"item{n}" for n in range(5, 11)]
+    assert len(seen) == 11
+
+
+def test_dedupe_with_bloom_filter(imgur):
+    items = imgur.get_gallery(limit=100, dedupe=BloomFilter(capacity=100))
+    assert len(items) == 11
+    assert imgur.duplicates_dropped == 4
+
+
+def test_iter_gallery_dedupe(imgur):
+    assert len(list(imgur.iter_gallery(dedupe=True))) == 11
+    assert imgur.duplicates_dropped == 4
+
+
+def test_bloom_filter_never_forgets():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for n in range(0, 2000, 2):
+        bloom.add(n)
+    assert all(n in bloom for n in range(0, 2000, 2))
+    assert not any(bloom.add(n) for n in range(0, 2000, 2))
+
+
+def test_bloom_filter_error_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for n in range(1000):
+        bloom.add(f"seen{n}")
+    false_positives = sum(f"new{n}" in bloom for n in range(10000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_rejects_bad_error_rate():
+    with pytest.raises(InvalidParameterError):
+        BloomFilter(error_rate=1)
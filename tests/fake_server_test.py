@@ -0,0 +1,97 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+from urllib.parse import urlsplit
+
+import pytest
+
+from pyimgur import Gallery_album, Imgur, RateLimitError, UnexpectedImgurException
+from pyimgur.fake_server import FakeImgurServer, make_comment, synthetic_id
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    with FakeImgurServer(page_size=10, total_items=25) as server:
+        yield server
+
+
+def imgur_for(server):
+    im = Imgur("fake_client_id")
+    im.base_url = server.base_url
+    return im
+
+
+def test_synthetic_ids_are_unique():
+    assert len({synthetic_id(number) for number in range(1000)}) == 1000
+
+
+def test_make_comment_nests_replies():
+    comment = make_comment(0, "abc", depth=2, breadth=3)
+    assert len(comment["children"]) == 3
+    assert len(comment["children"][0]["children"]) == 3
+
+
+def test_truncated_request_closes_connection(server):
+    address = urlsplit(server.base_url)
+    with socket.create_connection((address.hostname, address.port), timeout=5) as sock:
+        sock.sendall(b"POST /3/image HTTP/1.1\r\nContent-Length: 100\r\n\r\nshort")
+        sock.shutdown(socket.SHUT_WR)
+        assert sock.recv(1024) == b""
+
+
+def test_get_image(server):
+    image = imgur_for(server).get_image("abc")
+    assert image.link == f"{server.base_url}/i/abc.jpg"
+
+
+def test_gallery_paginates_until_listing_ends(server):
+    gallery = imgur_for(server).get_gallery(limit=100)
+    assert len(gallery) == 25
+    assert server.requests_served == 4
+
+
+def test_gallery_contains_albums(server):
+    gallery = imgur_for(server).get_gallery(limit=5)
+    assert isinstance(gallery[4], Gallery_album)
+
+
+def test_ratelimit_headers_are_sent(server):
+    im = imgur_for(server)
+    im.get_user("someone")
+    assert im.ratelimit_clientremaining == server.ratelimit - 1
+
+
+def test_ratelimit_is_enforced():
+    with FakeImgurServer(ratelimit=1) as server:
+        im = imgur_for(server)
+        im.get_image("abc")
+        with pytest.raises(UnexpectedImgurException):
+            im.get_image("abc")
+
+
+def test_ratelimit_triggers_credential_failover():
+    with FakeImgurServer(ratelimit=1) as server:
+        im = Imgur("first", credentials=["second"])
+        im.base_url = server.base_url
+        im.get_image("abc")
+        with pytest.raises(RateLimitError):
+            im.get_image("abc")
+
+
+def test_injected_errors():
+    with FakeImgurServer(error_rate=1, error_status=403) as server:
+        with pytest.raises(UnexpectedImgurException):
+            imgur_for(server).get_image("abc")
@@ -0,0 +1,129 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+import responses
+
+from pyimgur import Imgur, InvalidParameterError
+from pyimgur.hooks import (
+    AFTER_RESPONSE,
+    BEFORE_REQUEST,
+    ON_PAGE,
+    ON_RATELIMIT_UPDATE,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+    Hooks,
+    endpoint_template,
+)
+
+from .data import MOCKED_GALLERY_IMAGE_DATA
+
+
+def test_endpoint_template_replaces_ids():
+    url = "https://api.imgur.com/3/gallery/abc123/comments/new/0"
+    assert endpoint_template(url) == "/3/gallery/{id}/comments/new/{id}"
+
+
+def test_register_unknown_event():
+    with pytest.raises(InvalidParameterError):
+        Hooks().register("on_nothing", print)
+
+
+def test_hooks_without_callbacks_are_falsy():
+    hooks = Hooks()
+    hooks.register(ON_PAGE, print)
+    hooks.unregister(ON_PAGE, print)
+    assert not hooks
+
+
+@responses.activate
+def test_before_and_after_share_info():
+    responses.get("https://api.imgur.com/3/image/abc", json={"data": {"id": "abc"}})
+    im = Imgur("fake_client_id")
+    seen = []
+    im.hooks.register(BEFORE_REQUEST, seen.append)
+    im.hooks.register(AFTER_RESPONSE, seen.append)
+    im.get_image("abc")
+    assert seen[0] is seen[1]
+    assert seen[1]["endpoint"] == "/3/image/{id}"
+
+
+@responses.activate
+def test_after_response_has_timing_and_status():
+    responses.get("https://api.imgur.com/3/image/abc", json={"data": {"id": "abc"}})
+    im = Imgur("fake_client_id")
+    seen = []
+    im.hooks.register(AFTER_RESPONSE, seen.append)
+    im.get_image("abc")
+    assert seen[0]["elapsed"] >= 0
+    assert seen[0]["status_code"] == 200
+
+
+@responses.activate
+def test_on_retry(monkeypatch):
+    monkeypatch.setattr("pyimgur.request.time.sleep", lambda _: None)
+    responses.get("https://api.imgur.com/3/image/abc", status=500, json={})
+    responses.get("https://api.imgur.com/3/image/abc", json={"data": {"id": "abc"}})
+    im = Imgur("fake_client_id")
+    seen = []
+    im.hooks.register(ON_RETRY, seen.append)
+    im.get_image("abc")
+    assert len(seen) == 1
+    assert seen[0]["status_code"] == 500
+
+
+@responses.activate
+def test_on_ratelimit_update():
+    responses.get(
+        "https://api.imgur.com/3/image/abc",
+        json={"data": {"id": "abc"}},
+        headers={"x-ratelimit-clientremaining": "99"},
+    )
+    im = Imgur("fake_client_id")
+    seen = []
+    im.hooks.register(ON_RATELIMIT_UPDATE, seen.append)
+    im.get_image("abc")
+    assert seen == [{"ratelimit_clientremaining": 99}]
+
+
+@responses.activate
+def test_on_page():
+    for page in range(2):
+        responses.get(
+            f"https://api.imgur.com/3/gallery/hot/viral/day/{page}?showViral=True",
+            json={"data": [MOCKED_GALLERY_IMAGE_DATA] * 2},
+        )
+    im = Imgur("fake_client_id")
+    seen = []
+    im.hooks.register(ON_PAGE, seen.append)
+    im.get_gallery(limit=3)
+    assert [info["page"] for info in seen] == [0]
+
+
+@responses.activate
+def test_on_token_refresh():
+    responses.post(
+        "https://api.imgur.com/oauth2/token", json={"access_token": "new token"}
+    )
+    im = Imgur("fake_client_id", "fake_client_secret", refresh_token="token")
+    seen = []
+    im.hooks.register(ON_TOKEN_REFRESH, seen.append)
+    im.refresh_access_token()
+    assert len(seen) == 1
+
+
+def test_endpoint_template_replaces_page_matching_api_version():
+    url = "https://api.imgur.com/3/account/me/images/3"
+    assert endpoint_template(url) == "/3/account/{id}/images/{id}"
@@ -0,0 +1,65 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import subprocess
+import sys
+
+import pytest
+
+import pyimgur
+from pyimgur import Album, Gallery_item
+from pyimgur.objects import Album as ObjectsAlbum
+
+# Modules import pyimgur must not load, as they're slow to import
+LAZY_MODULES = (
+    "concurrent.futures",
+    "json",
+    "mimetypes",
+    "pyimgur.image",
+    "pyimgur.objects",
+    "pyimgur.request",
+    "re",
+    "requests",
+    "sqlite3",
+    "threading",
+    "typing",
+    "urllib.parse",
+)
+
+
+def test_import_is_lazy():
+    # Only count the modules import pyimgur loads, not the ones site loaded
+    code = (
+        "import sys; before = set(sys.modules); import pyimgur; "
+        "print(*sorted(set(sys.modules) - before), sep='\\n')"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert not set(output.split()) & set(LAZY_MODULES)
+
+
+def test_object_classes_are_importable():
+    assert Album is ObjectsAlbum
+    assert pyimgur.Gallery_item is Gallery_item
+
+
+def test_object_classes_are_listed():
+    assert "Image" in dir(pyimgur)
+    assert "Image" in pyimgur.__all__
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="NotAClass"):
+        pyimgur.NotAClass  # pylint: disable=pointless-statement
@@ -0,0 +1,160 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import json
+
+import pytest
+import responses
+
+from pyimgur import Comment, Imgur
+from pyimgur.exceptions import UnexpectedImgurException
+from pyimgur.fake_server import FakeImgurServer
+from pyimgur.jsonstream import iter_array_items
+from pyimgur.request import stream_request
+from pyimgur.transport import RequestsTransport
+
+DOCUMENT = {
+    "data": [{"id": i, "comment": "ø" * i, "children": [{"id": -i}]} for i in range(20)]
+    + [1, 2.5, True, None, "text"],
+    "success": True,
+    "status": 200,
+}
+BODY = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+
+def split(body, size):
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 100, len(BODY)])
+def test_iter_array_items_across_chunk_boundaries(size):
+    assert list(iter_array_items(split(BODY, size))) == DOCUMENT["data"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps(document, indent=indent).encode()
+        for document in ({"data": [2.5]}, {"data": [-300000.0]}, DOCUMENT)
+        for indent in (None, 2)
+    ]
+    + [b'{"data": [-3e5, 12 , true,null, "x"]}'],
+)
+def test_iter_array_items_split_at_every_offset(body):
+    expected = json.loads(body)["data"]
+    decoded = [
+        list(iter_array_items([body[:offset], body[offset:]]))
+        for offset in range(len(body) + 1)
+    ]
+    assert decoded == [expected] * (len(body) + 1)
+
+
+def test_iter_array_items_rejects_garbage_after_number():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_array_items([b'{"data": [2', b"x]}"]))
+
+
+def test_iter_array_items_yields_before_the_end():
+    items = iter_array_items(split(BODY, 100))
+    assert next(items) == DOCUMENT["data"][0]
+
+
+def test_iter_array_items_falls_back_when_data_is_not_first():
+    body = json.dumps({"success": True, "data": [1, 2]}).encode()
+    assert list(iter_array_items(split(body, 5))) == [1, 2]
+
+
+def test_iter_array_items_rejects_non_array():
+    with pytest.raises(UnexpectedImgurException):
+        list(iter_array_items([b'{"data": {"error": "Nope"}}']))
+
+
+def test_iter_array_items_raises_on_truncated_body():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_array_items(split(BODY[:-40], 10)))
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur():
+    with FakeImgurServer(total_items=150, ratelimit=1000) as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        yield im
+
+
+def test_iter_gallery_matches_get_gallery(imgur):
+    streamed = [item.id for item in imgur.iter_gallery()]
+    assert streamed == [item.id for item in imgur.get_gallery()]
+
+
+def test_iter_gallery_yields_every_item(imgur):
+    assert len(list(imgur.iter_gallery(limit=1000))) == 150
+
+
+@pytest.mark.parametrize("limit", [None, 0, -1])
+def test_iter_gallery_defaults_to_default_limit(imgur, limit):
+    assert len(list(imgur.iter_gallery(limit=limit))) == imgur.DEFAULT_LIMIT
+
+
+def test_iter_gallery_stops_at_limit(imgur):
+    assert len(list(imgur.iter_gallery(limit=70))) == 70
+
+
+def test_iter_request_updates_ratelimit(imgur):
+    list(imgur.iter_gallery(limit=1))
+    assert imgur.ratelimit_clientremaining == 999
+
+
+def test_iter_comments_matches_get_comments(imgur):
+    item = imgur.get_gallery_image("abcdefg")
+    comments = list(item.iter_comments(limit=3))
+    assert all(isinstance(comment, Comment) for comment in comments)
+    assert [comment.id for comment in comments] == [
+        comment.id for comment in item.get_comments(limit=3)
+    ]
+
+
+def test_iter_comments_builds_replies(imgur):
+    item = imgur.get_gallery_image("abcdefg")
+    assert next(item.iter_comments(limit=1)).replies
+
+
+class KeepingTransport(RequestsTransport):  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        super().__init__()
+        self.responses = []
+
+    def request(self, method, url, **kwargs):
+        response = super().request(method, url, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+def test_iter_request_closes_response_when_closed(imgur):
+    imgur.transport = KeepingTransport()
+    items = imgur.iter_gallery()
+    next(items)
+    items.close()
+    assert imgur.transport.responses[0].raw.closed
+
+
+@responses.activate
+def test_stream_request_closes_response_before_retry(monkeypatch):
+    monkeypatch.setattr("pyimgur.request.time.sleep", lambda _: None)
+    url = "https://api.imgur.com/3/gallery/hot/0"
+    responses.add(responses.GET, url, status=500, json={})
+    responses.add(responses.GET, url, json={"data": []})
+    transport = KeepingTransport()
+    stream_request(url, transport=transport)
+    assert transport.responses[0].raw.closed
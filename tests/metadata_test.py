@@ -0,0 +1,224 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import json
+
+import pytest
+
+from pyimgur import Album, Comment, Gallery_image, Image, Imgur, Message, User
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.fake_server import FakeImgurServer
+from pyimgur.metadata import MetadataStore
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path):
+    store = MetadataStore(tmp_path / "metadata.sqlite")
+    yield store
+    store.close()
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur(store):
+    return Imgur("fake_client_id", metadata_store=store)
+
+
+def gallery_image(imgur, image_id, **extra):
+    json_dict = {
+        "id": image_id,
+        "title": f"Title {image_id}",
+        "account_url": "bob",
+        "datetime": 100,
+        "section": "pics",
+        "tags": [{"name": "cats"}],
+        **extra,
+    }
+    return Gallery_image(json_dict, imgur)
+
+
+def ids(objects):
+    return [obj.id for obj in objects]
+
+
+@pytest.fixture(name="parsed")
+def fixture_parsed(imgur):
+    gallery_image(imgur, "gimg")
+    Image({"id": "img", "datetime": 5}, imgur)
+    Album({"id": "alb", "images": []}, imgur)
+    Comment({"id": 7, "comment": "Hi", "author": "carol"}, imgur)
+    User({"url": "bob", "created": 1}, imgur)
+    Message({"id": 8, "from": "bob"}, imgur)
+
+
+@pytest.mark.usefixtures("parsed")
+def test_parsed_images_are_stored(store, imgur):
+    assert store.get(imgur, "Gallery_image", "gimg").title == "Title gimg"
+    assert store.get(imgur, "Image", "img").datetime == 5
+
+
+@pytest.mark.usefixtures("parsed")
+def test_parsed_albums_comments_and_users_are_stored(store, imgur):
+    assert store.get(imgur, "Album", "alb").images == []
+    assert store.get(imgur, "Comment", 7).text == "Hi"
+
+
+@pytest.mark.usefixtures("parsed")
+def test_parsed_users_are_stored_by_name(store, imgur):
+    assert store.get(imgur, "User", "bob").name == "bob"
+
+
+@pytest.mark.usefixtures("parsed")
+def test_unfetched_objects_are_not_stored(store, imgur):
+    # Such as the author of the comment, which only has a name
+    assert store.get(imgur, "User", "carol") is None
+    assert len(store.query(imgur)) == 5
+
+
+def test_fetched_fields_are_merged(store, imgur):
+    Image({"id": "img", "title": "Full", "datetime": 5}, imgur)
+    Image({"id": "img", "views": 10}, imgur)
+    stored = store.get(imgur, "Image", "img")
+    assert stored.title == "Full"
+    assert stored.views == 10
+
+
+def test_stubs_do_not_change_stored_objects(store, imgur):
+    Image({"id": "img", "title": "Full", "datetime": 5}, imgur)
+    Image({"id": "img"}, imgur, has_fetched=False)
+    assert store.get(imgur, "Image", "img").title == "Full"
+
+
+def test_refreshed_stubs_are_stored(store, imgur, monkeypatch):
+    monkeypatch.setattr(
+        imgur, "send_request", lambda url: {"id": "img", "title": "Fetched"}
+    )
+    Image({"id": "img"}, imgur, has_fetched=False).refresh()
+    assert store.get(imgur, "Image", "img").title == "Fetched"
+
+
+def test_non_json_values_are_dropped(store, imgur):
+    album = Album({"id": "alb"}, imgur)
+    Image({"id": "img", "title": "Upload", "album": album}, imgur)
+    stored = store.get(imgur, "Image", "img")
+    assert stored.title == "Upload"
+    assert "album" not in vars(stored)
+
+
+@pytest.fixture(name="thread")
+def fixture_thread(imgur):
+    reply = {"id": 8, "comment": "Re", "author": "bob", "parent_id": 7}
+    Comment({"id": 7, "comment": "Hi", "author": "carol", "children": [reply]}, imgur)
+
+
+@pytest.mark.usefixtures("thread")
+def test_comment_replies_are_stored_on_their_own(store, imgur):
+    assert store.get(imgur, "Comment", 8).text == "Re"
+
+
+@pytest.mark.usefixtures("thread")
+def test_comment_replies_are_not_stored_in_parent(store):
+    store.flush()
+    row = store._connection.execute(
+        "SELECT json FROM objects WHERE kind = 'Comment' AND id = '7'"
+    ).fetchone()
+    assert "children" not in json.loads(row[0])
+
+
+def test_objects_are_written_on_flush(store, imgur):
+    changes = store._connection.total_changes
+    gallery_image(imgur, "gimg")
+    assert store._connection.total_changes == changes
+    store.flush()
+    assert store._connection.total_changes > changes
+
+
+def test_objects_are_written_before_next_request(store):
+    with FakeImgurServer(page_size=10, total_items=20) as server:
+        im = Imgur("fake_client_id", metadata_store=store)
+        im.base_url = server.base_url
+        im.get_image("abc")
+        changes = store._connection.total_changes
+        im.get_image("def")
+        assert store._connection.total_changes > changes
+
+
+@pytest.fixture(name="indexed")
+def fixture_indexed(imgur):
+    gallery_image(imgur, "old", datetime=10)
+    gallery_image(imgur, "new", datetime=20, tags=[{"name": "dogs"}])
+    gallery_image(imgur, "other", account_url="alice", section="aww")
+
+
+@pytest.mark.usefixtures("indexed")
+def test_query_by_author_and_section(store, imgur):
+    assert ids(store.query(imgur, "Gallery_image", author="bob")) == ["new", "old"]
+    assert ids(store.query(imgur, section="aww")) == ["other"]
+
+
+@pytest.mark.usefixtures("indexed")
+def test_query_by_tag(store, imgur):
+    assert ids(store.query(imgur, tag="dogs")) == ["new"]
+
+
+@pytest.mark.usefixtures("indexed")
+def test_query_by_datetime_and_limit(store, imgur):
+    assert ids(store.query(imgur, since=15, until=50)) == ["new"]
+    assert ids(store.query(imgur, limit=1)) == ["other"]
+
+
+def test_tags_are_replaced(store, imgur):
+    gallery_image(imgur, "gimg")
+    gallery_image(imgur, "gimg", tags=[{"name": "dogs"}])
+    assert not store.query(imgur, tag="cats")
+    assert ids(store.query(imgur, tag="dogs")) == ["gimg"]
+
+
+def test_rebuilt_objects_are_not_stored_again(store, imgur):
+    gallery_image(imgur, "gimg")
+    store.flush()
+    changes = store._connection.total_changes
+    store.query(imgur)
+    store.flush()
+    assert store._connection.total_changes == changes
+
+
+def test_query_rejects_unknown_kind(store, imgur):
+    with pytest.raises(InvalidParameterError):
+        store.query(imgur, "Notification")
+
+
+@pytest.fixture(name="offline")
+def fixture_offline(store):
+    with FakeImgurServer(page_size=10, total_items=20) as server:
+        im = Imgur("fake_client_id", metadata_store=store)
+        im.base_url = server.base_url
+        listing = im.get_gallery(limit=20)
+
+    offline = Imgur("fake_client_id")
+    offline.base_url = "http://127.0.0.1:9"
+    return offline, ids(listing)
+
+
+def test_query_works_offline(store, offline):
+    imgur, listing = offline
+    images = store.query(imgur, "Gallery_image")
+    assert len(images) == 16
+    assert {image.id for image in images} <= set(listing)
+
+
+def test_query_offline_rebuilds_fields(store, offline):
+    imgur, _ = offline
+    images = store.query(imgur, "Gallery_image")
+    assert all(image.title.startswith("Synthetic") for image in images)
+    assert len(store.query(imgur, tag="tag1")) == 1
@@ -0,0 +1,78 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import responses
+
+from pyimgur import Imgur
+from pyimgur.hooks import ON_CACHE_HIT
+from pyimgur.metrics import PrometheusMetrics
+
+
+def get_image_with_metrics(status=200):
+    responses.get(
+        "https://api.imgur.com/3/image/abc",
+        json={"data": {"id": "abc", "error": "Bad"}},
+        status=status,
+    )
+    im = Imgur("fake_client_id")
+    metrics = PrometheusMetrics(buckets=(1, 60))
+    metrics.attach(im)
+    try:
+        im.get_image("abc")
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+    return im, metrics
+
+
+@responses.activate
+def test_latency_histogram():
+    _, metrics = get_image_with_metrics()
+    text = metrics.render()
+    expected = (
+        'pyimgur_request_duration_seconds_bucket{method="GET",'
+        'endpoint="/3/image/{id}",le="+Inf"} 1'
+    )
+    assert expected in text
+
+
+@responses.activate
+def test_response_bytes_counted():
+    _, metrics = get_image_with_metrics()
+    assert 'pyimgur_response_bytes_total{method="GET"' in metrics.render()
+
+
+@responses.activate
+def test_errors_counted_by_status():
+    _, metrics = get_image_with_metrics(status=403)
+    expected = (
+        'pyimgur_request_errors_total{method="GET",'
+        'endpoint="/3/image/{id}",error="403"} 1'
+    )
+    assert expected in metrics.render()
+
+
+@responses.activate
+def test_cache_hits_counted():
+    im, metrics = get_image_with_metrics()
+    im.hooks.emit(ON_CACHE_HIT, {"cache": "upload_index", "key": "abc"})
+    assert 'pyimgur_cache_hits_total{cache="upload_index"} 1' in metrics.render()
+
+
+@responses.activate
+def test_openmetrics_declares_counters_without_total():
+    _, metrics = get_image_with_metrics()
+    text = metrics.render(openmetrics=True)
+    assert "# TYPE pyimgur_response_bytes counter" in text
+    assert text.endswith("# EOF\n")
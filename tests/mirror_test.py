@@ -0,0 +1,167 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sqlite3
+
+import pytest
+
+from pyimgur import Imgur, User
+from pyimgur.image import Image
+from pyimgur.fake_server import FakeImgurServer, synthetic_id
+from pyimgur.mirror import MANIFEST_NAME, AccountMirror
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    # 12 images on the account, and 12 albums holding images 0 to 4
+    with FakeImgurServer(page_size=5, total_items=12, image_bytes=100) as server:
+        yield server
+
+
+@pytest.fixture(name="mirror")
+def fixture_mirror(server, tmp_path):
+    im = Imgur("fake_client_id")
+    im.base_url = server.base_url
+    im.download_url = server.base_url + "/download/{}/undefined"
+    return AccountMirror(User({"url": "fake_user"}, im), tmp_path / "mirror")
+
+
+def image_files(mirror):
+    return sorted(name for name in os.listdir(mirror.path) if name != MANIFEST_NAME)
+
+
+def downloaded_ids(report):
+    return sorted(result.item["id"] for result in report.downloaded)
+
+
+def test_first_sync_downloads_everything(mirror):
+    report = mirror.sync()
+    assert len(report.downloaded) == 12
+    assert not report.failed
+
+
+def test_first_sync_saves_images_by_id(mirror):
+    mirror.sync()
+    assert image_files(mirror) == sorted(f"{synthetic_id(n)}.jpg" for n in range(12))
+
+
+def test_first_sync_fills_manifest(mirror):
+    mirror.sync()
+    assert len(mirror.manifest.images()) == 12
+    assert len(mirror.manifest.albums()) == 12
+
+
+def test_second_sync_downloads_nothing(mirror):
+    mirror.sync()
+    report = mirror.sync()
+    assert not report.downloaded
+    assert report.unchanged == 12
+
+
+def test_second_sync_only_fetches_listings(mirror, server):
+    mirror.sync()
+    requests_served = server.requests_served
+    mirror.sync()
+    # Only the pages of the image and album listings
+    assert server.requests_served - requests_served == 8
+
+
+@pytest.fixture(name="changed_and_missing")
+def fixture_changed_and_missing(mirror):
+    mirror.sync()
+    changed, missing = synthetic_id(7), synthetic_id(8)
+    with sqlite3.connect(mirror.manifest.path) as connection:
+        connection.execute("UPDATE images SET size = 1 WHERE id = ?", (changed,))
+    os.remove(mirror.manifest.images()[missing][2])
+    return changed, missing
+
+
+def test_sync_downloads_changed_and_missing_images(mirror, changed_and_missing):
+    report = mirror.sync()
+    assert downloaded_ids(report) == sorted(changed_and_missing)
+    assert report.unchanged == 10
+
+
+def test_sync_restores_missing_image(mirror, changed_and_missing):
+    mirror.sync()
+    assert f"{changed_and_missing[1]}.jpg" in image_files(mirror)
+
+
+def test_sync_deletes_images_removed_from_account(mirror, server):
+    mirror.sync()
+    server.total_items = 8
+    report = mirror.sync()
+    assert sorted(report.deleted) == sorted(synthetic_id(n) for n in range(8, 12))
+    assert image_files(mirror) == sorted(f"{synthetic_id(n)}.jpg" for n in range(8))
+
+
+def test_sync_deletes_albums_removed_from_account(mirror, server):
+    mirror.sync()
+    server.total_items = 8
+    mirror.sync()
+    assert len(mirror.manifest.albums()) == 8
+
+
+def test_images_in_albums_are_kept(mirror, server):
+    mirror.sync()
+    server.total_items = 2
+    report = mirror.sync()
+    # Images 2 to 4 are no longer on the account, but still in an album
+    assert sorted(report.deleted) == sorted(synthetic_id(n) for n in range(5, 12))
+    assert len(image_files(mirror)) == 5
+
+
+@pytest.fixture(name="failing")
+def fixture_failing(monkeypatch):
+    failing = set()
+    download = Image.download
+
+    def flaky_download(image, *args, **kwargs):
+        if image.id in failing:
+            raise OSError("Disk full")
+        return download(image, *args, **kwargs)
+
+    monkeypatch.setattr(Image, "download", flaky_download)
+    return failing
+
+
+def test_failed_downloads_are_reported(mirror, failing):
+    failing.update(synthetic_id(n) for n in range(12))
+    report = mirror.sync()
+    assert len(report.failed) == 12
+    assert not mirror.manifest.images()
+
+
+def test_failed_downloads_are_retried_next_sync(mirror, failing):
+    failing.update(synthetic_id(n) for n in range(12))
+    mirror.sync()
+    failing.clear()
+    assert len(mirror.sync().downloaded) == 12
+
+
+def test_failed_album_image_downloads_are_retried_next_sync(mirror, server, failing):
+    # Images 2 to 4 are only in albums
+    server.total_items = 2
+    failing.add(synthetic_id(3))
+    mirror.sync()
+    failing.clear()
+    assert downloaded_ids(mirror.sync()) == [synthetic_id(3)]
+
+
+def test_sync_restores_missing_album_image(mirror, server):
+    server.total_items = 2
+    mirror.sync()
+    os.remove(mirror.manifest.images()[synthetic_id(3)][2])
+    assert downloaded_ids(mirror.sync()) == [synthetic_id(3)]
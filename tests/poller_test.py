@@ -0,0 +1,193 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import threading
+
+import pytest
+
+from pyimgur import Comment, Imgur, Message, User
+from pyimgur.exceptions import MarkViewedError
+from pyimgur.poller import NotificationPoller
+from pyimgur.stores import JSONFileStore
+
+
+def message(notification_id):
+    # Imgur sends the conversation the message is in, which has no subject
+    return {
+        "id": notification_id,
+        "viewed": False,
+        "content": {
+            "id": notification_id * 10,
+            "from": "sender",
+            "last_message": "hi",
+            "datetime": 100,
+        },
+    }
+
+
+def reply(notification_id):
+    return {
+        "id": notification_id,
+        "viewed": False,
+        "content": {"id": notification_id * 10, "caption": "hi", "datetime": 100},
+    }
+
+
+class FakeImgur(Imgur):
+    def __init__(self):
+        super().__init__("fake_client_id")
+        self.listing = {"messages": [], "replies": []}
+        self.viewed = []
+        self.failing = set()
+        self.lock = threading.Lock()
+
+    def send_request(self, url, needs_auth=False, force_client_auth=False, **kwargs):
+        if kwargs.get("method") == "POST":
+            notification_id = int(url.rsplit("/", 1)[1])
+            if notification_id in self.failing:
+                raise ConnectionError("Connection reset")
+            with self.lock:
+                self.viewed.append(notification_id)
+            return True
+        return self.listing
+
+
+def make_poller(**kwargs):
+    imgur = FakeImgur()
+    user = User({"url": "me"}, imgur)
+    return imgur, NotificationPoller(user, **kwargs)
+
+
+def ids(notifications):
+    return [notification.id for notification in notifications]
+
+
+@pytest.fixture(name="polled")
+def fixture_polled():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(3)], "replies": [reply(1), reply(2)]}
+    return poller, list(poller.poll())
+
+
+def test_poll_yields_new_notifications_oldest_first(polled):
+    _, new = polled
+    assert ids(new) == [1, 2, 3]
+
+
+def test_poll_builds_message_and_comment_content(polled):
+    _, new = polled
+    assert isinstance(new[0].content, Comment)
+    assert isinstance(new[2].content, Message)
+
+
+def test_poll_moves_high_water_mark(polled):
+    poller, _ = polled
+    assert poller.high_water_mark == {"id": 3, "datetime": 100}
+
+
+def test_poll_skips_notifications_below_high_water_mark():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(1)], "replies": []}
+    list(poller.poll())
+    imgur.listing = {"messages": [message(1), message(2)], "replies": []}
+    assert ids(poller.poll()) == [2]
+    assert not list(poller.poll())
+
+
+def test_poll_moves_mark_only_past_handled_notifications():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(1), message(2)], "replies": []}
+    with pytest.raises(RuntimeError):
+        for _ in poller.poll():
+            raise RuntimeError("Crashed while handling the notification")
+    assert not poller.high_water_mark
+    assert ids(poller.poll()) == [1, 2]
+
+
+def test_poll_marks_new_notifications_as_viewed():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(1), message(2)], "replies": [reply(3)]}
+    list(poller.poll())
+    assert sorted(imgur.viewed) == [1, 2, 3]
+
+
+def test_poll_marks_notifications_as_viewed_once():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(1), message(2)], "replies": [reply(3)]}
+    list(poller.poll())
+    list(poller.poll())
+    assert len(imgur.viewed) == 3
+
+
+def test_poll_marks_as_viewed_after_yielding():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(1), message(2)], "replies": []}
+    next(poller.poll())
+    assert not imgur.viewed
+
+
+def test_poll_raises_when_marking_fails():
+    imgur, poller = make_poller()
+    imgur.listing = {"messages": [message(1), message(2)], "replies": []}
+    imgur.failing = {2}
+    with pytest.raises(MarkViewedError) as excinfo:
+        list(poller.poll())
+    assert [result.item.id for result in excinfo.value.results] == [2]
+    assert imgur.viewed == [1]
+
+
+def test_poll_can_leave_notifications_unviewed():
+    imgur, poller = make_poller(mark_viewed=False)
+    imgur.listing = {"messages": [message(1)], "replies": []}
+    list(poller.poll())
+    assert not imgur.viewed
+
+
+def test_interval_backs_off_while_idle():
+    _, poller = make_poller(min_interval=5, max_interval=30, backoff=2)
+    intervals = []
+    for _ in range(4):
+        list(poller.poll())
+        intervals.append(poller.interval)
+    assert intervals == [10, 20, 30, 30]
+
+
+def test_interval_resets_on_new_notifications():
+    imgur, poller = make_poller(min_interval=5, max_interval=30, backoff=2)
+    list(poller.poll())
+    imgur.listing = {"messages": [message(1)], "replies": []}
+    list(poller.poll())
+    assert poller.interval == 5
+
+
+def test_high_water_mark_persists_across_pollers(tmp_path):
+    store = JSONFileStore(tmp_path / "seen.json")
+    imgur, poller = make_poller(store=store)
+    imgur.listing = {"messages": [message(1)], "replies": []}
+    list(poller.poll())
+
+    imgur, poller = make_poller(store=JSONFileStore(tmp_path / "seen.json"))
+    imgur.listing = {"messages": [message(1), message(2)], "replies": []}
+    assert ids(poller.poll()) == [2]
+
+
+def test_iteration_yields_until_stopped():
+    imgur, poller = make_poller(min_interval=0)
+    imgur.listing = {"messages": [message(1), message(2)], "replies": []}
+    seen = []
+    for notification in poller:
+        seen.append(notification.id)
+        if len(seen) == 2:
+            poller.stop()
+    assert seen == [1, 2]
@@ -0,0 +1,91 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import io
+
+import pytest
+
+from pyimgur import Imgur
+from pyimgur.fake_server import FakeImgurServer
+from pyimgur.preprocess import Preprocessor
+
+PIL_Image = pytest.importorskip("PIL.Image")
+
+
+def make_png(size=(400, 200), exif=True):
+    image = PIL_Image.new("RGBA", size, (255, 0, 0, 128))
+    output = io.BytesIO()
+    options = {}
+    if exif:
+        metadata = PIL_Image.Exif()
+        metadata[0x010F] = "Camera maker"
+        options["exif"] = metadata.tobytes()
+    image.save(output, format="PNG", **options)
+    return output.getvalue()
+
+
+def open_processed(preprocessor, source):
+    return PIL_Image.open(preprocessor(source))
+
+
+def test_preprocessor_downscales_keeping_aspect_ratio():
+    image = open_processed(Preprocessor(max_dimension=100), make_png())
+    assert image.size == (100, 50)
+
+
+def test_preprocessor_never_upscales():
+    image = open_processed(Preprocessor(max_dimension=1000), make_png())
+    assert image.size == (400, 200)
+
+
+def test_preprocessor_strips_metadata():
+    image = open_processed(Preprocessor(), make_png())
+    assert "exif" not in image.info
+
+
+def test_preprocessor_can_keep_metadata():
+    image = open_processed(Preprocessor(strip_metadata=False), make_png())
+    assert "exif" in image.info
+
+
+def test_preprocessor_reencodes_to_jpeg(tmp_path):
+    path = tmp_path / "big.png"
+    path.write_bytes(make_png())
+    image = open_processed(Preprocessor(format="jpeg", quality=50), path)
+    assert image.format == "JPEG"
+    assert image.mode == "RGB"
+
+
+def test_upload_image_uploads_processed_image(monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        "pyimgur.Imgur.send_request",
+        lambda self, url, params, method: sent.append(params) or {"id": "abcdefg"},
+    )
+    processed = io.BytesIO(b"processed")
+    Imgur("fake_client_id").upload_image(
+        file=make_png(), preprocessor=lambda source: processed
+    )
+    assert sent[0]["image_file"] is processed
+
+
+def test_upload_images_preprocesses_in_worker_processes():
+    with FakeImgurServer() as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        results = im.upload_images(
+            [make_png(), io.BytesIO(make_png())],
+            preprocessor=Preprocessor(max_dimension=10),
+        )
+        assert all(result.ok for result in results)
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import os
 import time
 
@@ -923,3 +924,16 @@ def test_retry_logic_performs_backoff():
     # Verify we waited at least 1 second before retrying
     # the request
     assert time_taken > 1
+
+
+@responses.activate
+def test_retry_uploads_file_again(monkeypatch):
+    monkeypatch.setattr("pyimgur.request.time.sleep", lambda _: None)
+    url = "https://api.imgur.com/3/image"
+    responses.add(responses.POST, url, status=500, json={"data": {}})
+    responses.add(responses.POST, url, json={"data": {"id": "abc"}})
+
+    MOCKED_UNAUTHED_IMGUR.upload_image(file=io.BytesIO(b"image bytes"))
+    bodies = [call.request.body for call in responses.calls]
+    assert len(bodies) == 2
+    assert all(b"image bytes" in body for body in bodies)
@@ -0,0 +1,111 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import pytest
+import responses
+
+from pyimgur import Gallery_album, Image, Imgur
+from pyimgur.router import route
+from pyimgur.stores import JSONFileStore
+
+from .data import MOCKED_GALLERY_ALBUM_DATA, MOCKED_IMAGE_DATA
+
+API = "https://api.imgur.com/3"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("http://imgur.com/a/SPlYO", ("album", "SPlYO")),
+        ("https://imgur.com/a/SPlYO#0", ("album", "SPlYO")),
+        ("imgur.com/a/SPlYO?sort=hot", ("album", "SPlYO")),
+        ("http://imgur.com/gallery/CleiK2V/comment/87511312", ("comment", "87511312")),
+        ("http://imgur.com/gallery/mpVzS", ("gallery", "mpVzS")),
+        ("https://imgur.com/r/pics/mpVzS", ("gallery", "mpVzS")),
+        ("http://imgur.com/c79sp", ("image", "c79sp")),
+        ("https://i.imgur.com/c79sp.jpeg", ("image", "c79sp")),
+        ("www.imgur.com/user/sarah", ("user", "sarah")),
+        ("http://imgur.com/bad/mpVzS", None),
+        ("http://github.com/c79sp", None),
+    ],
+)
+def test_route(url, expected):
+    assert route(url) == expected
+
+
+@responses.activate
+def test_get_at_url_finds_image():
+    responses.get(f"{API}/image/JPz2i", json={"data": MOCKED_IMAGE_DATA})
+    responses.get(f"{API}/gallery/image/JPz2i", status=404, json={})
+    im = Imgur("fake_client_id")
+    assert isinstance(im.get_at_url("https://imgur.com/JPz2i"), Image)
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_at_url_remembers_image_type():
+    responses.get(f"{API}/image/JPz2i", json={"data": MOCKED_IMAGE_DATA})
+    responses.get(f"{API}/gallery/image/JPz2i", status=404, json={})
+    im = Imgur("fake_client_id")
+    im.get_at_url("https://imgur.com/JPz2i")
+    assert isinstance(im.get_at_url("https://i.imgur.com/JPz2i.png"), Image)
+    urls = [call.request.url for call in responses.calls[2:]]
+    assert urls == [f"{API}/image/JPz2i"]
+
+
+def reload_with_cached_type(tmp_path):
+    data = MOCKED_GALLERY_ALBUM_DATA
+    responses.get(f"{API}/gallery/image/{data['id']}", status=404, json={})
+    responses.get(f"{API}/gallery/album/{data['id']}", json={"data": data})
+    url = f"https://imgur.com/gallery/{data['id']}"
+
+    Imgur("id", object_type_cache=JSONFileStore(tmp_path / "types.json")).get_at_url(
+        url
+    )
+    return Imgur("id", object_type_cache=JSONFileStore(tmp_path / "types.json")), url
+
+
+@responses.activate
+def test_get_at_url_object_types_persist(tmp_path):
+    im, url = reload_with_cached_type(tmp_path)
+    assert isinstance(im.get_at_url(url), Gallery_album)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_get_at_url_reports_object_type_cache_hit(tmp_path):
+    im, url = reload_with_cached_type(tmp_path)
+    hits = []
+    im.hooks.register("on_cache_hit", hits.append)
+    im.get_at_url(url)
+    assert [hit["cache"] for hit in hits] == ["object_type"]
+
+
+URLS = ["https://imgur.com/a/SPlYO", "https://github.com", "imgur.com/a/SPlYO"]
+
+
+@responses.activate
+def test_resolve_urls_resolves_each_url_once():
+    responses.get(f"{API}/album/SPlYO", json={"data": {"id": "SPlYO"}})
+    results = Imgur("fake_client_id").resolve_urls(URLS * 2)
+    assert [result.item for result in results] == URLS * 2
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_resolve_urls_values():
+    responses.get(f"{API}/album/SPlYO", json={"data": {"id": "SPlYO"}})
+    results = Imgur("fake_client_id").resolve_urls(URLS)
+    assert results[0].value.id == "SPlYO"
+    assert results[1].ok and results[1].value is None
@@ -0,0 +1,164 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import copy
+import pickle
+
+import pytest
+
+from pyimgur import Album, Comment, Gallery_image, Image, Imgur, User
+from pyimgur.exceptions import InvalidParameterError
+from pyimgur.serialization import attach, dumps, loads
+
+IMGUR = Imgur("fake_client_id")
+
+
+@pytest.fixture(name="use_msgpack", params=[False, True], ids=["pyimgur", "msgpack"])
+def fixture_use_msgpack(request):
+    if request.param:
+        pytest.importorskip("msgpack")
+    return request.param
+
+
+def gallery_image():
+    return Gallery_image(
+        {
+            "id": "gimg",
+            "title": "Tëst",
+            "account_url": "bob",
+            "datetime": 1700000000,
+            "ups": -3,
+            "score": 1.5,
+            "tags": [{"name": "cats"}],
+            "nsfw": None,
+            "animated": True,
+        },
+        IMGUR,
+    )
+
+
+def test_round_trip_keeps_class(use_msgpack):
+    loaded = loads(dumps(gallery_image(), use_msgpack=use_msgpack), IMGUR)
+    assert isinstance(loaded, Gallery_image)
+
+
+def test_round_trip_keeps_attributes(use_msgpack):
+    original = gallery_image()
+    loaded = loads(dumps(original, use_msgpack=use_msgpack), IMGUR)
+    original_attributes = vars(original)
+    loaded_attributes = vars(loaded)
+    assert (
+        loaded_attributes.pop("author").name == original_attributes.pop("author").name
+    )
+    assert loaded_attributes == original_attributes
+
+
+@pytest.fixture(name="nested")
+def fixture_nested(use_msgpack):
+    album = Album({"id": "alb", "images": [{"id": "a"}, {"id": "b"}]}, IMGUR)
+    comment = Comment(
+        {"id": 1, "author": "bob", "parent_id": 0, "children": [{"id": 2}]}, IMGUR
+    )
+    return loads(dumps([album, comment], use_msgpack=use_msgpack), IMGUR)
+
+
+def test_round_trip_nested_images(nested):
+    loaded_album, _ = nested
+    assert [image.id for image in loaded_album.images] == ["a", "b"]
+    assert isinstance(loaded_album.images[0], Image)
+
+
+def test_round_trip_nested_comments(nested):
+    _, loaded_comment = nested
+    assert isinstance(loaded_comment.author, User)
+    assert loaded_comment.replies[0].id == 2
+
+
+def test_client_is_dropped(use_msgpack):
+    data = dumps(gallery_image(), use_msgpack=use_msgpack)
+    assert b"fake_client_id" not in data
+    assert loads(data)._imgur is None
+
+
+def test_client_is_given_to_loads(use_msgpack):
+    other = Imgur("other_client_id")
+    loaded = loads(dumps(gallery_image(), use_msgpack=use_msgpack), other)
+    assert loaded._imgur is other
+    assert loaded.author._imgur is other
+
+
+def test_client_is_attached(use_msgpack):
+    other = Imgur("other_client_id")
+    detached = loads(dumps(gallery_image(), use_msgpack=use_msgpack))
+    attach(detached, other)
+    assert detached.author._imgur is other
+
+
+def test_loading_does_not_fetch(use_msgpack, monkeypatch):
+    stub = Image({"id": "img"}, IMGUR, has_fetched=False)
+    monkeypatch.setattr(
+        Imgur, "send_request", lambda *args, **kwargs: pytest.fail("fetched")
+    )
+    loaded = loads(dumps(stub, use_msgpack=use_msgpack), IMGUR)
+    assert loaded.id == "img"
+    assert not loaded._has_fetched
+
+
+@pytest.mark.parametrize("copy_function", [copy.copy, copy.deepcopy])
+def test_copies_keep_client(copy_function):
+    copied = copy_function(gallery_image())
+    assert copied._imgur is IMGUR
+    assert copied.author._imgur is IMGUR
+
+
+def test_deep_copies_fetch_lazily(monkeypatch):
+    stub = copy.deepcopy(Image({"id": "img"}, IMGUR, has_fetched=False))
+    monkeypatch.setattr(
+        Imgur, "send_request", lambda *args, **kwargs: {"id": "img", "title": "Hi"}
+    )
+    assert stub.title == "Hi"
+
+
+def test_pyimgur_format_is_compact():
+    data = dumps(gallery_image(), use_msgpack=False)
+    assert len(data) < len(pickle.dumps(gallery_image()))
+
+
+def test_loads_rejects_foreign_data():
+    with pytest.raises(InvalidParameterError):
+        loads(b"not pyimgur data")
+
+
+def test_loads_rejects_newer_version():
+    data = bytearray(dumps(1, use_msgpack=False))
+    data[3] += 1
+    with pytest.raises(InvalidParameterError):
+        loads(bytes(data))
+
+
+def test_loads_rejects_truncated_data():
+    data = dumps(gallery_image(), use_msgpack=False)
+    with pytest.raises(InvalidParameterError):
+        loads(data[:-5])
+
+
+def test_dumps_rejects_other_types():
+    with pytest.raises(TypeError):
+        dumps(object(), use_msgpack=False)
+
+
+def test_objects_can_be_pickled():
+    loaded = pickle.loads(pickle.dumps(gallery_image()))
+    assert loaded.title == "Tëst"
+    assert loaded._imgur is None
@@ -0,0 +1,140 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+import responses
+from responses import matchers
+
+from pyimgur import Imgur, RateLimitError
+from pyimgur.sharding import Credential, CredentialPool
+
+
+def make_pool(*client_ids):
+    return CredentialPool(
+        Credential(client_id, "https://api.imgur.com") for client_id in client_ids
+    )
+
+
+def test_pool_acquires_credential_with_most_remaining():
+    pool = make_pool("a", "b")
+    pool.update(pool.credentials[0], {"x-ratelimit-clientremaining": 10})
+    pool.update(pool.credentials[1], {"x-ratelimit-clientremaining": 500})
+    assert pool.acquire().client_id == "b"
+
+
+def test_pool_skips_exhausted_credentials():
+    pool = make_pool("a", "b")
+    pool.mark_exhausted(pool.credentials[1])
+    pool.update(pool.credentials[0], {"x-ratelimit-clientremaining": 1})
+    assert pool.acquire().client_id == "a"
+
+
+def test_pool_raises_when_all_exhausted():
+    pool = make_pool("a")
+    pool.update(pool.credentials[0], {"x-ratelimit-clientremaining": 0})
+    with pytest.raises(RateLimitError):
+        pool.acquire()
+
+
+def test_pool_remaining_sums_usable_credentials():
+    pool = make_pool("a", "b", "c")
+    pool.update(pool.credentials[0], {"x-ratelimit-clientremaining": 10})
+    pool.update(pool.credentials[1], {"x-ratelimit-clientremaining": 500})
+    pool.mark_exhausted(pool.credentials[2])
+    assert pool.remaining() == 510
+
+
+def test_pool_remaining_unknown_until_every_credential_answered():
+    pool = make_pool("a", "b")
+    pool.update(pool.credentials[0], {"x-ratelimit-clientremaining": 10})
+    assert pool.remaining() is None
+
+
+def test_credential_rebase_to_rapidapi():
+    credential = Credential("a", "https://imgur-apiv3.p.rapidapi.com", "key")
+    url = credential.rebase(
+        "https://api.imgur.com/3/image/abc", "https://api.imgur.com"
+    )
+    assert url == "https://imgur-apiv3.p.rapidapi.com/3/image/abc"
+
+
+@responses.activate
+def test_imgur_fails_over_to_next_credential():
+    responses.get(
+        "https://api.imgur.com/3/image/abc",
+        json={"data": {"error": "Too Many Requests"}},
+        status=429,
+        match=[matchers.header_matcher({"Authorization": "Client-ID first"})],
+    )
+    responses.get(
+        "https://api.imgur.com/3/image/abc",
+        json={"data": {"id": "abc"}},
+        match=[matchers.header_matcher({"Authorization": "Client-ID second"})],
+    )
+
+    im = Imgur("first", credentials=["second"])
+    image = im.get_image("abc")
+    assert image.id == "abc"
+    assert im.credential_pool.credentials[0].remaining == 0
+
+
+@responses.activate
+def test_imgur_remaining_requests_counts_whole_pool():
+    for client_id, remaining in (("first", 500), ("second", 3)):
+        responses.get(
+            "https://api.imgur.com/3/image/abc",
+            json={"data": {"id": "abc"}},
+            headers={"x-ratelimit-clientremaining": str(remaining)},
+            match=[
+                matchers.header_matcher({"Authorization": f"Client-ID {client_id}"})
+            ],
+        )
+
+    im = Imgur("first", credentials=["second"])
+    im.get_image("abc")
+    im.get_image("abc")
+    assert im.remaining_requests() == 503
+
+
+@responses.activate
+def test_imgur_pool_not_used_for_user_requests():
+    responses.get(
+        "https://api.imgur.com/3/image/abc",
+        json={"data": {"id": "abc"}},
+        match=[matchers.header_matcher({"Authorization": "Bearer token"})],
+    )
+
+    im = Imgur("first", access_token="token", credentials=["second"])
+    im.get_image("abc")
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_iter_request_fails_over_to_next_credential():
+    responses.get(
+        "https://api.imgur.com/3/gallery/hot/0",
+        json={"data": {"error": "Too Many Requests"}},
+        status=429,
+        match=[matchers.header_matcher({"Authorization": "Client-ID first"})],
+    )
+    responses.get(
+        "https://api.imgur.com/3/gallery/hot/0",
+        json={"data": [{"id": "abc"}]},
+        match=[matchers.header_matcher({"Authorization": "Client-ID second"})],
+    )
+
+    im = Imgur("first", credentials=["second"])
+    items = list(im.iter_request("https://api.imgur.com/3/gallery/hot/{}", limit=1))
+    assert items == [{"id": "abc"}]
@@ -0,0 +1,189 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import email
+import io
+from pathlib import Path
+
+import pytest
+import requests
+
+from pyimgur import Imgur
+from pyimgur.fake_server import FakeImgurServer
+from pyimgur.request import get_default_transport
+from pyimgur.streaming import MultipartStream, ProgressReporter
+
+COFFEE_PATH = Path(__file__).parent / "coffee_big.mp4"
+
+
+def parse(stream):
+    message = email.message_from_bytes(
+        f"Content-Type: {stream.content_type}\r\n\r\n".encode() + stream.read()
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.get_payload()
+    }
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur():
+    with FakeImgurServer() as server:
+        im = Imgur("fake_client_id")
+        im.base_url = server.base_url
+        im.download_url = server.base_url + "/download/{}/undefined"
+        im.server = server
+        yield im
+
+
+@pytest.fixture(name="coffee_parts")
+def fixture_coffee_parts():
+    stream = MultipartStream(
+        {"title": "Coffee", "description": None}, "video", path=COFFEE_PATH
+    )
+    yield parse(stream)
+    stream.close()
+
+
+def test_multipart_stream_encodes_fields(coffee_parts):
+    assert set(coffee_parts) == {"title", "video"}
+    assert coffee_parts["title"].get_payload() == "Coffee"
+
+
+def test_multipart_stream_sets_file_headers(coffee_parts):
+    assert coffee_parts["video"].get_filename() == "coffee_big.mp4"
+    assert coffee_parts["video"].get_content_type() == "video/mp4"
+
+
+def test_multipart_stream_encodes_file(coffee_parts):
+    payload = coffee_parts["video"].get_payload(decode=True)
+    assert payload == COFFEE_PATH.read_bytes()
+
+
+def test_multipart_stream_length_matches_content():
+    stream = MultipartStream({"title": "x"}, "image", file=b"cat")
+    assert len(stream) == len(stream.read())
+
+
+def test_multipart_stream_rewinds():
+    file = io.BytesIO(b"skip this" + b"cat")
+    file.seek(len(b"skip this"))
+    stream = MultipartStream({}, "image", file=file)
+    first = stream.read(5) + stream.read()
+    stream.seek(0)
+    assert stream.read() == first
+    assert b"skip this" not in first
+
+
+def test_multipart_stream_reports_progress():
+    reports = []
+    stream = MultipartStream(
+        {},
+        "image",
+        file=b"x" * 100000,
+        progress=lambda done, total, rate: reports.append((done, total)),
+        progress_interval=0,
+    )
+    while stream.read(8192):
+        pass
+    assert reports[-1] == (len(stream), len(stream))
+    assert [done for done, _ in reports] == sorted(done for done, _ in reports)
+
+
+def test_multipart_stream_draws_from_limiters():
+    class CountingLimiter:  # pylint: disable=too-few-public-methods
+        acquired = 0
+
+        def acquire(self, nbytes):
+            self.acquired += nbytes
+
+    limiters = (CountingLimiter(), CountingLimiter())
+    stream = MultipartStream({}, "image", file=b"x" * 100000, limiters=limiters)
+    while stream.read(8192):
+        pass
+    assert [limiter.acquired for limiter in limiters] == [len(stream)] * 2
+
+
+def test_upload_large_file_returns_image(imgur):
+    image = imgur.upload_large_file(COFFEE_PATH, title="Coffee")
+    assert image.title == "Coffee"
+    assert image.id
+
+
+def test_upload_large_file_sends_whole_video(imgur):
+    imgur.upload_large_file(COFFEE_PATH)
+    assert imgur.server.bytes_received > COFFEE_PATH.stat().st_size
+
+
+def test_upload_large_file_retries_whole_transfer(imgur, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    transport = get_default_transport()
+    bodies = []
+
+    class FlakyTransport:  # pylint: disable=too-few-public-methods
+        def request(self, method, url, **kwargs):
+            bodies.append(kwargs["data"].read(1000))
+            if len(bodies) == 1:
+                raise requests.ConnectionError("Connection reset")
+            kwargs["data"].seek(0)
+            return transport.request(method, url, **kwargs)
+
+    imgur.transport = FlakyTransport()
+    imgur.upload_large_file(COFFEE_PATH)
+    assert len(bodies) == 2
+    assert bodies[0] == bodies[1]
+
+
+def test_upload_large_file_does_not_retry_missing_file(imgur, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        imgur.upload_large_file(tmp_path / "missing.mp4")
+
+
+def test_progress_reporter_waits_for_interval():
+    reports = []
+    reporter = ProgressReporter(lambda *report: reports.append(report), 300, 60)
+    reporter.update(100)
+    reporter.update(100)
+    assert not reports
+    reporter.update(100)
+    assert [report[:2] for report in reports] == [(300, 300)]
+
+
+def test_progress_reporter_finish_reports_unknown_total():
+    reports = []
+    reporter = ProgressReporter(lambda *report: reports.append(report), None, 60)
+    reporter.update(100)
+    reporter.finish()
+    reporter.finish()
+    assert [report[:2] for report in reports] == [(100, None)]
+
+
+def test_upload_image_reports_progress(imgur):
+    reports = []
+    imgur.upload_image(COFFEE_PATH, progress=lambda *report: reports.append(report))
+    done, total, rate = reports[-1]
+    assert done == total > COFFEE_PATH.stat().st_size
+    assert rate >= 0
+
+
+def test_image_download_reports_progress(imgur, tmp_path):
+    reports = []
+    image = imgur.get_image("abcdefg")
+    image.download(
+        path=tmp_path,
+        progress=lambda *report: reports.append(report),
+        progress_interval=0,
+    )
+    assert reports[-1][:2] == (imgur.server.image_bytes, imgur.server.image_bytes)
+    assert len(reports) > 1
@@ -0,0 +1,123 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+from contextlib import contextmanager
+
+import responses
+
+from pyimgur import Imgur, User
+from pyimgur.tracing import disable_tracing, enable_tracing
+
+from .data import MOCKED_USER_DATA
+
+
+class FakeSpan:
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes)
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.attributes["exception"] = exception
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+        self.current = None
+
+    def start_span(self, name, attributes=None):
+        span = FakeSpan(name, self.current, attributes or {})
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = self.start_span(name, attributes)
+        previous, self.current = self.current, span
+        try:
+            yield span
+        finally:
+            self.current = previous
+            span.end()
+
+
+def traced_imgur():
+    tracer = FakeTracer()
+    im = Imgur("fake_client_id")
+    enable_tracing(im, tracer)
+    return im, tracer
+
+
+@responses.activate
+def test_public_method_is_parent_span():
+    responses.get("https://api.imgur.com/3/image/abc", json={"data": {"id": "abc"}})
+    im, tracer = traced_imgur()
+    im.get_image("abc")
+    assert tracer.spans[0].name == "Imgur.get_image"
+    assert tracer.spans[1].parent is tracer.spans[0]
+
+
+@responses.activate
+def test_request_span_attributes():
+    responses.get("https://api.imgur.com/3/image/abc", json={"data": {"id": "abc"}})
+    im, tracer = traced_imgur()
+    im.get_image("abc")
+    attributes = tracer.spans[1].attributes
+    assert attributes["url.template"] == "/3/image/{id}"
+    assert attributes["http.response.status_code"] == 200
+
+
+@responses.activate
+def test_every_page_is_a_child_span():
+    for page in range(3):
+        responses.get(
+            f"https://api.imgur.com/3/account/darthmonkey/images/{page}",
+            json={"data": [{"id": f"img{page}"}] if page < 2 else []},
+        )
+    im, tracer = traced_imgur()
+    User(MOCKED_USER_DATA, im).get_images(limit=10)
+    assert [span.parent for span in tracer.spans[1:]] == [tracer.spans[0]] * 3
+
+
+@responses.activate
+def test_generator_method_span_covers_iteration():
+    for page in range(2):
+        responses.get(
+            f"https://api.imgur.com/3/gallery/hot/viral/day/{page}?showViral=True",
+            json={"data": [{"id": "abc", "is_album": False}] if page < 1 else []},
+        )
+    im, tracer = traced_imgur()
+    list(im.iter_gallery())
+    iter_gallery, iter_request = tracer.spans[0], tracer.spans[1]
+    assert iter_request.parent is iter_gallery
+    assert [span.parent for span in tracer.spans[2:]] == [iter_request] * 2
+
+
+@responses.activate
+def test_disable_tracing_stops_spans():
+    responses.get("https://api.imgur.com/3/image/abc", json={"data": {"id": "abc"}})
+    im, tracer = traced_imgur()
+    disable_tracing(im)
+    im.get_image("abc")
+    assert not tracer.spans
+    assert not im.hooks
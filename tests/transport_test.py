@@ -0,0 +1,76 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+import responses
+
+from pyimgur import Imgur
+from pyimgur.exceptions import PyImgurError
+from pyimgur.transport import RecordingTransport, ReplayTransport
+
+
+def record_image(path):
+    responses.get(
+        "https://api.imgur.com/3/image/abc",
+        json={"data": {"id": "abc", "title": "recorded"}},
+        headers={"x-ratelimit-clientremaining": "42"},
+    )
+    im = Imgur("fake_client_id", transport=RecordingTransport(path))
+    im.get_image("abc")
+
+
+@responses.activate
+def test_recording_transport_saves_to_disk(tmp_path):
+    record_image(tmp_path / "cassette.json")
+    assert (tmp_path / "cassette.json").exists()
+
+
+@responses.activate
+def test_recording_transport_appends_one_line_per_response(tmp_path):
+    record_image(tmp_path / "cassette.json")
+    im = Imgur("fake_client_id", transport=RecordingTransport(tmp_path / "other.json"))
+    im.get_image("abc")
+    im.get_image("abc")
+    lines = (tmp_path / "other.json").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+
+
+@responses.activate
+def test_replay_transport_serves_recorded_response(tmp_path):
+    record_image(tmp_path / "cassette.json")
+    responses.reset()
+
+    im = Imgur("fake_client_id", transport=ReplayTransport(tmp_path / "cassette.json"))
+    image = im.get_image("abc")
+    assert image.title == "recorded"
+    assert len(responses.calls) == 0
+
+
+@responses.activate
+def test_replay_transport_restores_ratelimit_headers(tmp_path):
+    record_image(tmp_path / "cassette.json")
+
+    im = Imgur("fake_client_id", transport=ReplayTransport(tmp_path / "cassette.json"))
+    im.get_image("abc")
+    assert im.ratelimit_clientremaining == 42
+
+
+@responses.activate
+def test_replay_transport_unknown_request(tmp_path):
+    record_image(tmp_path / "cassette.json")
+
+    im = Imgur("fake_client_id", transport=ReplayTransport(tmp_path / "cassette.json"))
+    with pytest.raises(PyImgurError):
+        im.get_image("not_recorded")
@@ -0,0 +1,112 @@
+# This file is part of PyImgur.
+
+# PyImgur is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# PyImgur is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with PyImgur.  If not, see <http://www.gnu.org/licenses/>.
+import io
+
+import pytest
+
+from pyimgur import Imgur
+from pyimgur.fake_server import FakeImgurServer
+from pyimgur.stores import JSONFileStore, MemoryStore, SQLiteStore
+from pyimgur.upload_index import UploadIndex
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    with FakeImgurServer() as server:
+        yield server
+
+
+@pytest.fixture(name="imgur")
+def fixture_imgur(server):
+    im = Imgur("fake_client_id", upload_index=UploadIndex())
+    im.base_url = server.base_url
+    return im
+
+
+@pytest.fixture(
+    name="store",
+    params=[
+        lambda path: MemoryStore(),
+        lambda path: JSONFileStore(path / "store.json"),
+        lambda path: SQLiteStore(path / "store.db"),
+    ],
+)
+def fixture_store(request, tmp_path):
+    return request.param(tmp_path)
+
+
+def test_store_get_and_set(store):
+    assert store.get("key", "default") == "default"
+    store.set("key", {"id": "abc"})
+    assert store.get("key") == {"id": "abc"}
+
+
+def test_store_delete(store):
+    store.set("key", {"id": "abc"})
+    store.delete("key")
+    store.delete("key")
+    assert store.get("key") is None
+
+
+@pytest.mark.parametrize("store_class", [JSONFileStore, SQLiteStore])
+def test_store_persists(store_class, tmp_path):
+    store_class(tmp_path / "store").set("key", [1, 2])
+    assert store_class(tmp_path / "store").get("key") == [1, 2]
+
+
+def test_hash_content_is_the_same_for_path_bytes_and_file(tmp_path):
+    path = tmp_path / "cat.png"
+    path.write_bytes(b"cat" * 100000)
+    index = UploadIndex()
+    file = io.BytesIO(b"cat" * 100000)
+    digests = {
+        index.hash_content(path=path),
+        index.hash_content(file=b"cat" * 100000),
+        index.hash_content(file=file),
+    }
+    assert len(digests) == 1
+    assert file.tell() == 0
+
+
+def test_upload_image_returns_existing_image(imgur):
+    first = imgur.upload_image(file=b"cat")
+    second = imgur.upload_image(file=io.BytesIO(b"cat"))
+    assert second.id == first.id
+    assert second.deletehash == first.deletehash
+
+
+def test_upload_image_does_not_upload_again(imgur, server):
+    imgur.upload_image(file=b"cat")
+    requests_served = server.requests_served
+    imgur.upload_image(file=io.BytesIO(b"cat"))
+    assert server.requests_served == requests_served
+
+
+def test_upload_image_uploads_different_content(imgur):
+    assert imgur.upload_image(file=b"cat").id != imgur.upload_image(file=b"dog").id
+
+
+def test_upload_index_emits_cache_hit(imgur):
+    hits = []
+    imgur.hooks.register("on_cache_hit", hits.append)
+    imgur.upload_image(file=b"cat")
+    imgur.upload_image(file=b"cat")
+    assert [hit["cache"] for hit in hits] == ["upload_index"]
+
+
+def test_image_delete_invalidates_index(imgur):
+    first = imgur.upload_image(file=b"cat")
+    first.delete()
+    assert imgur.upload_image(file=b"cat").id != first.id